@@ -0,0 +1,70 @@
+# bench_bootstrap.py
+# Times bootstrap confidence intervals of the test metrics, batched index
+# matrices vs a Python loop of sklearn metric calls per resample.
+
+import os
+import sys
+import time
+import pickle
+import click
+import numpy as np
+import pandas as pd
+from sklearn import set_config
+from sklearn.metrics import fbeta_score, precision_score, recall_score
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.bootstrap import bootstrap_ci
+from heart_disease_predictor.utils.evaluation import confusion_codes
+
+
+def loop_ci(y_true, y_pred, pos_label, n_resamples, seed):
+    """F2, precision and recall intervals with one resample and three sklearn calls per iteration."""
+    rng = np.random.default_rng(seed)
+    y_true, y_pred = np.asarray(y_true), np.asarray(y_pred)
+    values = {"f2": [], "precision": [], "recall": []}
+    for _ in range(n_resamples):
+        index = rng.integers(0, len(y_true), size=len(y_true))
+        values["f2"].append(fbeta_score(y_true[index], y_pred[index], beta=2, pos_label=pos_label))
+        values["precision"].append(precision_score(y_true[index], y_pred[index], pos_label=pos_label))
+        values["recall"].append(recall_score(y_true[index], y_pred[index], pos_label=pos_label))
+    return {name: np.quantile(v, [0.025, 0.975]).tolist() for name, v in values.items()}
+
+
+@click.command()
+@click.option('--final-model-path', default="results/final_model_results/final_model.pickle", help='Path to the final model')
+@click.option('--test-data', default="data/processed/test_heart.csv", help='Test data the predictions are made on')
+@click.option('--target-col', default="target", help='Name of the target column')
+@click.option('--pos-label', default='Heart Disease', help='Positive class label')
+@click.option('--resamples', default="1000,10000,100000", help='Comma-separated numbers of resamples')
+@click.option('--max-loop-resamples', type=int, default=1000, help='Largest number of resamples timed with the loop')
+@click.option('--n-jobs', type=int, default=2, help='Worker processes of the pooled run')
+def main(final_model_path, test_data, target_col, pos_label, resamples, max_loop_resamples, n_jobs):
+    set_config(transform_output="pandas")
+    with open(final_model_path, "rb") as f:
+        final_model = pickle.load(f)
+    test_df = pd.read_csv(test_data)
+    y_test = test_df[target_col]
+    y_pred = final_model.predict(test_df.drop(columns=[target_col]))
+    codes = confusion_codes(y_test, y_pred, pos_label)
+
+    rows = []
+    for n in [int(n) for n in resamples.split(",")]:
+        row = {"resamples": n}
+        start = time.perf_counter()
+        intervals = bootstrap_ci(codes, n_resamples=n)
+        row["batched_s"] = time.perf_counter() - start
+        start = time.perf_counter()
+        bootstrap_ci(codes, n_resamples=n, n_jobs=n_jobs)
+        row[f"pool_{n_jobs}_s"] = time.perf_counter() - start
+        if n <= max_loop_resamples:
+            start = time.perf_counter()
+            loop_ci(y_test, y_pred, pos_label, n, seed=123)
+            row["loop_s"] = time.perf_counter() - start
+        row["f2_low"], row["f2_high"] = intervals["f2"]
+        rows.append(row)
+    print(f"{len(codes)} test rows")
+    print(pd.DataFrame(rows).set_index("resamples").to_string(float_format=lambda x: f"{x:.3g}", na_rep="skipped"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# bench_compiled_svc.py
+# Times batch scoring of the final SVC pipeline against its compiled NumPy kernel.
+
+import os
+import sys
+import time
+import pickle
+import click
+import numpy as np
+import pandas as pd
+from sklearn import set_config
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from benchmarks.synthetic import make_synthetic_heart
+from heart_disease_predictor.utils.compiled_svc import compile_svc_pipeline
+
+
+def best_time(fn, X, repeats):
+    """Smallest wall-clock time of repeats calls of fn(X)."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(X)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@click.command()
+@click.option('--final-model-path', default="results/final_model_results/final_model.pickle", help='Path to the final model')
+@click.option('--train-data', default="data/processed/train_heart.csv", help='Data resampled into the scored batches')
+@click.option('--batch-sizes', default="1,100,10000,200000", help='Comma-separated batch sizes')
+def main(final_model_path, train_data, batch_sizes):
+    set_config(transform_output="pandas")
+    with open(final_model_path, "rb") as f:
+        final_model = pickle.load(f)
+    compiled = compile_svc_pipeline(final_model)
+
+    batch_sizes = [int(size) for size in batch_sizes.split(",")]
+    X = make_synthetic_heart(pd.read_csv(train_data), max(batch_sizes)).drop(columns=["target"])
+
+    rows = []
+    for size in batch_sizes:
+        batch = X.iloc[:size]
+        repeats = max(3, min(50, 20_000 // size))
+        pipeline_time = best_time(final_model.decision_function, batch, repeats)
+        compiled_time = best_time(compiled.decision_function, batch, repeats)
+        max_diff = np.abs(final_model.decision_function(batch) - compiled.decision_function(batch)).max()
+        rows.append({"batch_size": size, "pipeline_ms": 1000 * pipeline_time, "compiled_ms": 1000 * compiled_time,
+                     "speedup": pipeline_time / compiled_time, "max_abs_diff": max_diff})
+    print(pd.DataFrame(rows).set_index("batch_size").to_string(float_format=lambda x: f"{x:.3g}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# bench_eda_aggregation.py
+# Measures the spec size and the build and render time of the pre-aggregated
+# EDA charts on growing synthetic training sets, up to millions of rows.
+
+import json
+import os
+import sys
+import time
+import click
+import pandas as pd
+import vl_convert as vlc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from benchmarks.synthetic import make_synthetic_heart
+from heart_disease_predictor.scripts.run_pipeline import EDA_AXIS_TITLES, EDA_CAT_COLS, EDA_NUM_COLS
+from heart_disease_predictor.utils.eda_helper import plot_boxplots, plot_categorical_vs_target, plot_numerical_distributions
+
+CHARTS = {
+    "histograms": lambda df: plot_numerical_distributions(df, EDA_NUM_COLS),
+    "boxplots": lambda df: plot_boxplots(df, EDA_NUM_COLS, "target"),
+    "categorical": lambda df: plot_categorical_vs_target(df, EDA_CAT_COLS, "target", axis_titles=EDA_AXIS_TITLES),
+}
+
+
+@click.command()
+@click.option('--train-data', default="data/processed/train_heart.csv", help='Training data the synthetic rows are drawn from')
+@click.option('--sizes', default="700,50000,500000,5000000", help='Comma-separated numbers of rows')
+def main(train_data, sizes):
+    base = pd.read_csv(train_data)
+    # First conversion loads the vl-convert engine
+    vlc.vegalite_to_svg(CHARTS["histograms"](base).to_dict())
+
+    rows = []
+    for n in [int(n) for n in sizes.split(",")]:
+        df = make_synthetic_heart(base, n)
+        for name, build in CHARTS.items():
+            start = time.perf_counter()
+            spec = build(df).to_dict()
+            build_s = time.perf_counter() - start
+            start = time.perf_counter()
+            vlc.vegalite_to_svg(spec)
+            render_s = time.perf_counter() - start
+            rows.append({"rows": n, "chart": name, "spec_kb": len(json.dumps(spec)) / 1024,
+                         "embedded_rows": sum(len(data) for data in spec["datasets"].values()),
+                         "build_s": build_s, "render_svg_s": render_s})
+        del df
+    print(pd.DataFrame(rows).set_index(["rows", "chart"]).to_string(float_format=lambda x: f"{x:.3g}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# bench_eda_render.py
+# Times the EDA stage with its charts built and saved one after another vs
+# concurrently on a thread pool, for every chart format.
+
+import os
+import sys
+import tempfile
+import time
+import click
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.scripts.eda import run_eda
+from heart_disease_predictor.scripts.run_pipeline import EDA_AXIS_TITLES, EDA_CAT_COLS, EDA_NUM_COLS
+
+
+def time_eda(df, chart_format, n_jobs, repeats):
+    """Best wall time of run_eda over repeats runs, each into a new folder."""
+    times = []
+    for _ in range(repeats):
+        with tempfile.TemporaryDirectory() as output_dir:
+            start = time.perf_counter()
+            run_eda(df, output_dir, "target", EDA_NUM_COLS, EDA_CAT_COLS, EDA_AXIS_TITLES, chart_format, n_jobs)
+            times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@click.command()
+@click.option('--train-data', default="data/processed/train_heart.csv", help='Training data the charts are drawn from')
+@click.option('--formats', default="png,svg,html", help='Comma-separated chart formats')
+@click.option('--n-jobs', type=int, default=None, help='Charts rendered at once by the pooled run (default: all)')
+@click.option('--repeats', type=int, default=3, help='Runs per setting; the best time is kept')
+def main(train_data, formats, n_jobs, repeats):
+    df = pd.read_csv(train_data)
+    # First run loads the vl-convert engine
+    time_eda(df, "svg", 1, 1)
+
+    rows = []
+    for chart_format in formats.split(","):
+        sequential = time_eda(df, chart_format, 1, repeats)
+        pooled = time_eda(df, chart_format, n_jobs, repeats)
+        rows.append({"format": chart_format, "sequential_s": sequential, "pooled_s": pooled,
+                     "speedup": sequential / pooled})
+    print(f"{len(df)} rows, {os.cpu_count()} CPU(s)")
+    print(pd.DataFrame(rows).set_index("format").to_string(float_format=lambda x: f"{x:.3g}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# bench_import_time.py
+# Times the start-up of every pipeline stage: --help through the heart CLI and
+# python -m on the stage module, and the import of the libraries the stage needs to run.
+
+import ast
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+import click
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.scripts.cli import STAGES
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+HEAVY_LIBRARIES = ["pandas", "numpy", "sklearn", "altair", "pandera", "matplotlib", "pyarrow", "requests"]
+
+
+def best_time(command, repeats):
+    """Smallest wall-clock time of repeats runs of a command."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def stage_imports(module):
+    """Source of the import statements at the top of main() in a stage module."""
+    path = importlib.util.find_spec(module).origin
+    tree = ast.parse(open(path).read())
+    main = next(node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name == "main")
+    return "\n".join(ast.unparse(node) for node in main.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+@click.command()
+@click.option('--repeats', type=int, default=5, help='Runs per measurement, the fastest is reported')
+def main(repeats):
+    rows = []
+    for stage, (module, _) in STAGES.items():
+        imports = stage_imports(module)
+        libraries = subprocess.run(
+            [sys.executable, "-c", f"{imports}\nimport sys\n"
+                                   f"print(' '.join(m for m in {HEAVY_LIBRARIES!r} if m in sys.modules))"],
+            cwd=ROOT, check=True, capture_output=True, text=True).stdout.split()
+        rows.append({
+            "stage": stage,
+            "cli_help_s": best_time([sys.executable, "-m", "heart_disease_predictor.scripts.cli", stage, "--help"], repeats),
+            "module_help_s": best_time([sys.executable, "-m", module, "--help"], repeats),
+            "stage_imports_s": best_time([sys.executable, "-c", imports], repeats),
+            "libraries": " ".join(libraries),
+        })
+    print(pd.DataFrame(rows).set_index("stage").to_string(float_format=lambda x: f"{x:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# bench_io.py
+# Times the reads and writes of every pipeline stage with CSV and with Parquet
+# intermediate files, on a synthetic dataset of the heart columns.
+
+import os
+import sys
+import time
+import pickle
+import tempfile
+import click
+import pandas as pd
+from sklearn import set_config
+from sklearn.model_selection import train_test_split
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from benchmarks.synthetic import make_synthetic_heart
+from heart_disease_predictor.utils.heart_schema import COLUMNS
+from heart_disease_predictor.utils.table_io import TABLE_FORMATS, read_table, table_path, write_table
+
+# Tables read and written by each stage of the Makefile, by file name
+STAGES = {
+    "validate_data": {"read": [], "write": ["heart_validated"]},
+    "preprocessing": {"read": ["heart_validated"],
+                      "write": ["train_heart", "test_heart", "heart_train_preprocessed", "heart_test_preprocessed"]},
+    "eda": {"read": ["train_heart"], "write": []},
+    "evaluate_default_models": {"read": ["train_heart"], "write": []},
+    "hyperparameter_tuning": {"read": ["train_heart"], "write": []},
+    "evaluate_scores": {"read": ["test_heart"], "write": []},
+}
+
+
+def build_tables(raw_data, preprocessor_path, n_rows):
+    """Build every intermediate table of the pipeline for n_rows synthetic patients."""
+    heart = make_synthetic_heart(pd.read_csv(raw_data, names=COLUMNS, header=0), n_rows)
+    tables = {"heart_validated": heart}
+    heart = heart.assign(target=heart["target"].replace({1: "Heart Disease", 0: "No Heart Disease"}))
+    train, test = train_test_split(heart, test_size=0.3, random_state=123)
+    tables["train_heart"], tables["test_heart"] = train, test
+    with open(preprocessor_path, "rb") as f:
+        preprocessor = pickle.load(f)
+    for name, split in [("heart_train_preprocessed", train), ("heart_test_preprocessed", test)]:
+        tables[name] = preprocessor.transform(split.drop(columns=["target"])).assign(target=split["target"].to_numpy())
+    return tables
+
+
+@click.command()
+@click.option('--raw-data', default="data/raw/Cardiovascular_Disease_Dataset/Cardiovascular_Disease_Dataset.csv", help='Raw heart CSV to resample')
+@click.option('--preprocessor-path', default="results/preprocessor/heart_preprocessor.pickle", help='Fitted preprocessor used for the preprocessed tables')
+@click.option('--rows', type=int, default=1_000_000, help='Number of rows of the synthetic validated dataset')
+def main(raw_data, preprocessor_path, rows):
+    set_config(transform_output="pandas")
+    tables = build_tables(raw_data, preprocessor_path, rows)
+
+    timings = pd.DataFrame(0.0, index=pd.Index(list(STAGES), name="stage"), columns=list(TABLE_FORMATS))
+    sizes = dict()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for fmt in TABLE_FORMATS:
+            for stage, io in STAGES.items():
+                start = time.perf_counter()
+                for name in io["write"]:
+                    write_table(tables[name], table_path(tmp_dir, name, fmt))
+                for name in io["read"]:
+                    read_table(table_path(tmp_dir, name, fmt))
+                timings.loc[stage, fmt] = time.perf_counter() - start
+            sizes[fmt] = sum(os.path.getsize(table_path(tmp_dir, name, fmt)) for name in tables) / 1e6
+
+            # Column projection: read only two columns of the training set
+            start = time.perf_counter()
+            read_table(table_path(tmp_dir, "train_heart", fmt), columns=["age", "target"])
+            timings.loc["train_heart (2 columns)", fmt] = time.perf_counter() - start
+
+    timings.loc["total (all stages)"] = timings.loc[list(STAGES)].sum()
+    timings["speedup"] = timings["csv"] / timings["parquet"]
+    print(f"I/O seconds per stage for {rows:,} validated rows")
+    print(timings.round(3).to_string())
+    print("Size of the intermediate files (MB): " + ", ".join(f"{fmt} {size:.1f}" for fmt, size in sizes.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# bench_kernel_approximation.py
+# Compares training time, inference latency and F2 of the exact SVM RBF with the
+# approximate RBF kernel models as the training set grows.
+
+import os
+import sys
+import time
+import pickle
+import click
+import numpy as np
+import pandas as pd
+from sklearn import set_config
+from sklearn.base import clone
+from sklearn.metrics import fbeta_score
+from sklearn.pipeline import make_pipeline
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from benchmarks.synthetic import make_synthetic_heart
+from heart_disease_predictor.utils.models import get_models
+
+# Candidates compared, with the parameters of the tuned final model for the SVC
+MODELS = {
+    "SVM RBF": {"C": 10.0, "gamma": 0.1},
+    "Nystroem SVM": {"nystroem__gamma": 0.1, "linearsvc__C": 1.0},
+    "RFF SGD": {"rbfsampler__gamma": 0.1},
+}
+
+
+@click.command()
+@click.option('--train-data', default="data/processed/train_heart.csv", help='Data resampled into the synthetic training sets')
+@click.option('--test-data', default="data/processed/test_heart.csv", help='Real test data the F2 score is computed on')
+@click.option('--preprocessor-path', default="results/preprocessor/heart_preprocessor.pickle", help='Path to the preprocessor')
+@click.option('--target-col', default="target", help='Name of the target column')
+@click.option('--pos-label', default='Heart Disease', help='Positive class label for fbeta_score')
+@click.option('--sizes', default="1000,10000,100000,1000000", help='Comma-separated numbers of synthetic training rows')
+@click.option('--max-exact-rows', type=int, default=20_000, help='Largest training set the exact SVC is fit on')
+@click.option('--latency-rows', type=int, default=10_000, help='Number of rows scored to measure inference latency')
+def main(train_data, test_data, preprocessor_path, target_col, pos_label, sizes, max_exact_rows, latency_rows):
+    set_config(transform_output="pandas")
+    with open(preprocessor_path, "rb") as f:
+        preprocessor = pickle.load(f)
+    train_df = pd.read_csv(train_data)
+    test_df = pd.read_csv(test_data)
+    X_test, y_test = test_df.drop(columns=[target_col]), test_df[target_col]
+    X_latency = make_synthetic_heart(train_df, latency_rows, seed=0).drop(columns=[target_col])
+    models = get_models(approximate=True)
+
+    rows = []
+    for size in [int(size) for size in sizes.split(",")]:
+        synthetic = make_synthetic_heart(train_df, size)
+        X_train, y_train = synthetic.drop(columns=[target_col]), synthetic[target_col]
+        for model_name, params in MODELS.items():
+            if model_name == "SVM RBF" and size > max_exact_rows:
+                rows.append({"rows": size, "model": model_name})
+                continue
+            pipe = make_pipeline(clone(preprocessor), clone(models[model_name]).set_params(**params))
+            start = time.perf_counter()
+            pipe.fit(X_train, y_train)
+            fit_time = time.perf_counter() - start
+            start = time.perf_counter()
+            pipe.predict(X_latency)
+            predict_time = time.perf_counter() - start
+            rows.append({"rows": size, "model": model_name, "fit_s": fit_time,
+                         "predict_us_per_row": 1e6 * predict_time / latency_rows,
+                         "test_f2": fbeta_score(y_test, pipe.predict(X_test), beta=2, pos_label=pos_label)})
+            print(f"{model_name} on {size} rows: fit {fit_time:.3g}s", file=sys.stderr)
+
+    table = pd.DataFrame(rows).set_index(["rows", "model"])
+    print(table.to_string(float_format=lambda x: f"{x:.3g}", na_rep="skipped"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# bench_search_strategies.py
+# Compares the time-to-best-score of the randomized search against the
+# successive halving strategies of tune_hyperparameters. The total time of each
+# search is measured; the time at which it had scored the candidate giving its
+# final best score is an estimate, est_seconds_to_best, derived from the fit
+# and score times the search records in cv_results_.
+
+import os
+import sys
+import time
+import pickle
+import warnings
+import click
+import pandas as pd
+from sklearn import set_config
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.optimal_hyperparameters import tune_hyperparameters
+from heart_disease_predictor.utils.models import get_models, get_param_dist
+from benchmarks.synthetic import make_synthetic_heart
+
+STRATEGIES = [("random", "n_samples"), ("halving", "n_samples"), ("halving", "folds")]
+
+
+def evaluation_costs(search, strategy, resource):
+    """
+    Fit and score seconds of every evaluation of a search, in the order the search runs them.
+
+    Parameters
+    ----------
+    search : fitted search object
+        Result of tune_hyperparameters, with cv_results_ and best_index_.
+    strategy, resource : str
+        Arguments the search was run with.
+
+    Returns
+    -------
+    tuple of (list of float, int)
+        - Seconds of each evaluation: one candidate on the folds of one round.
+        - Position of the evaluation giving the final best score.
+    """
+    cv = pd.DataFrame(search.cv_results_)
+    per_fold = cv["mean_fit_time"] + cv["mean_score_time"]
+    if strategy == "halving" and resource == "folds":
+        # One row per candidate, with the last round it reached and the folds it
+        # was scored on; round k scores every candidate that reached it on the
+        # folds added since round k - 1
+        folds = cv.groupby("iter")["n_resources"].max()
+        costs, best = [], None
+        for k in folds.index:
+            for i in cv.index[cv["iter"] >= k]:
+                costs.append(per_fold[i] * (folds[k] - folds.get(k - 1, 0)))
+                if i == search.best_index_ and k == cv.at[i, "iter"]:
+                    best = len(costs) - 1
+        return costs, best
+    # One row per candidate and round, each scored on every fold; candidates
+    # are dispatched in row order within a round
+    n_splits = cv.columns.str.fullmatch(r"split\d+_test_score").sum()
+    order = list(cv.sort_values("iter", kind="stable").index if "iter" in cv else cv.index)
+    return list(per_fold[order] * n_splits), order.index(search.best_index_)
+
+
+def estimate_seconds_to_best(search, strategy, resource, elapsed):
+    """
+    Estimate the elapsed seconds at which the search had scored the candidate giving its final best score.
+
+    This is not measured: the measured wall time of the search is split between
+    its evaluations in proportion to the fit and score times in cv_results_,
+    assuming parallel workers progress through the evaluations in order.
+    """
+    costs, best = evaluation_costs(search, strategy, resource)
+    return elapsed * sum(costs[:best + 1]) / sum(costs)
+
+
+@click.command()
+@click.option('--train-data', default="data/processed/train_heart.csv", help='Path to train data CSV')
+@click.option('--preprocessor-path', default="results/preprocessor/heart_preprocessor.pickle", help='Path to preprocessor')
+@click.option('--target-col', default="target", help='Name of the target column')
+@click.option('--pos-label', default='Heart Disease', help='Positive class label for fbeta_score')
+@click.option('--beta', default=2.0, help='Beta parameter for fbeta_score')
+@click.option('--seed', default=123, help='Random seed')
+@click.option('--models', default="Decision Tree,Logistic Regression,SVM RBF", help='Comma-separated model names from get_models')
+@click.option('--scales', default="1,100", help='Comma-separated dataset size multipliers; 1 is the heart dataset itself')
+@click.option('--results', default=None, help='Optional CSV path for the benchmark table')
+def main(train_data, preprocessor_path, target_col, pos_label, beta, seed, models, scales, results):
+    """Time every search strategy in total, and estimate its time to the best score, on the heart dataset and on synthetic datasets built from it."""
+    set_config(transform_output="pandas")
+    warnings.filterwarnings("ignore")
+
+    train_df = pd.read_csv(train_data)
+    with open(preprocessor_path, "rb") as f:
+        preprocessor = pickle.load(f)
+
+    rows = []
+    for scale in [int(s) for s in scales.split(",")]:
+        df = train_df if scale == 1 else make_synthetic_heart(train_df, len(train_df) * scale, seed)
+        X_train, y_train = df.drop(columns=[target_col]), df[target_col]
+        for model_name in [m.strip() for m in models.split(",")]:
+            for strategy, resource in STRATEGIES:
+                start = time.perf_counter()
+                search = tune_hyperparameters(X_train, y_train, get_models(random_state=seed)[model_name],
+                                              preprocessor, get_param_dist()[model_name], pos_label, beta, seed,
+                                              strategy=strategy, resource=resource)
+                elapsed = time.perf_counter() - start
+                rows.append({"n_rows": len(df), "model": model_name, "strategy": strategy,
+                             "resource": resource if strategy == "halving" else "",
+                             "est_seconds_to_best": round(estimate_seconds_to_best(search, strategy, resource, elapsed), 3),
+                             "total_seconds": round(elapsed, 3), "best_score": round(search.best_score_, 4),
+                             "best_params": search.best_params_})
+                print(rows[-1])
+
+    table = pd.DataFrame(rows)
+    print(table.to_string(index=False))
+    print("est_seconds_to_best: total_seconds split between the evaluations of the search in run order, "
+          "in proportion to their fit and score times in cv_results_")
+    if results:
+        table.to_csv(results, index=False)
+
+
+if __name__ == "__main__":
+    main()
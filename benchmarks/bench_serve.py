@@ -0,0 +1,93 @@
+# bench_serve.py
+# Load generator for the HTTP scoring service: reports p50/p99 latency and
+# throughput with and without micro-batching.
+
+import os
+import sys
+import json
+import time
+import threading
+import http.client
+from urllib.parse import urlparse
+import click
+import numpy as np
+import pandas as pd
+from sklearn import set_config
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.scoring_service import ScoringService, make_server
+
+
+def run_load(host, port, bodies, concurrency):
+    """
+    Send every body as one POST /predict, spread over concurrent keep-alive clients.
+
+    Returns
+    -------
+    tuple of (numpy array, float)
+        Per-request latencies in seconds and the total wall-clock time.
+    """
+    latencies = [[] for _ in range(concurrency)]
+
+    def client(worker):
+        connection = http.client.HTTPConnection(host, port)
+        for body in bodies[worker::concurrency]:
+            start = time.perf_counter()
+            connection.request("POST", "/predict", body, {"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response.read()
+            latencies[worker].append(time.perf_counter() - start)
+            if response.status != 200:
+                raise RuntimeError(f"Request failed with status {response.status}")
+        connection.close()
+
+    threads = [threading.Thread(target=client, args=(worker,)) for worker in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return np.concatenate([np.array(l) for l in latencies]), time.perf_counter() - start
+
+
+@click.command()
+@click.option('--final-model-path', default="results/final_model_results/final_model.pickle", help='Path to the final model')
+@click.option('--records', default="data/processed/test_heart.csv", help='CSV of records to send, one record per request')
+@click.option('--url', default=None, help='URL of an already running service; by default one is started in this process')
+@click.option('--requests', 'n_requests', type=int, default=2000, help='Total number of requests')
+@click.option('--concurrency', type=int, default=16, help='Number of concurrent clients')
+@click.option('--max-batch-size', type=int, default=64, help='Micro-batch size of the in-process service')
+@click.option('--max-delay-ms', type=float, default=2.0, help='Micro-batch delay of the in-process service')
+def main(final_model_path, records, url, n_requests, concurrency, max_batch_size, max_delay_ms):
+    """Benchmark single-record requests against the scoring service."""
+    set_config(transform_output="pandas")
+
+    df = pd.read_csv(records).drop(columns=["target"], errors="ignore")
+    rows = json.loads(df.to_json(orient="records"))
+    bodies = [json.dumps(rows[i % len(rows)]) for i in range(n_requests)]
+
+    if url:
+        parsed = urlparse(url)
+        configs = [("external", parsed.hostname, parsed.port, None)]
+    else:
+        configs = []
+        for label, batch_size in [("no batching", 1), ("micro-batching", max_batch_size)]:
+            service = ScoringService(final_model_path, max_batch_size=batch_size, max_delay=max_delay_ms / 1000)
+            server = make_server(service, "127.0.0.1", 0)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            configs.append((label, "127.0.0.1", server.server_address[1], (server, service)))
+
+    for label, host, port, owned in configs:
+        latencies, elapsed = run_load(host, port, bodies, concurrency)
+        batches = f", {owned[1].batcher.n_batches} batches" if owned else ""
+        print(f"{label}: p50 {np.percentile(latencies, 50) * 1000:.2f} ms, "
+              f"p99 {np.percentile(latencies, 99) * 1000:.2f} ms, "
+              f"{n_requests / elapsed:.0f} QPS over {n_requests} requests{batches}")
+        if owned:
+            owned[0].shutdown()
+            owned[0].server_close()
+            owned[1].close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# bench_summary_stats.py
+# Times the summary statistics of a large synthetic extract: pandas describe
+# on the loaded table vs one streaming pass over file chunks, and compares
+# peak memory and the error of the sketched quantiles.
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import click
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from benchmarks.synthetic import make_synthetic_heart
+from heart_disease_predictor.utils.streaming_stats import summarize_table
+
+
+def measure(func):
+    """Result, wall time and traced peak memory (MB) of func()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+@click.command()
+@click.option('--train-data', default="data/processed/train_heart.csv", help='Training data the synthetic rows are drawn from')
+@click.option('--rows', type=int, default=2_000_000, help='Rows of the synthetic extract')
+@click.option('--chunksize', type=int, default=100_000, help='Rows per chunk of the streaming pass')
+@click.option('--n-jobs', type=int, default=2, help='Worker processes of the pooled streaming pass')
+def main(train_data, rows, chunksize, n_jobs):
+    df = make_synthetic_heart(pd.read_csv(train_data), rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "extract.csv")
+        df.to_csv(path, index=False)
+        del df
+
+        exact, describe_s, describe_mb = measure(lambda: pd.read_csv(path).describe(include="all"))
+        timings = [{"method": "read_csv + describe", "seconds": describe_s, "peak_mb": describe_mb}]
+        for jobs in (1, n_jobs):
+            summary, seconds, peak = measure(lambda: summarize_table(path, chunksize, n_jobs=jobs))
+            timings.append({"method": f"streaming, n_jobs={jobs}", "seconds": seconds, "peak_mb": peak})
+
+    numeric = exact.loc[["25%", "50%", "75%"]].dropna(axis=1, how="all").columns
+    error = (summary.loc[["25%", "50%", "75%"], numeric].astype(float)
+             - exact.loc[["25%", "50%", "75%"], numeric].astype(float)).abs()
+    spread = (exact.loc["max", numeric] - exact.loc["min", numeric]).astype(float)
+    print(f"{rows} rows, {os.cpu_count()} CPU(s); peak memory is traced Python allocations of the main process")
+    print(pd.DataFrame(timings).set_index("method").to_string(float_format=lambda x: f"{x:.3g}"))
+    print(f"largest quartile error: {np.nanmax((error / spread).to_numpy()):.2e} of the column range")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# synthetic.py
+# Helpers shared by the benchmark scripts to build larger heart-like datasets.
+
+import numpy as np
+import pandas as pd
+
+# Integer-valued clinical measurements that are jittered when rows are resampled
+JITTER_COLS = {
+    "age": 2.0,
+    "resting_bp": 4.0,
+    "serum_cholesterol": 10.0,
+    "max_heart_rate": 4.0,
+}
+
+
+def make_synthetic_heart(df, n_rows, seed=123):
+    """
+    Build a synthetic heart dataset by resampling rows of a real one.
+
+    Rows are drawn with replacement, the continuous clinical measurements are
+    jittered with Gaussian noise and patient ids are renumbered so that the
+    result has no duplicate rows.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Source dataset with the heart disease columns.
+    n_rows : int
+        Number of rows of the synthetic dataset.
+    seed : int, optional
+        Random seed, by default 123.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Synthetic dataset with the same columns and dtypes as df.
+    """
+    rng = np.random.default_rng(seed)
+    synthetic = df.iloc[rng.integers(0, len(df), size=n_rows)].reset_index(drop=True)
+    for col, scale in JITTER_COLS.items():
+        if col in synthetic.columns:
+            noise = rng.normal(0.0, scale, size=n_rows)
+            values = np.rint(synthetic[col].to_numpy() + noise)
+            synthetic[col] = np.clip(values, df[col].min(), df[col].max()).astype(df[col].dtype)
+    if "old_peak" in synthetic.columns:
+        noise = rng.normal(0.0, 0.2, size=n_rows)
+        synthetic["old_peak"] = np.clip(np.round(synthetic["old_peak"] + noise, 1),
+                                        df["old_peak"].min(), df["old_peak"].max())
+    if "patient_id" in synthetic.columns:
+        synthetic["patient_id"] = np.arange(1, n_rows + 1)
+    return synthetic
@@ -0,0 +1,55 @@
+# cli.py
+# Single entry point of the pipeline stages, installed as `heart <stage>`.
+# A stage module is only imported when that stage is invoked, and every
+# script imports its heavy libraries inside main(), so each stage starts
+# with only the libraries it uses.
+
+import importlib
+
+import click
+
+# Stage name -> (module holding the click command `main`, short help)
+STAGES = {
+    "import-data": ("heart_disease_predictor.scripts.import_data", "Download the raw data zip and extract it."),
+    "validate-data": ("heart_disease_predictor.scripts.validate_data", "Validate the raw data against the heart schema."),
+    "preprocessing": ("heart_disease_predictor.scripts.preprocessing", "Split the data and fit the preprocessor."),
+    "eda": ("heart_disease_predictor.scripts.eda", "Write the EDA summary statistics and charts."),
+    "evaluate-default-models": ("heart_disease_predictor.scripts.evaluate_default_models", "Cross-validate the models with default parameters."),
+    "hyperparameter-tuning": ("heart_disease_predictor.scripts.hyperparameter_tuning", "Tune the models and save the final model."),
+    "evaluate-scores": ("heart_disease_predictor.scripts.evaluate_scores", "Evaluate the final model on the test data."),
+    "export-compiled-model": ("heart_disease_predictor.scripts.export_compiled_model", "Compile the final model into a NumPy kernel."),
+    "predict": ("heart_disease_predictor.scripts.predict", "Score a CSV or Parquet file in batches."),
+    "serve": ("heart_disease_predictor.scripts.serve", "Serve predictions over HTTP."),
+    "run-stage": ("heart_disease_predictor.scripts.run_stage", "Run a command unless its outputs are cached."),
+    "run-pipeline": ("heart_disease_predictor.scripts.run_pipeline", "Run every stage in one process, keeping the data in memory."),
+}
+
+
+class LazyStageGroup(click.Group):
+    """
+    Click group whose subcommands are imported from STAGES on first use.
+
+    Listing the stages in --help only reads STAGES, so it imports nothing.
+    """
+
+    def list_commands(self, ctx):
+        return list(STAGES)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in STAGES:
+            return None
+        return importlib.import_module(STAGES[cmd_name][0]).main
+
+    def format_commands(self, ctx, formatter):
+        with formatter.section("Stages"):
+            formatter.write_dl([(name, short_help) for name, (_, short_help) in STAGES.items()])
+
+
+@click.group(cls=LazyStageGroup)
+def main():
+    '''
+    Run one stage of the heart disease analysis pipeline.
+    '''
+
+if __name__ == '__main__':
+    main()
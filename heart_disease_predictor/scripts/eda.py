@@ -0,0 +1,134 @@
+# eda.py
+# author: Omowunmi Obadero
+# date: 2025-12-05
+
+import os
+import click
+
+from heart_disease_predictor.utils.constants import CHART_FORMATS
+
+
+@click.command()
+@click.option("--data", type=str, required=True,
+              help="Path to processed training data (CSV or Parquet).")
+@click.option("--output-dir", type=str, required=True,
+              help="Directory where all EDA plots and summary files will be saved.")
+@click.option("--target-col", type=str, required=True,
+              help="Name of the target column.")
+@click.option("--num-cols", type=str, default="",
+              help="Comma-separated list of numerical columns.")
+@click.option("--cat-cols", type=str, default="",
+              help="Comma-separated list of categorical columns.")
+@click.option("--axis-titles", type=str, default="",
+              help="Optional comma-separated list of column:title for categorical plots, e.g. gender:Gender")
+@click.option("--chart-format", type=click.Choice(CHART_FORMATS), default="png", show_default=True,
+              help="File format of the charts.")
+@click.option("--n-jobs", type=int, default=None,
+              help="Number of charts built and saved at once (default: all of them).")
+@click.option("--summary-chunksize", type=int, default=None,
+              help="Compute the summary statistics in one streaming pass over chunks of this many rows "
+                   "(default: exact pandas describe).")
+def main(data, output_dir, target_col, num_cols, cat_cols, axis_titles, chart_format, n_jobs, summary_chunksize):
+    """
+    Run exploratory data analysis on any dataset with numerical, categorical, and target columns.
+
+    Parameters
+    ----------
+    data : str
+        Path to CSV or Parquet dataset.
+    output_dir : str
+        Directory where plots and summary statistics will be saved.
+    target_col : str
+        Name of the target column.
+    num_cols : str
+        Comma-separated list of numerical column names.
+    cat_cols : str
+        Comma-separated list of categorical column names.
+    axis_titles : str
+        Optional comma-separated mapping of categorical columns to axis titles.
+    chart_format : str
+        File format of the charts: png, svg or html.
+    n_jobs : int
+        Number of charts built and saved at once.
+    summary_chunksize : int
+        Rows per chunk of the streaming summary statistics, or None for pandas describe.
+    """
+    from heart_disease_predictor.utils.eda_helper import load_data
+
+    df = load_data(data)
+
+    # Parse numerical and categorical columns
+    num_cols = [col.strip() for col in num_cols.split(",") if col.strip()]
+    cat_cols = [col.strip() for col in cat_cols.split(",") if col.strip()]
+
+    # Parse axis titles mapping
+    axis_titles_dict = {}
+    if axis_titles:
+        for item in axis_titles.split(","):
+            col, title = item.split(":")
+            axis_titles_dict[col.strip()] = title.strip()
+
+    run_eda(df, output_dir, target_col, num_cols, cat_cols, axis_titles_dict, chart_format, n_jobs,
+            summary_chunksize)
+
+
+def run_eda(df, output_dir, target_col, num_cols=(), cat_cols=(), axis_titles=None, chart_format="png",
+            n_jobs=None, summary_chunksize=None):
+    """
+    Save the summary statistics and EDA charts of a dataset.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataset with numerical, categorical and target columns.
+    output_dir : str
+        Directory where plots and summary statistics will be saved.
+    target_col : str
+        Name of the target column.
+    num_cols : list of str, optional
+        Numerical column names, by default none.
+    cat_cols : list of str, optional
+        Categorical column names, by default none.
+    axis_titles : dict, optional
+        Axis title of categorical columns, by default derived from the column names.
+    chart_format : str, optional
+        File format of the charts, one of utils.constants.CHART_FORMATS, by default 'png'.
+    n_jobs : int, optional
+        Number of charts built and saved at once, by default all of them.
+    summary_chunksize : int, optional
+        Rows per chunk of the streaming summary statistics, by default the
+        exact statistics of pandas describe.
+    """
+    from functools import partial
+    from heart_disease_predictor.utils.chart_render import render_charts
+    from heart_disease_predictor.utils.eda_helper import (
+        compute_summary_statistics,
+        plot_target_distribution,
+        plot_numerical_distributions,
+        plot_boxplots,
+        plot_categorical_vs_target,
+        plot_correlation_heatmap,
+    )
+
+    num_cols, cat_cols = list(num_cols), list(cat_cols)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Summary statistics
+    summary = compute_summary_statistics(df, chunksize=summary_chunksize)
+    summary.to_csv(os.path.join(output_dir, "summary_statistics.csv"))
+
+    # The charts are independent, so they are built and saved concurrently
+    builders = {f"{target_col}_distribution": partial(plot_target_distribution, df, target_col=target_col)}
+    if num_cols:
+        builders["numerical_feature_distributions"] = partial(plot_numerical_distributions, df, num_cols)
+        builders["boxplots_vs_target"] = partial(plot_boxplots, df, num_cols, target_col)
+    if cat_cols:
+        builders["categorical_vs_target"] = partial(plot_categorical_vs_target, df, cat_cols, target_col,
+                                                    axis_titles=axis_titles)
+    builders["correlation_heatmap"] = partial(plot_correlation_heatmap, df, num_cols=num_cols, cat_cols=cat_cols,
+                                              target_col=target_col)
+    render_charts(builders, output_dir, chart_format, scale_factor=2, n_jobs=n_jobs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import click
+from pathlib import Path
+import pickle
+
+
+@click.command()
+@click.option('--train-data', required=True, help='Path to train data (CSV or Parquet)')
+@click.option('--target-col', required=True, help='Name of the target column')
+@click.option('--preprocessor-path', required=True, help='Path to preprocessor')
+@click.option('--pos-label', default='Heart Disease', help='Positive class label for fbeta_score')
+@click.option('--beta', default=2.0, help='Beta parameter for fbeta_score')
+@click.option('--random-state', default=123, help='Random state for classifiers')
+@click.option('--results', required=True, help='File path to save results table, include name of the CSV file e.g., results/CV_scores_default_parameters.csv')
+@click.option('--fold-cache-dir', default=None, help='Optional directory of an on-disk preprocessed fold cache (kept in memory by default)')
+@click.option('--approximate', is_flag=True, default=False, help='Also evaluate the approximate RBF kernel models (Nystroem SVM, RFF SGD)')
+@click.option('--structured-results', default=None, help='Optional CSV path for the numeric scores (mean, std and every fold of each metric) under a two-row header')
+
+def main(train_data, target_col, preprocessor_path, pos_label, beta, random_state, results, fold_cache_dir, approximate, structured_results):
+    """
+    Evaluate default models using cross-validation and save results.
+    Parameters
+    ----------
+    train_data : str
+        Path to training data CSV or Parquet file.
+    target_col : str
+        Name of the target column in the dataset.
+    preprocessor_path : str
+        Path to the preprocessor pickle file.
+    pos_label : str
+        Positive class label for fbeta_score.
+    beta : float
+        Beta parameter for fbeta_score.
+    random_state : int
+        Random state for classifiers.
+    results : str
+        File path to save results table.
+    fold_cache_dir : str
+        Optional directory of an on-disk preprocessed fold cache.
+    approximate : bool
+        Whether to also evaluate the approximate RBF kernel models.
+    structured_results : str
+        Optional CSV path for the numeric scores, read back with
+        pd.read_csv(path, header=[0, 1], index_col=0).
+    """
+    from heart_disease_predictor.utils.table_io import read_table
+
+    df = read_table(train_data)
+
+    X_train = df.drop(columns=[target_col])
+    y_train = df[target_col]
+
+    with open(preprocessor_path, "rb") as f:
+        preprocessor = pickle.load(f)
+
+    evaluate_default_models(X_train, y_train, preprocessor, results, pos_label, beta, random_state,
+                            fold_cache_dir, approximate, structured_results)
+
+
+def evaluate_default_models(X_train, y_train, preprocessor, results, pos_label='Heart Disease', beta=2.0,
+                            random_state=123, fold_cache_dir=None, approximate=False, structured_results=None):
+    """
+    Cross-validate every model with default parameters and save the score table.
+
+    Parameters
+    ----------
+    X_train : pandas.DataFrame
+        Training features.
+    y_train : pandas.Series
+        Training target.
+    preprocessor :
+        Preprocessor placed in front of every model.
+    results : str
+        File path to save results table.
+    pos_label : str, optional
+        Positive class label for fbeta_score, by default 'Heart Disease'.
+    beta : float, optional
+        Beta parameter for fbeta_score, by default 2.0.
+    random_state : int, optional
+        Random state for classifiers, by default 123.
+    fold_cache_dir : str, optional
+        Directory of an on-disk preprocessed fold cache, by default kept in memory.
+    approximate : bool, optional
+        Whether to also evaluate the approximate RBF kernel models, by default False.
+    structured_results : str, optional
+        Optional CSV path for the numeric scores.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Numeric scores of every model, from cv_scores_frame.
+    """
+    import pandas as pd
+    from sklearn.pipeline import make_pipeline
+    from sklearn.metrics import make_scorer, fbeta_score
+    from heart_disease_predictor.utils.mean_std_cv_scores import mean_std_cross_val_scores, render_mean_std
+    from heart_disease_predictor.utils.models import get_models
+    from heart_disease_predictor.utils.fold_cache import FoldCache
+
+    models = get_models(random_state=random_state, approximate=approximate)
+    scorer = make_scorer(fbeta_score, pos_label=pos_label, beta=beta)
+
+    # The preprocessor is fit once per fold and shared by all models
+    fold_cache = FoldCache(fold_cache_dir)
+    results_dict = {}
+    for name, model in models.items():
+        pipe = make_pipeline(preprocessor, model)
+        results_dict[name] = mean_std_cross_val_scores(
+            pipe, X_train, y_train, cv=5, return_train_score=True, scoring=scorer, fold_cache=fold_cache,
+            structured=True
+        )
+    scores_df = pd.DataFrame(results_dict).T
+
+    results_path = Path(results)
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # The "mean (+/- std)" strings are only rendered for the report table
+    render_mean_std(scores_df).to_csv(results_path, index=True)
+    if structured_results:
+        Path(structured_results).parent.mkdir(parents=True, exist_ok=True)
+        scores_df.to_csv(structured_results, index=True)
+
+    return scores_df
+
+
+if __name__ == "__main__":
+    main()
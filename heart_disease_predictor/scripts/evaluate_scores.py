@@ -0,0 +1,133 @@
+# evaluate_scores.py
+# author: Mantram Sharma
+# date: 2025-12-06
+
+import click
+import json
+import os
+import pickle
+
+
+@click.command()
+@click.option('--test-data', required=True, help='Path to test data (CSV or Parquet)')
+@click.option('--target-col', required=True, help='Name of the target column')
+@click.option('--final-model-path', required=True, help='Path to the final model')
+@click.option('--pos-label', default='Heart Disease', help='Positive class label for fbeta_score')
+@click.option('--beta', default=2.0, help='Beta parameter for fbeta_score')
+@click.option('--results-to', type=str, help="Path to directory where the final model will be written to")
+@click.option('--n-bootstrap', type=int, default=10_000, help='Number of bootstrap resamples of the test metrics (0 skips the confidence intervals)')
+@click.option('--confidence-level', type=float, default=0.95, help='Coverage of the bootstrap confidence intervals')
+@click.option('--seed', type=int, default=123, help='Random seed of the bootstrap resampling')
+@click.option('--n-jobs', type=int, default=1, help='Number of worker processes the bootstrap resamples are spread over')
+
+def main(test_data, target_col, final_model_path, pos_label, beta, results_to, n_bootstrap, confidence_level, seed, n_jobs):
+    '''
+    Evaluate the final model on the test data and save the results.
+    '''
+    from sklearn import set_config
+    from heart_disease_predictor.utils.table_io import read_table
+
+    set_config(transform_output="pandas")
+
+    # Reading the test data
+    test_df = read_table(test_data)
+
+    X_test = test_df.drop(columns=[target_col])
+    y_test = test_df[target_col]
+
+    # Load the final model
+    with open(final_model_path, "rb") as f:
+        final_model = pickle.load(f)
+
+    evaluate_final_model(final_model, X_test, y_test, results_to, pos_label, beta, n_bootstrap,
+                         confidence_level, seed, n_jobs)
+
+
+def evaluate_final_model(final_model, X_test, y_test, results_to, pos_label='Heart Disease', beta=2.0,
+                         n_bootstrap=10_000, confidence_level=0.95, seed=123, n_jobs=1):
+    """
+    Evaluate the final model on the test data and save the score table, the
+    metrics report and the confusion matrix. Run with scikit-learn's
+    transform_output set to 'pandas'.
+
+    Parameters
+    ----------
+    final_model :
+        Fitted final model.
+    X_test : pandas.DataFrame
+        Test features.
+    y_test : pandas.Series
+        Test target.
+    results_to : str
+        Directory the results are written to.
+    pos_label : str, optional
+        Positive class label, by default 'Heart Disease'.
+    beta : float, optional
+        Beta of the reported F-beta score, by default 2.0.
+    n_bootstrap : int, optional
+        Number of bootstrap resamples of the test metrics, by default 10000
+        (0 skips the confidence intervals).
+    confidence_level : float, optional
+        Coverage of the bootstrap confidence intervals, by default 0.95.
+    seed : int, optional
+        Random seed of the bootstrap resampling, by default 123.
+    n_jobs : int, optional
+        Number of worker processes of the bootstrap, by default 1.
+
+    Returns
+    -------
+    dict
+        The report saved to evaluation_metrics.json.
+    """
+    import numpy as np
+    import pandas as pd
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from sklearn.metrics import ConfusionMatrixDisplay
+    from heart_disease_predictor.utils.bootstrap import bootstrap_ci
+    from heart_disease_predictor.utils.evaluation import confusion_codes, evaluate_model
+
+    # Every metric, curve and interval comes from one inference pass and one
+    # confusion matrix accumulation
+    betas = tuple(sorted({0.5, 1.0, 2.0, beta}))
+    report, y_pred = evaluate_model(final_model, X_test, y_test, pos_label, betas=betas)
+    result = report["metrics"][f"f{beta:g}"]
+
+    # Confidence intervals from resamples of the stored predictions
+    if n_bootstrap:
+        report["bootstrap"] = {
+            "n_resamples": n_bootstrap, "confidence_level": confidence_level, "seed": seed,
+            "intervals": bootstrap_ci(confusion_codes(y_test, y_pred, pos_label), betas, n_bootstrap,
+                                      confidence_level, seed, n_jobs=n_jobs),
+        }
+
+    result_df = pd.DataFrame({'Best Model': ['RBF SVM'], 
+                              'Test F2 Score': result})
+    result_df.columns = ['Best Model', 'Test F2 Score']
+
+    os.makedirs(results_to, exist_ok=True)
+    
+    result_df.to_csv(os.path.join(results_to, "evaluate_model_results.csv"), index=False)
+    with open(os.path.join(results_to, "evaluation_metrics.json"), "w") as f:
+        json.dump(report, f, indent=1)
+
+    # Save the confusion matrix plot. The figure is drawn with the object-oriented
+    # API rather than pyplot's global state, as run_pipeline calls this on a worker thread
+    labels = report["confusion_matrix"]["labels"]
+    matrix = np.array(report["confusion_matrix"]["matrix"])
+    fig = Figure(figsize=(8, 6))
+    FigureCanvasAgg(fig)
+    ConfusionMatrixDisplay(matrix, display_labels=labels).plot(ax=fig.add_subplot())
+
+    fig.tight_layout()
+    fig.savefig(os.path.join(results_to, "confusion_matrix.png"))
+
+    cm_df = pd.DataFrame(matrix,
+                         index=[f"Actual {label}" for label in labels],
+                         columns=[f"Predicted {label}" for label in labels])
+    cm_df.to_csv(os.path.join(results_to, "confusion_matrix.csv"), index=True)
+
+    return report
+
+if __name__ == '__main__':
+    main()
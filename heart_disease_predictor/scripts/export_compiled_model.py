@@ -0,0 +1,74 @@
+# export_compiled_model.py
+# Compiles the final SVC pipeline into a NumPy kernel, checks it against the
+# pipeline on the test data and saves it as a .npz file.
+
+import click
+import os
+import pickle
+
+
+@click.command()
+@click.option('--final-model-path', required=True, help='Path to the final model')
+@click.option('--test-data', required=True, help='Path to test data (CSV or Parquet) used to verify the kernel')
+@click.option('--target-col', required=True, help='Name of the target column')
+@click.option('--compiled-model-to', required=True, help='Path of the .npz file the compiled kernel is written to')
+@click.option('--atol', type=float, default=1e-9, show_default=True, help='Largest accepted difference between the decision values')
+
+def main(final_model_path, test_data, target_col, compiled_model_to, atol):
+    '''
+    Compile the final model into a NumPy kernel and save it, after checking
+    that it reproduces the predictions and decision values of the model.
+    '''
+    from sklearn import set_config
+    from heart_disease_predictor.utils.table_io import read_table
+
+    set_config(transform_output="pandas")
+
+    with open(final_model_path, "rb") as f:
+        final_model = pickle.load(f)
+    X_test = read_table(test_data).drop(columns=[target_col])
+
+    export_compiled_model(final_model, X_test, compiled_model_to, atol)
+
+
+def export_compiled_model(final_model, X_test, compiled_model_to, atol=1e-9):
+    """
+    Compile the final model, check it against the model on X_test and save it.
+
+    Parameters
+    ----------
+    final_model : sklearn.pipeline.Pipeline
+        Fitted final model.
+    X_test : pandas.DataFrame
+        Rows the compiled kernel is checked on.
+    compiled_model_to : str
+        Path of the .npz file the compiled kernel is written to.
+    atol : float, optional
+        Largest accepted difference between the decision values, by default 1e-9.
+
+    Returns
+    -------
+    CompiledSVC
+        The compiled kernel.
+    """
+    import numpy as np
+    from heart_disease_predictor.utils.compiled_svc import compile_svc_pipeline
+
+    compiled = compile_svc_pipeline(final_model)
+
+    max_diff = np.abs(compiled.decision_function(X_test) - final_model.decision_function(X_test)).max()
+    n_mismatch = (compiled.predict(X_test) != final_model.predict(X_test)).sum()
+    if max_diff > atol or n_mismatch:
+        raise click.ClickException(
+            f"Compiled kernel does not match the final model: {n_mismatch} different predictions, "
+            f"max decision difference {max_diff:.3g}")
+    print(f"Compiled kernel matches the final model on {len(X_test)} test rows "
+          f"(max decision difference {max_diff:.3g})")
+
+    os.makedirs(os.path.dirname(compiled_model_to) or ".", exist_ok=True)
+    compiled.save(compiled_model_to)
+
+    return compiled
+
+if __name__ == '__main__':
+    main()
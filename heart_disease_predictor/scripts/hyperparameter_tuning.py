@@ -0,0 +1,159 @@
+# hyperparameter_tuning.py
+# author: Mantram Sharma
+# date: 2025-12-06
+
+import click
+import os
+import pickle
+
+
+@click.command()
+@click.option('--train-data', required=True, help='Path to train data (CSV or Parquet)')
+@click.option('--target-col', required=True, help='Name of the target column')
+@click.option('--preprocessor-path', required=True, help='Path to preprocessor')
+@click.option('--pos-label', default='Heart Disease', help='Positive class label for fbeta_score')
+@click.option('--beta', default=2.0, help='Beta parameter for fbeta_score')
+@click.option('--seed', type=int, help="Random seed", default=123)
+@click.option('--results-to', type=str, help="Path to directory where the final model will be written to")
+@click.option('--n-jobs', type=int, default=-1, help="Number of worker processes shared by all model searches (-1 uses all cores)")
+@click.option('--strategy', type=click.Choice(["random", "halving"]), default="random", help="Search strategy: full randomized search or successive halving")
+@click.option('--halving-resource', type=click.Choice(["n_samples", "folds"]), default="n_samples", help="Resource grown between successive halving rounds")
+@click.option('--fold-cache-dir', type=str, default=None, help="Optional directory of an on-disk preprocessed fold cache (kept in memory by default)")
+@click.option('--lr-path', is_flag=True, default=False, help="Tune the Logistic Regression C along a warm-started path per fold instead of sampling C and max_iter")
+@click.option('--tree-sweep', is_flag=True, default=False, help="Score every Decision Tree max_depth from one fully grown tree per fold instead of a fit per depth")
+@click.option('--approximate', is_flag=True, default=False, help="Also tune the approximate RBF kernel models (Nystroem SVM, RFF SGD) meant for large training sets")
+
+def main(train_data, target_col, preprocessor_path, pos_label, beta, seed, results_to, n_jobs, strategy, halving_resource, fold_cache_dir, lr_path, tree_sweep, approximate):
+    '''
+    Perform hyperparameter tuning on three classifiers: Decision Tree, Logistic Regression, and SVM,
+    plus the approximate RBF kernel models when --approximate is given.
+    Also save the best classifier model and scores.
+    '''
+    from sklearn import set_config
+    from heart_disease_predictor.utils.table_io import read_table
+
+    set_config(transform_output="pandas")
+
+    # Reading the training data and loading the preprocessor
+    train_df = read_table(train_data)
+
+    X_train = train_df.drop(columns=[target_col])
+    y_train = train_df[target_col]
+
+    with open(preprocessor_path, "rb") as f:
+        preprocessor = pickle.load(f)
+
+    tune_final_model(X_train, y_train, preprocessor, results_to, pos_label, beta, seed, n_jobs, strategy,
+                     halving_resource, fold_cache_dir, lr_path, tree_sweep, approximate)
+
+
+def tune_final_model(X_train, y_train, preprocessor, results_to, pos_label='Heart Disease', beta=2.0, seed=123,
+                     n_jobs=-1, strategy="random", halving_resource="n_samples", fold_cache_dir=None,
+                     lr_path=False, tree_sweep=False, approximate=False):
+    """
+    Tune every model, save the search results and the best model, and return the best model.
+    Run with scikit-learn's transform_output set to 'pandas'.
+
+    Parameters
+    ----------
+    X_train : pandas.DataFrame
+        Training features.
+    y_train : pandas.Series
+        Training target.
+    preprocessor :
+        Preprocessor placed in front of every model.
+    results_to : str
+        Directory the final model and the result tables are written to.
+    pos_label : str, optional
+        Positive class label for fbeta_score, by default 'Heart Disease'.
+    beta : float, optional
+        Beta parameter for fbeta_score, by default 2.0.
+    seed : int, optional
+        Random seed of the models and the searches, by default 123.
+    n_jobs : int, optional
+        Number of worker processes shared by all model searches, by default -1.
+    strategy : str, optional
+        'random' or 'halving', by default 'random'.
+    halving_resource : str, optional
+        Resource grown between successive halving rounds, by default 'n_samples'.
+    fold_cache_dir : str, optional
+        Directory of an on-disk preprocessed fold cache, by default kept in memory.
+    lr_path : bool, optional
+        Whether to tune the Logistic Regression C along a warm-started path, by default False.
+    tree_sweep : bool, optional
+        Whether to score every Decision Tree max_depth from one tree per fold, by default False.
+    approximate : bool, optional
+        Whether to also tune the approximate RBF kernel models, by default False.
+
+    Returns
+    -------
+    sklearn.pipeline.Pipeline
+        The refitted best model.
+    """
+    import pandas as pd
+    from heart_disease_predictor.utils.optimal_hyperparameters import tune_hyperparameters, tune_all_hyperparameters, tune_regularization_path, tune_tree_depth, cv_results_table
+    from heart_disease_predictor.utils.models import get_models, get_param_dist
+    from heart_disease_predictor.utils.fold_cache import FoldCache
+
+    # Running the hyperparameter tuning for all models on one shared worker pool,
+    # or model by model when successive halving is requested. The preprocessed folds
+    # are shared by every model and candidate (halving over n_samples refits it)
+    fold_cache = None if (strategy, halving_resource) == ("halving", "n_samples") else FoldCache(fold_cache_dir)
+    models = {model_name: model_info for model_name, model_info in get_models(random_state=seed, approximate=approximate).items()
+              if model_name != "Dummy Classifier"}
+    param_dist = get_param_dist(approximate=approximate)
+    sampled = {model_name: model_info for model_name, model_info in models.items()
+               if not (lr_path and model_name == "Logistic Regression")
+               and not (tree_sweep and model_name == "Decision Tree")}
+    if strategy == "random":
+        searches = tune_all_hyperparameters(X_train, y_train, sampled, preprocessor, param_dist,
+                                            pos_label, beta, seed, n_jobs=n_jobs, fold_cache=fold_cache)
+    else:
+        searches = {model_name: tune_hyperparameters(X_train, y_train, model_info, preprocessor,
+                                                     param_dist[model_name], pos_label, beta, seed,
+                                                     strategy=strategy, resource=halving_resource,
+                                                     fold_cache=fold_cache)
+                    for model_name, model_info in sampled.items()}
+
+    # With --lr-path the C grid is walked with warm starts on every fold, and the
+    # largest max_iter of the grid is only the budget each fit stops within. With
+    # --tree-sweep every max_depth is scored from one fully grown tree per fold
+    if lr_path:
+        lr_dist = param_dist["Logistic Regression"]
+        lr_model = models["Logistic Regression"].set_params(max_iter=max(lr_dist["logisticregression__max_iter"]))
+        searches["Logistic Regression"] = tune_regularization_path(
+            X_train, y_train, lr_model, preprocessor, "logisticregression__C", lr_dist["logisticregression__C"],
+            pos_label, beta, n_jobs=n_jobs, fold_cache=fold_cache)
+    if tree_sweep:
+        searches["Decision Tree"] = tune_tree_depth(
+            X_train, y_train, models["Decision Tree"], preprocessor,
+            param_dist["Decision Tree"]["decisiontreeclassifier__max_depth"], pos_label, beta,
+            n_jobs=n_jobs, fold_cache=fold_cache)
+    searches = {model_name: searches[model_name] for model_name in models}
+
+    # Finding the best model from the best scores and creating final_model
+    results_dict = dict()
+    best_score = 0
+    best_model = None
+    for model_name, search in searches.items():
+        results_dict[model_name] = [search.best_score_, search.best_params_]
+        print(f"The best F2 score for {model_name} is {search.best_score_} with parameters {search.best_params_}")
+        if search.best_score_ >= best_score:
+            best_score = search.best_score_
+            best_model = model_name
+    final_model = searches[best_model].best_estimator_
+    
+    os.makedirs(results_to, exist_ok=True)
+    with open(os.path.join(results_to, "final_model.pickle"), 'wb') as f:
+        pickle.dump(final_model, f)
+
+    # Save models and results
+    results_df = pd.DataFrame(results_dict).T
+    results_df.columns = ['F2 Score', 'Best Model Parameters']
+    results_df.to_csv(os.path.join(results_to, "hyperparameter_model_results.csv"), index=True)
+    cv_results_table(searches).to_csv(os.path.join(results_to, "hyperparameter_cv_results.csv"), index=False)
+
+    return final_model
+
+if __name__ == '__main__':
+    main()  
\ No newline at end of file
@@ -0,0 +1,29 @@
+# download_data.py
+# author: Sarisha Das
+# date: 2025-12-01
+
+import click
+import os
+
+@click.command()
+@click.option('--url', type=str, help="URL of dataset to be downloaded")
+@click.option('--write-to', type=str, help="Path to directory where raw data will be written to")
+@click.option('--zip-name', type=str, help="Filename for stored zipfile (Uses source filename as default)")
+@click.option('--sha256', type=str, default=None, help="Expected SHA-256 of the zipfile; a stored zipfile with this hash is not downloaded again")
+@click.option('--members', type=str, multiple=True, help="Glob of the zipfile members to extract, e.g. '*.csv' (repeatable; default: all members)")
+
+def main(url, write_to, zip_name, sha256, members):
+    """Downloads data zip data from the web to a local filepath and extracts it."""
+    from heart_disease_predictor.utils.read_zip import read_zip
+
+    if not os.path.exists(write_to):
+        os.makedirs(write_to)
+
+    try:
+        read_zip(url, write_to, zip_name, sha256=sha256, members=list(members) or None)
+    except Exception as e:
+        # A non-zero exit status stops make before it uses a missing or stale dataset
+        raise click.ClickException(f"There was the following error in downloading the zip file: {e}")
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
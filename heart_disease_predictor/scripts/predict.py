@@ -0,0 +1,31 @@
+# predict.py
+# Scores a CSV or Parquet file of patients with the saved final model,
+# streaming the input in chunks so that files of any size can be scored.
+
+import click
+
+
+@click.command()
+@click.option('--input-data', required=True, help='Path to the CSV or Parquet file of patients to score')
+@click.option('--final-model-path', required=True, help='Path to the final model (.pickle, or .npz kernel from export_compiled_model.py)')
+@click.option('--predictions-to', required=True, help='Path of the CSV or Parquet file the predictions are written to')
+@click.option('--chunksize', type=int, default=100_000, show_default=True, help='Number of rows scored at once')
+@click.option('--n-jobs', type=int, default=1, show_default=True, help='Number of worker processes scoring chunks in parallel')
+@click.option('--id-col', default='patient_id', show_default=True, help='Column copied to the predictions to identify the rows')
+
+def main(input_data, final_model_path, predictions_to, chunksize, n_jobs, id_col):
+    '''
+    Predict the class and decision score of every row of the input file
+    and write them to the predictions file chunk by chunk.
+    '''
+    from sklearn import set_config
+    from heart_disease_predictor.utils.batch_predict import predict_file
+
+    set_config(transform_output="pandas")
+
+    n_rows = predict_file(final_model_path, input_data, predictions_to,
+                          chunksize=chunksize, n_jobs=n_jobs, id_col=id_col)
+    print(f"Scored {n_rows} rows into {predictions_to}")
+
+if __name__ == '__main__':
+    main()
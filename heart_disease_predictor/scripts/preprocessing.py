@@ -0,0 +1,140 @@
+# preprocessing.py
+# author: Sarisha Das
+# date: 2023-12-01
+
+import click
+import os
+import pickle
+
+from heart_disease_predictor.utils.constants import TABLE_FORMATS
+
+
+@click.command()
+@click.option('--raw-data', type=str, help="Path to validated data (CSV or Parquet)")
+@click.option('--data-to', type=str, help="Path to directory where processed data will be written to")
+@click.option('--preprocessor-to', type=str, help="Path to directory where the preprocessor object will be written to")
+@click.option('--seed', type=int, help="Random seed", default=123)
+@click.option('--split', type=float,     
+              show_default=True,
+              help="Proportion of the dataset to allocate to the test split.", 
+              default=0.2)
+@click.option('--data-format', type=click.Choice(TABLE_FORMATS), default="csv",
+              show_default=True,
+              help="File format of the split and preprocessed datasets.")
+
+def main(raw_data, data_to, preprocessor_to, seed, split, data_format):
+    '''This script splits the raw data into train and test sets, 
+    and then preprocesses the data to be used in exploratory data analysis.
+    It also saves the preprocessor to be used in the model training script.'''
+    from sklearn import set_config
+    from heart_disease_predictor.utils.table_io import read_table
+
+    set_config(transform_output="pandas")
+
+    split_and_preprocess(read_table(raw_data), data_to, preprocessor_to, seed, split, data_format)
+
+
+def split_and_preprocess(heart, data_to, preprocessor_to, seed=123, split=0.2, data_format="csv"):
+    """
+    Split the validated data into train and test sets, fit the preprocessor on
+    the train set and save the splits, the preprocessor and the preprocessed splits.
+    Run with scikit-learn's transform_output set to 'pandas'.
+
+    Parameters
+    ----------
+    heart : pandas.DataFrame
+        Validated dataset with a 0/1 target column; it is not modified.
+    data_to : str
+        Directory the split and preprocessed datasets are written to.
+    preprocessor_to : str
+        Directory the preprocessor pickle is written to.
+    seed : int, optional
+        Random seed of the split, by default 123.
+    split : float, optional
+        Proportion of the dataset in the test split, by default 0.2.
+    data_format : str, optional
+        File format of the datasets, by default 'csv'.
+
+    Returns
+    -------
+    tuple of (pandas.DataFrame, pandas.DataFrame, ColumnTransformer)
+        The train and test splits with their target column and the fitted preprocessor.
+    """
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler, OneHotEncoder, OrdinalEncoder
+    from sklearn.compose import make_column_transformer
+    from heart_disease_predictor.utils.table_io import table_path, write_table
+
+    # Change values of 1 and 0 to 'Heart Disease' and 'No Heart Disease' in target
+    heart = heart.assign(target=heart['target'].replace({
+        1 : 'Heart Disease',
+        0 : 'No Heart Disease'
+    }))
+
+    # Create train test split
+    train_split, test_split = train_test_split(
+            heart, test_size = split, random_state=seed
+        )
+
+    #makedir in case the directory doesn't exist
+    os.makedirs(data_to, exist_ok=True)
+    os.makedirs(preprocessor_to, exist_ok=True)
+
+    # Save raw split data
+    write_table(train_split, table_path(data_to, "train_heart", data_format))
+    write_table(test_split, table_path(data_to, "test_heart", data_format))
+
+    train_targets = train_split['target']
+    train_heart = train_split.drop(columns = ['target'])
+
+    test_targets = test_split['target']
+    test_heart = test_split.drop(columns = ['target'])
+
+    # Column definitions
+    binary = ["gender", "fasting_blood_sugar", "exercise_angina"]
+    target = ["target"]
+    ohe = ["chest_pain", "resting_electro"]
+    numerical = [
+        "age",
+        "resting_bp",
+        "serum_cholesterol",
+        "max_heart_rate",
+        "old_peak",
+        "num_major_vessels",
+    ]
+    ordinal = ["slope"]
+    drop = ["patient_id"]
+
+    heart_preprocessor = make_column_transformer(
+            (StandardScaler(), numerical),
+            (OneHotEncoder(sparse_output=False), ohe),
+            (OrdinalEncoder(), ordinal),
+            ('passthrough', binary),
+            ('drop', drop)
+        )
+
+    heart_preprocessor.fit(train_heart)
+
+    # Save preprocessor
+    with open(
+        os.path.join(preprocessor_to, "heart_preprocessor.pickle"), "wb"
+    ) as f:
+        pickle.dump(heart_preprocessor, f)
+
+    heart_train_preprocessed = heart_preprocessor.transform(train_heart)
+    heart_test_preprocessed = heart_preprocessor.transform(test_heart)
+
+    # Add train target back
+    heart_train_preprocessed["target"] = train_targets.values
+
+    # Add test target back
+    heart_test_preprocessed["target"] = test_targets.values
+
+    # Save processed data with target included
+    write_table(heart_train_preprocessed, table_path(data_to, "heart_train_preprocessed", data_format))
+    write_table(heart_test_preprocessed, table_path(data_to, "heart_test_preprocessed", data_format))
+
+    return train_split, test_split, heart_preprocessor
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,184 @@
+# run_pipeline.py
+# Runs the analysis stages in one process: the validated data, the splits, the
+# preprocessor and the final model are handed between stages in memory, and the
+# stages that only need the splits run concurrently. Every stage still writes
+# the files the Makefile produces.
+
+import os
+
+import click
+
+from heart_disease_predictor.utils.constants import TABLE_FORMATS
+
+
+# Stage -> stages whose outputs it takes
+STAGE_REQUIRES = {
+    "validate-data": (),
+    "preprocessing": ("validate-data",),
+    "eda": ("preprocessing",),
+    "evaluate-default-models": ("preprocessing",),
+    "hyperparameter-tuning": ("preprocessing",),
+    "evaluate-scores": ("preprocessing", "hyperparameter-tuning"),
+    "export-compiled-model": ("preprocessing", "hyperparameter-tuning"),
+}
+
+# EDA columns and axis titles, as passed to scripts/eda.py by the Makefile
+EDA_NUM_COLS = ["age", "resting_bp", "serum_cholesterol", "max_heart_rate", "old_peak"]
+EDA_CAT_COLS = ["gender", "chest_pain", "fasting_blood_sugar", "resting_electro", "exercise_angina", "slope",
+                "num_major_vessels"]
+EDA_AXIS_TITLES = {
+    "gender": "Gender",
+    "chest_pain": "Chest Pain Type",
+    "fasting_blood_sugar": "Fasting Blood Sugar",
+    "resting_electro": "Resting ECG",
+    "exercise_angina": "Exercise-Induced Angina",
+    "slope": "Slope of ST Segment",
+    "num_major_vessels": "Number of Major Vessels",
+}
+
+
+def build_stages(raw_data, data_dir="data", results_dir="results", data_format="csv", seed=123, split=0.3,
+                 pos_label="Heart Disease", beta=2.0, n_jobs=-1, n_bootstrap=10_000):
+    """
+    Stages of the analysis, writing the same files as the Makefile.
+
+    Parameters
+    ----------
+    raw_data : str
+        Path to the raw input CSV file.
+    data_dir : str, optional
+        Folder of the validated and processed data, by default 'data'.
+    results_dir : str, optional
+        Folder of the results, by default 'results'.
+    data_format : str, optional
+        File format of the datasets, by default 'csv'.
+    seed : int, optional
+        Random seed of the split, the models and the searches, by default 123.
+    split : float, optional
+        Proportion of the dataset in the test split, by default 0.3.
+    pos_label : str, optional
+        Positive class label, by default 'Heart Disease'.
+    beta : float, optional
+        Beta of the F-beta score, by default 2.0.
+    n_jobs : int, optional
+        Number of worker processes of the hyperparameter searches, by default -1.
+    n_bootstrap : int, optional
+        Number of bootstrap resamples of the test metrics, by default 10000.
+
+    Returns
+    -------
+    dict
+        Stage name -> utils.stage_graph.Stage, with the dependencies of STAGE_REQUIRES.
+    """
+    from sklearn import config_context
+    from heart_disease_predictor.utils.stage_graph import Stage
+    from heart_disease_predictor.scripts.validate_data import validate_raw_data
+    from heart_disease_predictor.scripts.preprocessing import split_and_preprocess
+    from heart_disease_predictor.scripts.eda import run_eda
+    from heart_disease_predictor.scripts.evaluate_default_models import evaluate_default_models
+    from heart_disease_predictor.scripts.hyperparameter_tuning import tune_final_model
+    from heart_disease_predictor.scripts.evaluate_scores import evaluate_final_model
+    from heart_disease_predictor.scripts.export_compiled_model import export_compiled_model
+
+    final_results = os.path.join(results_dir, "final_model_results")
+
+    def features_target(df):
+        return df.drop(columns=["target"]), df["target"]
+
+    # The scikit-learn configuration is thread-local, so every stage sets the
+    # transform_output its script runs with
+    def validate():
+        return validate_raw_data(raw_data, os.path.join(data_dir, "validated"), data_format)
+
+    def preprocess(heart):
+        with config_context(transform_output="pandas"):
+            return split_and_preprocess(heart, os.path.join(data_dir, "processed"),
+                                        os.path.join(results_dir, "preprocessor"), seed, split, data_format)
+
+    def eda(splits):
+        run_eda(splits[0], os.path.join(results_dir, "eda_results"), "target", EDA_NUM_COLS, EDA_CAT_COLS,
+                EDA_AXIS_TITLES)
+
+    def default_models(splits):
+        X_train, y_train = features_target(splits[0])
+        return evaluate_default_models(
+            X_train, y_train, splits[2],
+            os.path.join(results_dir, "cv_default_models", "cv_scores_default_parameters.csv"),
+            pos_label, beta, seed)
+
+    def tuning(splits):
+        X_train, y_train = features_target(splits[0])
+        with config_context(transform_output="pandas"):
+            return tune_final_model(X_train, y_train, splits[2], final_results, pos_label, beta, seed, n_jobs)
+
+    def evaluation(splits, final_model):
+        X_test, y_test = features_target(splits[1])
+        with config_context(transform_output="pandas"):
+            return evaluate_final_model(final_model, X_test, y_test, final_results, pos_label, beta, n_bootstrap)
+
+    def export(splits, final_model):
+        X_test, _ = features_target(splits[1])
+        with config_context(transform_output="pandas"):
+            return export_compiled_model(final_model, X_test, os.path.join(final_results, "compiled_model.npz"))
+
+    funcs = {
+        "validate-data": validate,
+        "preprocessing": preprocess,
+        "eda": eda,
+        "evaluate-default-models": default_models,
+        "hyperparameter-tuning": tuning,
+        "evaluate-scores": evaluation,
+        "export-compiled-model": export,
+    }
+    return {name: Stage(funcs[name], requires) for name, requires in STAGE_REQUIRES.items()}
+
+
+@click.command()
+@click.option('--raw-data', default="data/raw/Cardiovascular_Disease_Dataset/Cardiovascular_Disease_Dataset.csv",
+              show_default=True, help="Path to the raw input CSV file")
+@click.option('--data-dir', default="data", show_default=True, help="Folder of the validated and processed data")
+@click.option('--results-dir', default="results", show_default=True, help="Folder of the results")
+@click.option('--data-format', type=click.Choice(TABLE_FORMATS), default="csv", show_default=True,
+              help="File format of the datasets")
+@click.option('--seed', type=int, default=123, show_default=True, help="Random seed")
+@click.option('--split', type=float, default=0.3, show_default=True, help="Proportion of the dataset in the test split")
+@click.option('--pos-label', default='Heart Disease', show_default=True, help='Positive class label for fbeta_score')
+@click.option('--beta', default=2.0, show_default=True, help='Beta parameter for fbeta_score')
+@click.option('--n-jobs', type=int, default=-1, show_default=True, help="Number of worker processes of the hyperparameter searches")
+@click.option('--n-bootstrap', type=int, default=10_000, show_default=True, help='Number of bootstrap resamples of the test metrics')
+@click.option('--skip', multiple=True, type=click.Choice(list(STAGE_REQUIRES)),
+              help="Stage left out together with the stages depending on it (repeatable)")
+@click.option('--max-workers', type=int, default=3, show_default=True, help="Largest number of stages running at once")
+@click.option('--timings-to', default=None, help="Optional CSV path for the start, end and duration of every stage")
+
+def main(raw_data, data_dir, results_dir, data_format, seed, split, pos_label, beta, n_jobs, n_bootstrap, skip,
+         max_workers, timings_to):
+    '''
+    Run the analysis from the raw data to the compiled model in one process
+    and report the runtime of every stage. The report is still rendered by
+    quarto through the Makefile.
+    '''
+    import time
+    import pandas as pd
+    from heart_disease_predictor.utils.stage_graph import drop_stages, run_stages
+
+    stages = build_stages(raw_data, data_dir, results_dir, data_format, seed, split, pos_label, beta, n_jobs,
+                          n_bootstrap)
+    stages, skipped = drop_stages(stages, skip)
+    if skipped:
+        click.echo(f"Skipping {', '.join(skipped)}")
+
+    start = time.perf_counter()
+    _, timings = run_stages(stages, max_workers=max_workers)
+    wall_time = time.perf_counter() - start
+
+    timings_df = pd.DataFrame(timings).T.loc[list(stages)].round(2)
+    timings_df.index.name = "stage"
+    click.echo(timings_df.to_string())
+    click.echo(f"Total {wall_time:.2f}s wall time for {timings_df['seconds'].sum():.2f}s of stage time")
+    if timings_to:
+        os.makedirs(os.path.dirname(timings_to) or ".", exist_ok=True)
+        timings_df.to_csv(timings_to)
+
+if __name__ == '__main__':
+    main()
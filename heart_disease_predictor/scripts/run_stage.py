@@ -0,0 +1,33 @@
+# run_stage.py
+# Runs one pipeline stage through the content-addressed stage cache, so that a
+# stage whose inputs, parameters and code are unchanged is restored instead of rerun.
+
+import time
+import click
+
+from heart_disease_predictor.utils.stage_cache import StageCache, run_stage
+
+
+@click.command(context_settings=dict(ignore_unknown_options=True))
+@click.option('--inputs', default="", help="Space-separated input files of the stage, e.g. make's $^")
+@click.option('--outputs', required=True, help="Space-separated output files or folders of the stage")
+@click.option('--code', 'code_paths', multiple=True, default=["heart_disease_predictor/utils"], show_default=True,
+              help="Code files or folders imported by the stage (repeatable)")
+@click.option('--cache-dir', default=".stage_cache", show_default=True, help="Folder of the artifact store")
+@click.argument('command', nargs=-1, required=True, type=click.UNPROCESSED)
+def main(inputs, outputs, code_paths, cache_dir, command):
+    '''
+    Run COMMAND as a pipeline stage, or restore its outputs from the cache.
+
+    Example: python -m heart_disease_predictor.scripts.run_stage --inputs "$^" --outputs "$@" -- python -m heart_disease_predictor.scripts.eda ...
+    '''
+    start = time.perf_counter()
+    outputs = outputs.split()
+    cached = run_stage(list(command), inputs.split(), outputs, code_paths, StageCache(cache_dir))
+    status = "restored from cache" if cached else "ran"
+    click.echo(f"[run_stage] {' '.join(outputs[:1])}{' ...' if len(outputs) > 1 else ''}: "
+               f"{status} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
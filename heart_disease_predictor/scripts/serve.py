@@ -0,0 +1,37 @@
+# serve.py
+# Serves the final model over HTTP on the local machine, scoring single
+# records or JSON batches validated against the data validation schema.
+
+import click
+
+
+@click.command()
+@click.option('--final-model-path', required=True, help='Path to the final model (.pickle, or .npz kernel from export_compiled_model.py)')
+@click.option('--host', default='127.0.0.1', show_default=True, help='Interface to listen on')
+@click.option('--port', type=int, default=8000, show_default=True, help='Port to listen on')
+@click.option('--max-batch-size', type=int, default=64, show_default=True, help='Maximum number of records scored in one micro-batch')
+@click.option('--max-delay-ms', type=float, default=2.0, show_default=True, help='Maximum time a request waits for others to join its micro-batch')
+
+def main(final_model_path, host, port, max_batch_size, max_delay_ms):
+    '''
+    Load and warm up the final model, then serve POST /predict and GET /health
+    until interrupted.
+    '''
+    from sklearn import set_config
+    from heart_disease_predictor.utils.scoring_service import ScoringService, make_server
+
+    set_config(transform_output="pandas")
+
+    service = ScoringService(final_model_path, max_batch_size=max_batch_size, max_delay=max_delay_ms / 1000)
+    server = make_server(service, host, port)
+    print(f"Serving {final_model_path} on http://{host}:{server.server_address[1]}/predict")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+if __name__ == '__main__':
+    main()
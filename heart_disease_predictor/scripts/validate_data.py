@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+import click
+import os
+
+from heart_disease_predictor.utils.constants import TABLE_FORMATS
+
+@click.command()
+@click.option(
+    "--raw-data",
+    type=str,
+    required=True,
+    help="Path to the raw input CSV file."
+)
+
+@click.option(
+    "--data-to",
+    type=str,
+    help="Output path to save the validated dataset."
+)
+
+@click.option(
+    "--chunksize",
+    type=int,
+    default=None,
+    help="Validate the raw file in chunks of this many rows instead of loading it whole. "
+         "Failure cases are then saved to validation_failures.csv in --data-to."
+)
+
+@click.option(
+    "--data-format",
+    type=click.Choice(TABLE_FORMATS),
+    default="csv",
+    help="File format of the validated dataset."
+)
+def main(raw_data, data_to, chunksize, data_format):
+    """Validate heart disease dataset using Pandera schema."""
+    from heart_disease_predictor.utils.chunked_validation import validate_csv_in_chunks
+    from heart_disease_predictor.utils.heart_schema import COLUMNS, schema
+    from heart_disease_predictor.utils.table_io import table_path
+
+    if chunksize is not None:
+        os.makedirs(data_to, exist_ok=True)
+        validate_csv_in_chunks(
+            raw_data,
+            table_path(data_to, "heart_validated", data_format),
+            schema,
+            names=COLUMNS,
+            chunksize=chunksize,
+            report_path=os.path.join(data_to, "validation_failures.csv"))
+        return
+
+    validate_raw_data(raw_data, data_to, data_format)
+
+
+def validate_raw_data(raw_data, data_to, data_format="csv"):
+    """
+    Validate the raw heart disease CSV and save the validated dataset.
+
+    Parameters
+    ----------
+    raw_data : str
+        Path to the raw input CSV file.
+    data_to : str
+        Directory the validated dataset is written to.
+    data_format : str, optional
+        File format of the validated dataset, by default 'csv'.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The validated dataset.
+    """
+    import pandas as pd
+    from heart_disease_predictor.utils.fast_validation import validate
+    from heart_disease_predictor.utils.heart_schema import COLUMNS, schema
+    from heart_disease_predictor.utils.table_io import table_path, write_table
+
+    os.makedirs(data_to, exist_ok=True)
+
+    heart = pd.read_csv(raw_data, names=COLUMNS, header=0)
+
+    validated_df = validate(heart, schema)
+
+    write_table(validated_df, table_path(data_to, "heart_validated", data_format))
+    return validated_df
+
+
+if __name__ == "__main__":
+    main()
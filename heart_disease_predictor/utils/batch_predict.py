@@ -0,0 +1,153 @@
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from sklearn import get_config, set_config
+
+from heart_disease_predictor.utils.compiled_svc import CompiledSVC
+from heart_disease_predictor.utils.table_io import TableWriter, iter_chunks
+
+
+def load_model(path):
+    """
+    Load a pickled model, or a compiled kernel saved as .npz by CompiledSVC.save.
+
+    Parameters
+    ----------
+    path : str
+        Path to a .pickle or .npz model file.
+
+    Returns
+    -------
+    Fitted scikit-learn pipeline or CompiledSVC
+        The model.
+    """
+    if path.endswith(".npz"):
+        return CompiledSVC.load(path)
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def score_chunk(model, chunk, id_col=None):
+    """
+    Predict the class and decision score of every row of a chunk.
+
+    Parameters
+    ----------
+    model :
+        Fitted scikit-learn pipeline.
+    chunk : pandas.DataFrame
+        Rows to score, with the columns the pipeline was fit on.
+    id_col : str, optional
+        Column copied to the output to identify the rows.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The id column (if any), 'prediction' and 'decision_score' per row. For
+        binary models the class is derived from the score, which is positive for
+        model.classes_[1], so the model runs only once per chunk. An empty chunk
+        gives an empty frame with the same columns, without running the model.
+    """
+    if len(chunk) == 0:
+        scores = np.empty(0)
+        predictions = model.classes_[:0]
+    elif hasattr(model, "decision_function"):
+        scores = model.decision_function(chunk)
+        if len(model.classes_) == 2:
+            predictions = model.classes_[(scores > 0).astype(int)]
+        else:
+            predictions = model.predict(chunk)
+    else:
+        probabilities = model.predict_proba(chunk)
+        scores = probabilities[:, 1]
+        predictions = model.classes_[probabilities.argmax(axis=1)]
+    out = pd.DataFrame({"prediction": predictions, "decision_score": scores})
+    if id_col is not None and id_col in chunk.columns:
+        out.insert(0, id_col, chunk[id_col].to_numpy())
+    return out
+
+
+_worker_model = None
+
+
+def _load_worker_model(model_path, config):
+    """Load the model once per worker process, under the parent's sklearn config."""
+    global _worker_model
+    set_config(**config)
+    _worker_model = load_model(model_path)
+
+
+def _score_in_worker(chunk, id_col):
+    """Score a chunk with the model loaded by _load_worker_model."""
+    return score_chunk(_worker_model, chunk, id_col)
+
+
+def predict_file(model_path, input_path, output_path, chunksize=100_000, n_jobs=1, id_col="patient_id"):
+    """
+    Score a CSV or Parquet file with a pickled model, one chunk at a time.
+
+    Only a bounded number of chunks is in memory at any time, so memory use does
+    not grow with the size of the input. Predictions are written in input order.
+
+    Parameters
+    ----------
+    model_path : str
+        Path to the pickled fitted pipeline, or to its compiled .npz kernel.
+    input_path : str
+        Path to the .csv or .parquet file to score.
+    output_path : str
+        Path of the .csv or .parquet file the predictions are written to.
+    chunksize : int, optional
+        Number of rows scored at once, by default 100000.
+    n_jobs : int, optional
+        Number of worker processes; 1 scores in the current process, by default 1.
+    id_col : str, optional
+        Column copied to the output to identify the rows, by default 'patient_id'.
+
+    Returns
+    -------
+    int
+        Number of rows scored. An input without rows gives a predictions file
+        with only the header.
+    """
+    if chunksize < 1 or n_jobs < 1:
+        raise ValueError("chunksize and n_jobs must be positive.")
+    out_dir = os.path.dirname(output_path)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+
+    writer = TableWriter(output_path)
+    n_rows = 0
+    # Columns of the input, kept to write the header of an input without rows
+    columns = pd.DataFrame()
+    try:
+        if n_jobs == 1:
+            model = load_model(model_path)
+            for chunk in iter_chunks(input_path, chunksize):
+                columns = chunk.iloc[:0]
+                if len(chunk):
+                    writer.write(score_chunk(model, chunk, id_col))
+                    n_rows += len(chunk)
+        else:
+            with ProcessPoolExecutor(n_jobs, initializer=_load_worker_model,
+                                     initargs=(model_path, get_config())) as pool:
+                pending = deque()
+                for chunk in iter_chunks(input_path, chunksize):
+                    columns = chunk.iloc[:0]
+                    if not len(chunk):
+                        continue
+                    pending.append(pool.submit(_score_in_worker, chunk, id_col))
+                    n_rows += len(chunk)
+                    # Keep at most two chunks per worker in flight
+                    if len(pending) >= 2 * n_jobs:
+                        writer.write(pending.popleft().result())
+                while pending:
+                    writer.write(pending.popleft().result())
+        if not n_rows:
+            writer.write(score_chunk(load_model(model_path), columns, id_col))
+    finally:
+        writer.close()
+    return n_rows
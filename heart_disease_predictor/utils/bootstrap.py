@@ -0,0 +1,164 @@
+import numpy as np
+from sklearn.utils.parallel import Parallel, delayed
+
+from heart_disease_predictor.utils.evaluation import confusion_counts, metrics_from_counts
+
+
+def _batch_sizes(n_total, batch_size):
+    """Sizes of the batches n_total resamples are drawn in."""
+    n_batches = -(-n_total // batch_size)
+    return [min(batch_size, n_total - i * batch_size) for i in range(n_batches)]
+
+
+def _bootstrap_batch(codes, n_resamples, seed):
+    """Confusion matrix counts of a batch of bootstrap resamples of the codes."""
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, len(codes), size=(n_resamples, len(codes)))
+    return confusion_counts(codes[indices])
+
+
+def _permutation_batch(codes_a, codes_b, n_permutations, seed):
+    """Confusion matrix counts of both models for a batch of random paired swaps."""
+    rng = np.random.default_rng(seed)
+    swap = rng.random((n_permutations, len(codes_a))) < 0.5
+    return (confusion_counts(np.where(swap, codes_b, codes_a)),
+            confusion_counts(np.where(swap, codes_a, codes_b)))
+
+
+def _run_batches(batch_fn, arrays, n_total, seed, batch_size, n_jobs):
+    """
+    Run batch_fn over batches of n_total draws and return the outputs of every batch.
+
+    Every batch gets its own child of the seed, so the draws do not depend on
+    n_jobs. The batches run in a pool of n_jobs worker processes unless
+    n_jobs is 1.
+    """
+    sizes = _batch_sizes(n_total, batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if n_jobs == 1:
+        return [batch_fn(*arrays, size, child) for size, child in zip(sizes, seeds)]
+    return Parallel(n_jobs=n_jobs)(delayed(batch_fn)(*arrays, size, child) for size, child in zip(sizes, seeds))
+
+
+def bootstrap_counts(codes, n_resamples=10_000, seed=123, batch_size=2000, n_jobs=1):
+    """
+    Confusion matrix counts of bootstrap resamples of a test set.
+
+    Every batch of resamples is drawn as one (batch_size, n_samples) matrix of
+    row indices into the stored predictions, and the counts of all its
+    resamples are accumulated with a single bincount. batch_size bounds the
+    memory used by the index matrix.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        Confusion matrix cell of every test sample, from
+        utils.evaluation.confusion_codes
+    n_resamples : int, optional
+        Number of bootstrap resamples, by default 10000
+    seed : int, optional
+        Random seed of the resampling, by default 123
+    batch_size : int, optional
+        Number of resamples drawn at once, by default 2000
+    n_jobs : int, optional
+        Number of worker processes the batches are spread over, by default 1
+        (no pool); the counts do not depend on it
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (n_resamples, 4) with the counts of tn, fp, fn and tp
+    """
+    codes = np.asarray(codes, dtype=np.intp)
+    if len(codes) == 0 or n_resamples < 1:
+        raise ValueError("bootstrap needs at least one sample and one resample")
+    return np.concatenate(_run_batches(_bootstrap_batch, (codes,), n_resamples, seed, batch_size, n_jobs))
+
+
+def bootstrap_ci(codes, betas=(0.5, 1.0, 2.0), n_resamples=10_000, confidence_level=0.95, seed=123,
+                 batch_size=2000, n_jobs=1):
+    """
+    Percentile bootstrap confidence intervals of the test metrics.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        Confusion matrix cell of every test sample, from
+        utils.evaluation.confusion_codes
+    betas : tuple of float, optional
+        Beta values of the F-beta scores, by default (0.5, 1.0, 2.0)
+    n_resamples : int, optional
+        Number of bootstrap resamples, by default 10000
+    confidence_level : float, optional
+        Coverage of the intervals, by default 0.95
+    seed : int, optional
+        Random seed of the resampling, by default 123
+    batch_size : int, optional
+        Number of resamples drawn at once, by default 2000
+    n_jobs : int, optional
+        Number of worker processes, by default 1 (no pool)
+
+    Returns
+    -------
+    dict
+        [low, high] interval of every metric of
+        utils.evaluation.metrics_from_counts
+    """
+    if not 0 < confidence_level < 1:
+        raise ValueError("confidence_level must be between 0 and 1")
+    counts = bootstrap_counts(codes, n_resamples, seed, batch_size, n_jobs)
+    resampled = metrics_from_counts(counts, betas)
+    alpha = (1 - confidence_level) / 2
+    return {name: np.quantile(values, [alpha, 1 - alpha]).tolist() for name, values in resampled.items()}
+
+
+def paired_permutation_test(codes_a, codes_b, metric="f2", betas=(2.0,), n_permutations=10_000, seed=123,
+                            batch_size=2000, n_jobs=1):
+    """
+    Paired permutation test of the difference of a metric between two models
+    scored on the same test set.
+
+    Under the null hypothesis that both models perform the same, the
+    prediction of model A and of model B for a sample are exchangeable, so
+    every permutation swaps them for a random half of the samples. Swaps are
+    drawn as batched boolean matrices.
+
+    Parameters
+    ----------
+    codes_a, codes_b : numpy.ndarray
+        Confusion matrix cell of every test sample for each model, from
+        utils.evaluation.confusion_codes with the same y_true
+    metric : str, optional
+        Name of the metric in utils.evaluation.metrics_from_counts, by default 'f2'
+    betas : tuple of float, optional
+        Beta values of the F-beta scores, which must include the one of metric,
+        by default (2.0,)
+    n_permutations : int, optional
+        Number of random swaps, by default 10000
+    seed : int, optional
+        Random seed of the swaps, by default 123
+    batch_size : int, optional
+        Number of permutations drawn at once, by default 2000
+    n_jobs : int, optional
+        Number of worker processes, by default 1 (no pool)
+
+    Returns
+    -------
+    tuple of (float, float)
+        Observed difference metric(A) - metric(B) and its two-sided p-value
+    """
+    codes_a, codes_b = np.asarray(codes_a, dtype=np.intp), np.asarray(codes_b, dtype=np.intp)
+    if codes_a.shape != codes_b.shape or len(codes_a) == 0:
+        raise ValueError("both models must be scored on the same non-empty test set")
+    if (codes_a // 2 != codes_b // 2).any():
+        raise ValueError("codes_a and codes_b were computed from different y_true")
+    observed = (metrics_from_counts(confusion_counts(codes_a), betas)[metric]
+                - metrics_from_counts(confusion_counts(codes_b), betas)[metric])
+
+    batches = _run_batches(_permutation_batch, (codes_a, codes_b), n_permutations, seed, batch_size, n_jobs)
+    counts_a = np.concatenate([a for a, _ in batches])
+    counts_b = np.concatenate([b for _, b in batches])
+    differences = metrics_from_counts(counts_a, betas)[metric] - metrics_from_counts(counts_b, betas)[metric]
+    # Ties within rounding error of the observed difference count as extreme
+    extreme = np.abs(differences) >= np.abs(observed) - 1e-12
+    return observed, float((1 + extreme.sum()) / (1 + n_permutations))
@@ -0,0 +1,67 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from heart_disease_predictor.utils.constants import CHART_FORMATS
+
+
+def _build_and_save(build, path, chart_format, scale_factor):
+    """Build one chart and save it to path."""
+    chart = build()
+    if chart_format == "png":
+        chart.save(path, format="png", scale_factor=scale_factor)
+    else:
+        chart.save(path, format=chart_format)
+    return path
+
+
+def render_charts(builders, output_dir, chart_format="png", scale_factor=2, n_jobs=None):
+    """
+    Build and save independent Altair charts concurrently.
+
+    Every chart is built and saved by one task of a thread pool. vl-convert
+    releases the GIL while it renders, so the PNG and SVG conversions of
+    different charts overlap.
+
+    Parameters
+    ----------
+    builders : dict
+        File name without extension -> callable taking no argument and
+        returning the Altair chart.
+    output_dir : str
+        Directory the charts are saved to.
+    chart_format : str, optional
+        One of CHART_FORMATS, by default 'png'.
+    scale_factor : float, optional
+        Resolution multiplier of PNG charts, by default 2.
+    n_jobs : int, optional
+        Number of charts rendered at once, by default one per chart; with 1
+        the charts are rendered in order without a pool.
+
+    Returns
+    -------
+    dict
+        File name -> path of the saved chart, in the order of builders.
+
+    Raises
+    ------
+    ValueError
+        If chart_format is not one of CHART_FORMATS.
+    RuntimeError
+        If a chart fails to build or save; the original exception is chained.
+    """
+    if chart_format not in CHART_FORMATS:
+        raise ValueError(f"chart_format must be one of {CHART_FORMATS}, got {chart_format!r}")
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {name: os.path.join(output_dir, f"{name}.{chart_format}") for name in builders}
+
+    def run(name):
+        try:
+            return _build_and_save(builders[name], paths[name], chart_format, scale_factor)
+        except Exception as exc:
+            raise RuntimeError(f"Chart {name!r} failed: {exc}") from exc
+
+    if n_jobs == 1 or len(builders) <= 1:
+        return {name: run(name) for name in builders}
+    with ThreadPoolExecutor(n_jobs or len(builders)) as pool:
+        futures = {name: pool.submit(run, name) for name in builders}
+        return {name: future.result() for name, future in futures.items()}
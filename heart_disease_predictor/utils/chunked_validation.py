@@ -0,0 +1,157 @@
+import os
+import numpy as np
+import pandas as pd
+from pandera.errors import SchemaErrors
+
+from heart_disease_predictor.utils.fast_validation import row_hashes, validate
+from heart_disease_predictor.utils.table_io import TableWriter, table_format
+
+# Columns of the failure-case report, as in pandera's SchemaErrors.failure_cases
+FAILURE_COLUMNS = ["schema_context", "column", "check", "check_number", "failure_case", "index"]
+
+
+class RowHashSet:
+    """
+    Compact set of 64-bit row hashes.
+
+    Hashes are kept in sorted uint64 runs whose lengths grow geometrically, like
+    a log-structured merge tree: adding a batch creates a new run and merges it
+    with the previous runs that are not longer than itself. Membership is
+    answered with one binary search per run. The set takes 8 bytes per distinct
+    row, and two different rows are mistaken for each other with probability
+    about n**2 / 2**65 for n rows.
+    """
+
+    def __init__(self):
+        self.runs = []
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    def contains(self, hashes):
+        """
+        Boolean mask of the hashes that were added before.
+        """
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            position = np.searchsorted(run, hashes).clip(max=len(run) - 1)
+            found |= run[position] == hashes
+        return found
+
+    def add(self, hashes):
+        """
+        Add an array of uint64 hashes to the set.
+        """
+        run = np.unique(hashes)
+        while self.runs and len(self.runs[-1]) <= len(run):
+            run = np.union1d(self.runs.pop(), run)
+        self.runs.append(run)
+
+
+def validate_csv_in_chunks(input_path, output_path, schema, names=None, chunksize=100_000,
+                           max_failure_cases=1000, report_path=None):
+    """
+    Validate a CSV file chunk by chunk and write the valid rows as they are checked.
+
+    Each chunk is validated with utils.fast_validation.validate, so row-wise
+    checks (ranges, nulls, dtypes, empty rows) behave as on the whole file.
+    Rows repeating a row of an earlier chunk are found through a RowHashSet of
+    the rows already seen, so duplicate rows are detected across chunk
+    boundaries while memory stays bounded by the chunk size plus 8 bytes per row.
+
+    The rows of chunks without failures are appended to a temporary file next to
+    output_path, which replaces output_path only if the whole file is valid. The
+    first max_failure_cases failure cases are kept in a report with the columns
+    of pandera's SchemaErrors.failure_cases, with row numbers counted from the
+    start of the file.
+
+    Parameters
+    ----------
+    input_path : str
+        Path of the CSV file to validate.
+    output_path : str
+        Path of the validated .csv or .parquet file to write.
+    schema : pandera.DataFrameSchema
+        Schema to validate against.
+    names : list of str, optional
+        Column names replacing the header of the file, by default the header is used.
+    chunksize : int, optional
+        Number of rows validated at once, by default 100_000.
+    max_failure_cases : int, optional
+        Maximum number of failure cases kept in the report, by default 1000.
+    report_path : str, optional
+        If given, the failure-case report is written there as CSV when the file
+        is invalid, and a report left there by an earlier run is removed first.
+
+    Returns
+    -------
+    int
+        Number of validated rows.
+
+    Raises
+    ------
+    ValueError
+        If chunksize is less than 1, or if the file fails validation. The message
+        gives the number of failure cases and the first of them.
+
+    Examples
+    --------
+    >>> validate_csv_in_chunks("raw.csv", "heart_validated.csv", schema, names=COLUMNS, chunksize=50_000)
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1.")
+    if report_path is not None and os.path.exists(report_path):
+        os.remove(report_path)
+
+    seen = RowHashSet()
+    report = []
+    n_failures = 0
+    n_rows = 0
+    partial_path = output_path + ".partial"
+    writer = TableWriter(partial_path, fmt=table_format(output_path))
+
+    read_kwargs = dict(names=names, header=0) if names is not None else dict()
+    try:
+        for chunk in pd.read_csv(input_path, chunksize=chunksize, **read_kwargs):
+            failure_cases = []
+            try:
+                validate(chunk, schema)
+            except SchemaErrors as exc:
+                failure_cases.append(exc.failure_cases[FAILURE_COLUMNS])
+
+            hashes = row_hashes(chunk)
+            repeated = seen.contains(hashes)
+            if repeated.any():
+                failure_cases.append(pd.DataFrame({
+                    "schema_context": "DataFrameSchema",
+                    "column": None,
+                    "check": "duplicate_rows_across_chunks",
+                    "check_number": None,
+                    "failure_case": hashes[repeated],
+                    "index": chunk.index[repeated],
+                }))
+            seen.add(hashes)
+            n_rows += len(chunk)
+
+            if failure_cases:
+                failure_cases = pd.concat(failure_cases, ignore_index=True)
+                if n_failures < max_failure_cases:
+                    report.append(failure_cases.head(max_failure_cases - n_failures))
+                n_failures += len(failure_cases)
+            elif not n_failures:
+                writer.write(chunk)
+    finally:
+        writer.close()
+
+    if n_failures:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        report = pd.concat(report, ignore_index=True)
+        if report_path is not None:
+            report.to_csv(report_path, index=False)
+        raise ValueError(
+            f"{n_failures} failure cases found in {n_rows} rows of {input_path}. "
+            f"First {len(report)}:\n{report}"
+        )
+    os.replace(partial_path, output_path)
+    return n_rows
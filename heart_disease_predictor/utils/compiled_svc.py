@@ -0,0 +1,360 @@
+import numpy as np
+from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder, OrdinalEncoder, StandardScaler
+from sklearn.svm import SVC
+
+
+def _category_codes(values, categories):
+    """
+    Index of every value in categories, or -1 for unknown values.
+
+    Values are compared in their own dtype, as the encoders do: numbers and
+    strings are promoted to a common dtype, so 1.5 or 'abc' never match the
+    category 1 or 'a', and other values are looked up as Python objects.
+    """
+    values = np.asarray(values)
+    numeric = values.dtype.kind in "biuf" and categories.dtype.kind in "biuf"
+    if not (numeric or values.dtype.kind == categories.dtype.kind == "U"):
+        lookup = {category: code for code, category in enumerate(categories.tolist())}
+        return np.array([lookup.get(value, -1) for value in values.tolist()], dtype=np.intp)
+
+    common = np.result_type(values.dtype, categories.dtype)
+    categories, values = categories.astype(common, copy=False), values.astype(common, copy=False)
+    sorter = np.argsort(categories, kind="stable")
+    position = np.searchsorted(categories, values, sorter=sorter).clip(max=len(categories) - 1)
+    codes = sorter[position]
+    known = categories[codes] == values
+    if common.kind == "f":
+        # NaN is a category of its own when the encoder saw it
+        known |= np.isnan(categories[codes]) & np.isnan(values)
+    codes[~known] = -1
+    return codes
+
+
+class CompiledSVC:
+    """
+    Self-contained NumPy kernel of a fitted ColumnTransformer + RBF SVC pipeline.
+
+    The preprocessing is folded into arrays computed once from the fitted
+    pipeline. Scaled and passthrough columns become a centre and an inverse
+    scale per column. Each one-hot or ordinal column becomes a lookup table
+    holding, for every category, its squared distance to every support vector
+    on the features that column produces. The squared distances to the support
+    vectors are then
+
+        ||x_s||**2 - 2 x_s @ sv.T + ||sv||**2 + sum of the table rows of x,
+
+    computed for blocks of rows with one matrix product each, followed by
+    exp(-gamma * d) @ dual_coef + intercept. When the categorical columns have
+    few combinations of categories, their tables are summed into one table
+    indexed by the combination, so each block needs a single lookup. Only NumPy is needed to score, and
+    the kernel can be saved to and loaded from a .npz file without pickle.
+
+    Use compile_svc_pipeline to build one from a fitted pipeline. It has the
+    decision_function, predict and classes_ of the pipeline, so it can replace it
+    in utils.batch_predict.score_chunk and the scoring service.
+
+    Parameters
+    ----------
+    numeric_columns : list of str
+        Scaled and passthrough input columns.
+    center, inv_scale : numpy.ndarray
+        Per numeric column, the value subtracted and the factor applied.
+    sv_numeric : numpy.ndarray
+        Support vectors restricted to the numeric features, of shape
+        (n_support, n_numeric).
+    categorical_columns : list of str
+        One-hot and ordinal input columns.
+    categories : list of numpy.ndarray
+        Known categories of each categorical column.
+    tables : list of numpy.ndarray
+        Per categorical column, the squared distances of shape
+        (n_categories + 1, n_support); the last row is for unknown categories.
+    allow_unknown : numpy.ndarray of bool
+        Per categorical column, whether unknown categories are accepted.
+    gamma : float
+        RBF kernel coefficient.
+    dual_coef : numpy.ndarray
+        Dual coefficients of the support vectors.
+    intercept : float
+        Intercept of the decision function.
+    classes : numpy.ndarray
+        The two classes; a positive decision means classes[1].
+    """
+
+    def __init__(self, numeric_columns, center, inv_scale, sv_numeric, categorical_columns,
+                 categories, tables, allow_unknown, gamma, dual_coef, intercept, classes):
+        self.numeric_columns = list(numeric_columns)
+        self.center = center
+        self.inv_scale = inv_scale
+        self.sv_numeric = sv_numeric
+        self.categorical_columns = list(categorical_columns)
+        self.categories = list(categories)
+        self.tables = list(tables)
+        self.allow_unknown = np.asarray(allow_unknown, dtype=bool)
+        self.gamma = float(gamma)
+        self.dual_coef = dual_coef
+        self.intercept = float(intercept)
+        self.classes_ = classes
+        self._sv_sqnorm = np.einsum("ij,ij->i", sv_numeric, sv_numeric)
+        # With few categorical columns, all their tables are summed into one table
+        # over every combination of categories, so that each block needs one gather.
+        self._table_shape = tuple(len(table) for table in self.tables)
+        self._joint_table = None
+        if self.tables and np.prod(self._table_shape) <= 4096:
+            joint = np.zeros(self._table_shape + (len(dual_coef),))
+            for i, table in enumerate(self.tables):
+                joint += table.reshape((1,) * i + (len(table),) + (1,) * (len(self.tables) - i - 1) + (-1,))
+            self._joint_table = joint.reshape(-1, len(dual_coef))
+
+    def _numeric_block(self, X):
+        """Centred and scaled numeric features of shape (n_samples, n_numeric)."""
+        Xs = np.column_stack([np.asarray(X[col], dtype=np.float64) for col in self.numeric_columns]) \
+            if self.numeric_columns else np.zeros((len(X), 0))
+        if np.isnan(Xs).any():
+            raise ValueError("Input X contains NaN.")
+        Xs -= self.center
+        Xs *= self.inv_scale
+        return Xs
+
+    def decision_function(self, X, block_size=4096):
+        """
+        Signed distance to the separating hyperplane, as SVC.decision_function.
+
+        Parameters
+        ----------
+        X : pandas.DataFrame or dict of array-like
+            Raw input rows with (at least) the columns used by the pipeline.
+        block_size : int, optional
+            Number of rows whose kernel row is computed at once, by default 4096.
+            Peak memory is about block_size * n_support * 8 bytes.
+
+        Returns
+        -------
+        numpy.ndarray
+            Decision values of shape (n_samples,).
+
+        Raises
+        ------
+        ValueError
+            If X contains NaN or categories the encoders did not see while
+            fitting (unless the one-hot encoder ignores unknown categories).
+        """
+        Xs = self._numeric_block(X)
+        codes = []
+        for col, categories, allow_unknown in zip(self.categorical_columns, self.categories, self.allow_unknown):
+            col_codes = _category_codes(X[col], categories)
+            if (col_codes < 0).any():
+                if not allow_unknown:
+                    raise ValueError(f"Found unknown categories in column '{col}' during transform.")
+                col_codes[col_codes < 0] = len(categories)
+            codes.append(col_codes)
+        if self._joint_table is not None:
+            codes = [np.ravel_multi_index(codes, self._table_shape)]
+            tables = [self._joint_table]
+        else:
+            tables = self.tables
+
+        decision = np.empty(len(Xs))
+        for start in range(0, len(Xs), block_size):
+            stop = start + block_size
+            block = Xs[start:stop]
+            d2 = block @ self.sv_numeric.T
+            d2 *= -2.0
+            d2 += np.einsum("ij,ij->i", block, block)[:, None]
+            d2 += self._sv_sqnorm
+            for table, col_codes in zip(tables, codes):
+                d2 += table[col_codes[start:stop]]
+            np.maximum(d2, 0.0, out=d2)
+            d2 *= -self.gamma
+            np.exp(d2, out=d2)
+            decision[start:stop] = d2 @ self.dual_coef
+        decision += self.intercept
+        return decision
+
+    def predict(self, X, block_size=4096):
+        """
+        Predicted class of every row, as SVC.predict.
+
+        Parameters
+        ----------
+        X : pandas.DataFrame or dict of array-like
+            Raw input rows with (at least) the columns used by the pipeline.
+        block_size : int, optional
+            Number of rows whose kernel row is computed at once, by default 4096.
+
+        Returns
+        -------
+        numpy.ndarray
+            Predicted classes of shape (n_samples,).
+        """
+        return self.classes_[(self.decision_function(X, block_size) > 0).astype(int)]
+
+    def save(self, path):
+        """
+        Save the kernel arrays to a .npz file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the .npz file.
+        """
+        arrays = dict(
+            numeric_columns=np.array(self.numeric_columns, dtype=str),
+            center=self.center,
+            inv_scale=self.inv_scale,
+            sv_numeric=self.sv_numeric,
+            categorical_columns=np.array(self.categorical_columns, dtype=str),
+            allow_unknown=self.allow_unknown,
+            gamma=np.array(self.gamma),
+            dual_coef=self.dual_coef,
+            intercept=np.array(self.intercept),
+            classes=np.asarray(self.classes_).astype(str),
+        )
+        for i, (categories, table) in enumerate(zip(self.categories, self.tables)):
+            arrays[f"categories_{i}"] = categories
+            arrays[f"table_{i}"] = table
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a kernel saved with save.
+
+        Parameters
+        ----------
+        path : str
+            Path of the .npz file.
+
+        Returns
+        -------
+        CompiledSVC
+            The loaded kernel.
+        """
+        with np.load(path, allow_pickle=False) as arrays:
+            n_categorical = len(arrays["categorical_columns"])
+            return cls(
+                numeric_columns=arrays["numeric_columns"].tolist(),
+                center=arrays["center"],
+                inv_scale=arrays["inv_scale"],
+                sv_numeric=arrays["sv_numeric"],
+                categorical_columns=arrays["categorical_columns"].tolist(),
+                categories=[arrays[f"categories_{i}"] for i in range(n_categorical)],
+                tables=[arrays[f"table_{i}"] for i in range(n_categorical)],
+                allow_unknown=arrays["allow_unknown"],
+                gamma=arrays["gamma"],
+                dual_coef=arrays["dual_coef"],
+                intercept=arrays["intercept"],
+                classes=arrays["classes"].astype(object),
+            )
+
+
+def _is_passthrough(transformer):
+    """Whether a fitted ColumnTransformer entry copies its columns unchanged."""
+    return transformer == "passthrough" or (
+        isinstance(transformer, FunctionTransformer)
+        and transformer.func is None
+        and transformer.inverse_func is None
+    )
+
+
+def compile_svc_pipeline(pipeline):
+    """
+    Compile a fitted ColumnTransformer + RBF SVC pipeline into a CompiledSVC.
+
+    Supported steps are StandardScaler, OneHotEncoder (without dropped
+    categories), OrdinalEncoder, passthrough and dropped columns, followed by a
+    binary SVC with the RBF kernel, which is how the final model is built.
+
+    Parameters
+    ----------
+    pipeline : sklearn.pipeline.Pipeline
+        Fitted pipeline of a ColumnTransformer and an SVC.
+
+    Returns
+    -------
+    CompiledSVC
+        The compiled kernel.
+
+    Raises
+    ------
+    ValueError
+        If the pipeline has a step or setting the kernel does not support.
+
+    Examples
+    --------
+    >>> compiled = compile_svc_pipeline(final_model)
+    >>> compiled.decision_function(test_df)
+    """
+    if len(pipeline) != 2 or not isinstance(pipeline[0], ColumnTransformer) or not isinstance(pipeline[-1], SVC):
+        raise ValueError("Only a pipeline of a ColumnTransformer followed by an SVC can be compiled.")
+    preprocessor, svc = pipeline[0], pipeline[-1]
+    if svc.kernel != "rbf" or len(svc.classes_) != 2:
+        raise ValueError("Only binary SVCs with the RBF kernel can be compiled.")
+
+    support_vectors = np.asarray(svc.support_vectors_, dtype=np.float64)
+    numeric_columns, center, inv_scale, numeric_features = [], [], [], []
+    categorical_columns, categories, tables, allow_unknown = [], [], [], []
+    feature = 0
+
+    def add_lookup(col, col_categories, feature_values, unknown_values, unknown_allowed, n_features):
+        # Squared distance between each category's encoded features and each support vector
+        sv = support_vectors[:, feature:feature + n_features]
+        encoded = np.vstack([feature_values, unknown_values])
+        table = ((encoded[:, None, :] - sv[None, :, :]) ** 2).sum(axis=2)
+        categorical_columns.append(col)
+        col_categories = np.asarray(col_categories)
+        if col_categories.dtype == object and all(isinstance(value, str) for value in col_categories):
+            # String categories are kept as a str array, which saves without pickle
+            col_categories = col_categories.astype(str)
+        categories.append(col_categories)
+        tables.append(table)
+        allow_unknown.append(unknown_allowed)
+
+    for name, transformer, columns in preprocessor.transformers_:
+        if transformer == "drop" or len(columns) == 0:
+            continue
+        if isinstance(transformer, StandardScaler) or _is_passthrough(transformer):
+            n = len(columns)
+            mean = getattr(transformer, "mean_", None)
+            scale = getattr(transformer, "scale_", None)
+            numeric_columns.extend(columns)
+            center.append(np.zeros(n) if mean is None else mean)
+            inv_scale.append(np.ones(n) if scale is None else 1.0 / scale)
+            numeric_features.extend(range(feature, feature + n))
+            feature += n
+        elif isinstance(transformer, OneHotEncoder):
+            if transformer.drop is not None or getattr(transformer, "_infrequent_enabled", False):
+                raise ValueError("One-hot encoders with dropped or infrequent categories cannot be compiled.")
+            for col, col_categories in zip(columns, transformer.categories_):
+                n = len(col_categories)
+                add_lookup(col, col_categories, np.eye(n), np.zeros((1, n)),
+                           transformer.handle_unknown != "error", n)
+                feature += n
+        elif isinstance(transformer, OrdinalEncoder):
+            if transformer.handle_unknown != "error":
+                raise ValueError("Only ordinal encoders raising on unknown categories can be compiled.")
+            for col, col_categories in zip(columns, transformer.categories_):
+                codes = np.arange(len(col_categories), dtype=np.float64)[:, None]
+                add_lookup(col, col_categories, codes, np.full((1, 1), np.nan), False, 1)
+                feature += 1
+        else:
+            raise ValueError(f"Transformer '{name}' of type {type(transformer).__name__} cannot be compiled.")
+
+    if feature != support_vectors.shape[1]:
+        raise ValueError("The preprocessor output does not match the features of the SVC.")
+
+    return CompiledSVC(
+        numeric_columns=numeric_columns,
+        center=np.concatenate(center) if center else np.zeros(0),
+        inv_scale=np.concatenate(inv_scale) if inv_scale else np.zeros(0),
+        sv_numeric=np.ascontiguousarray(support_vectors[:, numeric_features]),
+        categorical_columns=categorical_columns,
+        categories=categories,
+        tables=tables,
+        allow_unknown=allow_unknown,
+        gamma=svc._gamma,
+        dual_coef=np.ascontiguousarray(svc.dual_coef_[0], dtype=np.float64),
+        intercept=svc.intercept_[0],
+        classes=svc.classes_,
+    )
@@ -0,0 +1,8 @@
+# File formats of the pipeline. This module imports nothing, so that the click
+# options of the scripts can offer these choices without loading pandas or altair.
+
+# File formats of the data handed from one pipeline stage to the next
+TABLE_FORMATS = ("csv", "parquet")
+
+# Output formats of render_charts; png and svg are rasterized or drawn by vl-convert
+CHART_FORMATS = ("png", "svg", "html")
@@ -0,0 +1,417 @@
+import math
+
+import numpy as np
+import pandas as pd
+import altair as alt
+
+from heart_disease_predictor.utils.table_io import read_table
+
+
+def load_data(path):
+    """
+    Load a CSV or Parquet dataset.
+
+    Parameters
+    ----------
+    path : str
+        Path to the .csv or .parquet file.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Loaded dataset.
+    """
+    return read_table(path)
+
+
+def compute_summary_statistics(df, chunksize=None, n_jobs=1):
+    """
+    Compute summary statistics for any dataset.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Input dataset.
+    chunksize : int, optional
+        If given, the statistics are accumulated in one pass over chunks of
+        this many rows with utils.streaming_stats, with approximate quantiles,
+        unique counts and top values on large data; by default they are
+        computed exactly by pandas.
+    n_jobs : int, optional
+        Number of worker processes summarizing chunks, by default 1.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Summary statistics including numerical and categorical features.
+    """
+    if chunksize is None:
+        return df.describe(include="all")
+    from heart_disease_predictor.utils.streaming_stats import summarize_chunks
+    return summarize_chunks((df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize)), n_jobs)
+
+
+def histogram_table(values, maxbins=30):
+    """
+    Count values in the bins Vega-Lite would choose for bin=alt.Bin(maxbins=maxbins).
+
+    The bins follow the Vega bin algorithm: a step of 1, 2 or 5 times a power
+    of ten giving at most maxbins bins, with the first and last edges rounded
+    out to multiples of the step.
+
+    Parameters
+    ----------
+    values : array-like
+        Numerical values; missing values are ignored.
+    maxbins : int, optional
+        Largest number of bins, by default 30.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per bin with its bin_start, bin_end and count.
+    """
+    values = pd.Series(values, dtype=float).dropna().to_numpy()
+    if len(values) == 0:
+        return pd.DataFrame({"bin_start": [], "bin_end": [], "count": []})
+    low, high = float(values.min()), float(values.max())
+    span = (high - low) or abs(low) or 1.0
+    step = 10.0 ** (math.floor(math.log10(span) + 0.5) - math.ceil(math.log10(maxbins)))
+    while math.ceil(span / step) > maxbins:
+        step *= 10
+    for divide in (5, 2):
+        if span / (step / divide) <= maxbins:
+            step /= divide
+    precision = 0 if step >= 1 else int(-math.log10(step)) + 1
+    start = math.floor(low / step + 10.0 ** (-precision - 1)) * step
+    start = start - step if low < start else start
+    stop = math.ceil(high / step) * step
+    n_bins = max(1, round((stop - start) / step))
+
+    counts, edges = np.histogram(values, bins=n_bins, range=(start, start + n_bins * step))
+    edges = np.round(edges, precision)
+    return pd.DataFrame({"bin_start": edges[:-1], "bin_end": edges[1:], "count": counts})
+
+
+def boxplot_summary(df, col, by):
+    """
+    Five-number summary of a column per group, as drawn by a Vega-Lite boxplot.
+
+    Quartiles use linear interpolation like Vega's, and the whiskers reach the
+    most extreme values within 1.5 interquartile ranges of the box.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataset containing col and by.
+    col : str
+        Numerical column.
+    by : str
+        Column whose values define the groups.
+
+    Returns
+    -------
+    tuple of (pandas.DataFrame, pandas.DataFrame)
+        - One row per group with lower, q1, median, q3 and upper.
+        - The distinct values beyond the whiskers of every group.
+    """
+    summaries, outliers = [], []
+    for group, values in df.groupby(by, sort=True, observed=True)[col]:
+        values = values.dropna().to_numpy(dtype=float)
+        if len(values) == 0:
+            continue
+        q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+        low_fence, high_fence = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        inside = values[(values >= low_fence) & (values <= high_fence)]
+        summaries.append({by: group, "lower": inside.min(), "q1": q1, "median": median, "q3": q3,
+                          "upper": inside.max()})
+        beyond = np.unique(values[(values < low_fence) | (values > high_fence)])
+        outliers.append(pd.DataFrame({by: group, col: beyond}))
+    summary = pd.DataFrame(summaries, columns=[by, "lower", "q1", "median", "q3", "upper"])
+    outliers = pd.concat(outliers, ignore_index=True) if outliers else pd.DataFrame(columns=[by, col])
+    return summary, outliers
+
+
+def plot_target_distribution(df, target_col):
+    """
+    Generate a bar chart showing counts of each category in the target column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataset containing the target column.
+    target_col : str
+        Name of the target column.
+
+    Returns
+    -------
+    alt.Chart
+        Bar chart with labels.
+    """
+    counts = df.groupby(target_col).size().reset_index(name="count")
+
+    bar = (alt.Chart(counts)
+        .mark_bar()
+        .encode(
+            x=alt.X(
+                "count:Q",
+                title="Count",
+                axis=alt.Axis(labelFontSize=18, titleFontSize=20)),
+            y=alt.Y(f"{target_col}:N",
+                title=target_col.title(),
+                axis=alt.Axis(labelFontSize=18, titleFontSize=20)),
+            color=alt.Color(
+                f"{target_col}:N",
+                title=target_col.title(),
+                legend=alt.Legend(labelFontSize=18, titleFontSize=20)),
+            tooltip=[alt.Tooltip("count:Q", title="Count")])
+        .properties(
+            title=alt.TitleParams(
+                text=f"DISTRIBUTION OF {target_col.upper()}",
+                fontSize=24),
+            width=500,
+            height=400)
+    )
+
+    bar_labels = bar.mark_text(
+        dx=20,  
+        dy=-20,  
+        fontSize=18
+    ).encode(
+        text="count:Q")
+    return bar + bar_labels
+    
+
+def plot_numerical_distributions(df, num_cols):
+    """
+    Generate histograms for numerical features.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataset containing numerical features.
+    num_cols : list of str
+        List of numerical column names.
+
+    Returns
+    -------
+    alt.VConcatChart
+        Faceted vertical concatenation of histograms.
+    """
+    charts = []
+
+    for col in num_cols:
+        col_title = col.replace("_", " ").title()
+
+        # Only the bin counts are embedded in the spec, whatever the number of rows
+        bins = histogram_table(df[col], maxbins=30).rename(columns={"bin_start": col})
+
+        chart = (alt.Chart(bins)
+            .mark_bar()
+            .encode(
+                x=alt.X(col + ":Q",  
+                    bin="binned",
+                    title=col_title,
+                    axis=alt.Axis(labelFontSize=18, titleFontSize=20)),
+                x2="bin_end:Q",
+                y=alt.Y("count:Q",
+                    title="Count",
+                    axis=alt.Axis(labelFontSize=18, titleFontSize=20)),
+                tooltip=[alt.Tooltip(col + ":Q", title=f"{col_title} from"),
+                    alt.Tooltip("bin_end:Q", title="to"),
+                    alt.Tooltip("count:Q", title="Count")],)
+            .properties(title=alt.TitleParams(
+                    text=f"DISTRIBUTION OF {col_title.upper()}",
+                    fontSize=24),
+                width=500,
+                height=400))
+        charts.append(chart)
+
+    rows = [alt.hconcat(*charts[i:i+2]) for i in range(0, len(charts), 2)]
+
+    return alt.vconcat(*rows).configure_legend(
+        orient="top",
+        labelFontSize=18,
+        titleFontSize=20)
+
+
+def plot_boxplots(df, num_cols, target_col):
+    """
+    Create boxplots showing numerical features vs a target column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataset containing numerical and target features.
+    num_cols : list of str
+        List of numerical column names.
+    target_col : str
+        Name of the target column.
+
+    Returns
+    -------
+    alt.VConcatChart
+        Boxplots arranged as vertical concatenation.
+    """
+    charts = []
+
+    target_title = target_col.replace("_", " ").title()
+
+    # The target is grouped on once per column, so it is only factorized once
+    df = df[list(num_cols)].assign(**{target_col: df[target_col].astype("category")})
+
+    for col in num_cols:
+        col_title = col.replace("_", " ").title()
+
+        # The boxes are drawn from per-class summaries instead of every row
+        summary, outliers = boxplot_summary(df, col, target_col)
+        y = alt.Y(f"{target_col}:N",
+            title=target_title,
+            axis=alt.Axis(labelFontSize=18, titleFontSize=20))
+        color = alt.Color(
+            f"{target_col}:N",
+            title=target_title,
+            legend=alt.Legend(labelFontSize=18, titleFontSize=20))
+        x = alt.X(
+            "lower:Q",
+            title=col_title,
+            axis=alt.Axis(labelFontSize=18, titleFontSize=20))
+
+        base = alt.Chart(summary).encode(y=y)
+        whiskers = base.mark_rule(color="black").encode(x=x, x2="upper:Q")
+        boxes = base.mark_bar(size=20).encode(
+            x="q1:Q",
+            x2="q3:Q",
+            color=color,
+            tooltip=[alt.Tooltip(f"{stat}:Q", title=stat.title()) for stat in
+                     ["lower", "q1", "median", "q3", "upper"]])
+        medians = base.mark_tick(color="white", size=20).encode(x="median:Q")
+        outlier_points = alt.Chart(outliers).mark_point().encode(x=f"{col}:Q", y=y, color=color)
+
+        chart = (alt.layer(whiskers, boxes, medians, outlier_points)
+            .properties(title=alt.TitleParams(
+                    text=f"{col_title.upper()} VS {target_title.upper()}",
+                    fontSize=24),
+                width=400,
+                height=350))
+        
+        charts.append(chart)
+
+    rows = [alt.hconcat(*charts[i:i+2]) for i in range(0, len(charts), 2)]
+
+    return alt.vconcat(*rows).configure_legend(
+        orient="top",
+        labelFontSize=18,
+        titleFontSize=20)
+
+
+def plot_categorical_vs_target(df, cat_cols, target_col, axis_titles=None):
+    """
+    Create bar charts showing categorical features vs target column.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataset containing categorical features.
+    cat_cols : list of str
+        List of categorical column names.
+    target_col : str
+        Name of the target column.
+    axis_titles : dict, optional
+        Mapping of column names to axis labels.
+
+    Returns
+    -------
+    alt.VConcatChart
+        Vertical stack of bar charts.
+    """
+    charts = []
+
+    target_title = target_col.replace("_", " ").title()
+
+    # The target is grouped on once per column, so it is only factorized once
+    df = df[list(cat_cols)].assign(**{target_col: df[target_col].astype("category")})
+
+    for col in cat_cols:
+        col_title = axis_titles[col] if axis_titles and col in axis_titles else col.replace("_", " ").title()
+
+        # Counts per category and class, computed once instead of per rendered row
+        counts = df.groupby([col, target_col], observed=True).size().reset_index(name="count")
+
+        chart = (alt.Chart(counts)
+            .mark_bar(size=30)
+            .encode(x=alt.X(
+                    f"{col}:N",
+                    title=col_title,
+                    scale=alt.Scale(paddingInner=0.5, paddingOuter=0.5),
+                    axis=alt.Axis(labelFontSize=18, titleFontSize=20)),
+                xOffset=f"{target_col}:N",
+                y=alt.Y("count:Q",
+                    title="Count",
+                    axis=alt.Axis(labelFontSize=16, titleFontSize=18)),
+                color=alt.Color(
+                    f"{target_col}:N",
+                    title=target_title,
+                    legend=alt.Legend(labelFontSize=16, titleFontSize=18)),
+                tooltip=[alt.Tooltip("count:Q", title="Count")])
+            .properties(
+                title=alt.TitleParams(
+                    text=f"{col_title.upper()} VS {target_title.upper()}",
+                    fontSize=24),
+                width=400,
+                height=350))
+        charts.append(chart)
+
+    rows = [alt.hconcat(*charts[i:i+2]) for i in range(0, len(charts), 2)]
+
+    return alt.vconcat(*rows).configure_legend(
+        orient="top",
+        labelFontSize=18,
+        titleFontSize=20)
+
+
+def plot_correlation_heatmap(df, num_cols, cat_cols, target_col, method="pearson", chunksize=100_000):
+    """
+    Generate a correlation heatmap for numerical and categorical features with the target.
+
+    The correlation matrix is accumulated over row chunks of df by
+    utils.streaming_stats.correlate_chunks, without copying df; a
+    non-numerical target is coded in order of appearance, as pandas.factorize does.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataset containing numerical, categorical, and target features.
+    num_cols : list of str
+        List of numerical feature column names.
+    cat_cols : list of str
+        List of categorical feature column names.
+    target_col : str
+        Name of the target column.
+    method : str, optional
+        'pearson' or 'spearman', by default 'pearson'.
+    chunksize : int, optional
+        Rows per chunk, by default 100000.
+
+    Returns
+    -------
+    alt.Chart
+        Correlation heatmap chart.
+    """
+    from heart_disease_predictor.utils.streaming_stats import correlate_chunks
+
+    corr_matrix = correlate_chunks(lambda: (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize)),
+                                   list(num_cols) + list(cat_cols) + [target_col], method)
+    corr_long = corr_matrix.reset_index().melt(id_vars='index')
+    corr_long.columns = ['feature_x', 'feature_y', 'correlation']
+
+    base = alt.Chart(corr_long).encode(
+        x=alt.X('feature_x:N', title='Feature'),
+        y=alt.Y('feature_y:N', title='Feature'))
+    heatmap = base.mark_rect().encode(
+        color=alt.Color('correlation:Q', scale=alt.Scale(scheme='redblue', domain=[-1,1])),
+        tooltip=['feature_x', 'feature_y', 'correlation'])
+    text = base.mark_text(fontSize=12, color='black').encode(
+        text=alt.Text('correlation:Q', format='.2f'))
+
+    return (heatmap + text).properties(title='Correlation Heatmap', width=600, height=600)
\ No newline at end of file
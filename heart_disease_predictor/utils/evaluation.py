@@ -0,0 +1,199 @@
+import numpy as np
+from sklearn.metrics import roc_curve, precision_recall_curve, auc, average_precision_score
+
+# Order of the cells of a binary confusion matrix in the count arrays below
+COUNT_NAMES = ("tn", "fp", "fn", "tp")
+
+
+def positive_scores(model, X, pos_label):
+    """
+    Scores of the positive class from a single inference pass, and the
+    predictions implied by them.
+
+    Parameters
+    ----------
+    model :
+        Fitted binary classifier with decision_function or predict_proba
+    X : pandas.DataFrame
+        Rows to score
+    pos_label : str or int
+        Positive class label
+
+    Returns
+    -------
+    tuple of (numpy.ndarray, numpy.ndarray)
+        Scores that grow with the confidence in pos_label, and the predicted
+        labels, equal to model.predict(X) for classifiers that predict the
+        class with the positive decision value or the highest probability
+    """
+    classes = np.asarray(model.classes_)
+    if len(classes) != 2 or pos_label not in classes:
+        raise ValueError(f"pos_label {pos_label!r} is not one of the two classes {list(classes)}")
+    pos_index = int(np.flatnonzero(classes == pos_label)[0])
+    if hasattr(model, "decision_function"):
+        decision = np.asarray(model.decision_function(X), dtype=np.float64)
+        y_pred = classes[(decision > 0).astype(int)]
+        scores = decision if pos_index == 1 else -decision
+    else:
+        proba = np.asarray(model.predict_proba(X), dtype=np.float64)
+        y_pred = classes[np.argmax(proba, axis=1)]
+        scores = proba[:, pos_index]
+    return scores, y_pred
+
+
+def confusion_codes(y_true, y_pred, pos_label):
+    """
+    Cell of the binary confusion matrix of every sample, as an index into COUNT_NAMES.
+
+    Returns
+    -------
+    numpy.ndarray
+        2 * (y_true == pos_label) + (y_pred == pos_label) per sample
+    """
+    return 2 * (np.asarray(y_true) == pos_label) + (np.asarray(y_pred) == pos_label)
+
+
+def confusion_counts(codes):
+    """
+    Accumulate the confusion matrix counts of the codes of confusion_codes.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        Codes of shape (n_samples,) or (n_resamples, n_samples)
+
+    Returns
+    -------
+    numpy.ndarray
+        Counts of tn, fp, fn and tp along the last axis
+    """
+    codes = np.asarray(codes)
+    if codes.ndim == 1:
+        return np.bincount(codes, minlength=4)
+    offsets = 4 * np.arange(codes.shape[0])[:, None]
+    return np.bincount((codes + offsets).ravel(), minlength=4 * codes.shape[0]).reshape(-1, 4)
+
+
+def _ratio(numerator, denominator):
+    """numerator / denominator, or 0 where the denominator is 0 like sklearn's zero_division."""
+    numerator, denominator = np.asarray(numerator, dtype=np.float64), np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros(np.broadcast(numerator, denominator).shape),
+                     where=denominator != 0)
+
+
+def metrics_from_counts(counts, betas=(0.5, 1.0, 2.0)):
+    """
+    Classification metrics from confusion matrix counts.
+
+    Parameters
+    ----------
+    counts : array-like
+        Counts of tn, fp, fn and tp along the last axis, for one or many
+        (re)samples
+    betas : tuple of float, optional
+        Beta values of the F-beta scores, by default (0.5, 1.0, 2.0)
+
+    Returns
+    -------
+    dict
+        accuracy, precision, recall, specificity and 'f<beta>' (e.g. 'f2')
+        as floats, or arrays with one value per sample of counts
+    """
+    tn, fp, fn, tp = np.moveaxis(np.asarray(counts, dtype=np.float64), -1, 0)
+    metrics = {
+        "accuracy": _ratio(tp + tn, tp + tn + fp + fn),
+        "precision": _ratio(tp, tp + fp),
+        "recall": _ratio(tp, tp + fn),
+        "specificity": _ratio(tn, tn + fp),
+    }
+    for beta in betas:
+        # Same expression as sklearn's fbeta_score, computed from the counts
+        metrics[f"f{beta:g}"] = _ratio((1 + beta ** 2) * tp, (1 + beta ** 2) * tp + beta ** 2 * fn + fp)
+    return {name: value if np.ndim(value) else float(value) for name, value in metrics.items()}
+
+
+def _plain(value):
+    """Convert NumPy scalars such as integer labels to the Python values JSON can hold."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _finite_list(values):
+    """Convert an array to a list, with None for the infinite thresholds JSON cannot hold."""
+    return [float(value) if np.isfinite(value) else None for value in np.asarray(values, dtype=np.float64)]
+
+
+def evaluate_predictions(y_true, y_pred, scores, labels, pos_label, betas=(0.5, 1.0, 2.0)):
+    """
+    Compute the full set of test metrics from stored predictions and scores.
+
+    Parameters
+    ----------
+    y_true : array-like
+        True labels
+    y_pred : array-like
+        Predicted labels
+    scores : array-like
+        Scores of the positive class, e.g. from positive_scores
+    labels : list
+        The negative and the positive label, in that order
+    pos_label : str or int
+        Positive class label
+    betas : tuple of float, optional
+        Beta values of the F-beta scores, by default (0.5, 1.0, 2.0)
+
+    Returns
+    -------
+    dict
+        JSON-serializable report with the confusion matrix, the metrics and
+        the ROC and precision-recall curves; confidence intervals of the
+        metrics come from heart_disease_predictor.utils.bootstrap
+    """
+    codes = confusion_codes(y_true, y_pred, pos_label)
+    counts = confusion_counts(codes)
+    y_pos = np.asarray(y_true) == pos_label
+    fpr, tpr, roc_thresholds = roc_curve(y_pos, scores)
+    precision, recall, pr_thresholds = precision_recall_curve(y_pos, scores)
+
+    report = {
+        "pos_label": _plain(pos_label),
+        "n_samples": int(len(codes)),
+        "confusion_matrix": {
+            "labels": [_plain(label) for label in labels],
+            "matrix": counts.reshape(2, 2).tolist(),
+            **{name: int(count) for name, count in zip(COUNT_NAMES, counts)},
+        },
+        "metrics": metrics_from_counts(counts, betas),
+        "roc": {"auc": float(auc(fpr, tpr)), "fpr": _finite_list(fpr), "tpr": _finite_list(tpr),
+                "thresholds": _finite_list(roc_thresholds)},
+        "pr": {"average_precision": float(average_precision_score(y_pos, scores)),
+               "precision": _finite_list(precision), "recall": _finite_list(recall),
+               "thresholds": _finite_list(pr_thresholds)},
+    }
+    return report
+
+
+def evaluate_model(model, X, y, pos_label, betas=(0.5, 1.0, 2.0)):
+    """
+    Run inference once and evaluate a binary classifier on test data.
+
+    Parameters
+    ----------
+    model :
+        Fitted binary classifier
+    X : pandas.DataFrame
+        Test features
+    y : pandas.Series
+        Test labels
+    pos_label : str or int
+        Positive class label
+    betas : tuple of float, optional
+        Beta values of the F-beta scores, by default (0.5, 1.0, 2.0)
+
+    Returns
+    -------
+    tuple of (dict, numpy.ndarray)
+        The report of evaluate_predictions and the predicted labels
+    """
+    scores, y_pred = positive_scores(model, X, pos_label)
+    labels = [label for label in model.classes_ if label != pos_label] + [pos_label]
+    return evaluate_predictions(y, y_pred, scores, labels, pos_label, betas), y_pred
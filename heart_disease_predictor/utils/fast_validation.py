@@ -0,0 +1,207 @@
+import numpy as np
+import pandas as pd
+from pandera.errors import SchemaErrors
+
+
+# Built-in Pandera checks that can be evaluated with a single NumPy expression.
+# Each function takes the column values and the check statistics and returns
+# the boolean mask of values passing the check.
+def _in_range(values, stats):
+    lower = values >= stats["min_value"] if stats["include_min"] else values > stats["min_value"]
+    upper = values <= stats["max_value"] if stats["include_max"] else values < stats["max_value"]
+    return lower & upper
+
+
+_VECTORIZED_CHECKS = {
+    "in_range": _in_range,
+    "greater_than": lambda values, stats: values > stats["min_value"],
+    "greater_than_or_equal_to": lambda values, stats: values >= stats["min_value"],
+    "less_than": lambda values, stats: values < stats["max_value"],
+    "less_than_or_equal_to": lambda values, stats: values <= stats["max_value"],
+    "equal_to": lambda values, stats: values == stats["value"],
+    "not_equal_to": lambda values, stats: values != stats["value"],
+    "isin": lambda values, stats: np.isin(values, list(stats["allowed_values"])),
+    "notin": lambda values, stats: ~np.isin(values, list(stats["forbidden_values"])),
+}
+
+
+# Odd 64-bit constant used to mix column values into row hashes
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _column_bits(series):
+    """
+    Represent the values of a column as uint64 so that equal values get equal bits.
+
+    Numeric values are compared as float64, so that an integer column that was
+    read as float because of missing values still hashes like the integer one.
+    -0.0 is folded into 0.0 and all NaNs share one bit pattern. Other columns are
+    hashed by pandas.
+    """
+    values = series.to_numpy()
+    if values.dtype.kind in "iuf":
+        values = values.astype(np.float64) + 0.0
+        values[np.isnan(values)] = np.nan
+        return values.view(np.uint64)
+    return pd.util.hash_array(values)
+
+
+def row_hashes(df):
+    """
+    Hash every row of a DataFrame into one unsigned 64-bit integer.
+
+    Columns are mixed in one vectorized pass each, which is several times faster
+    than pandas.util.hash_pandas_object on the numeric heart data. Hashes only
+    depend on the values, so rows of different chunks of one file can be compared
+    through them.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Rows to hash. The index is not part of the hash.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of uint64 row hashes, one per row of df.
+    """
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for name in df.columns:
+            hashes ^= _column_bits(df[name])
+            hashes *= _HASH_MULTIPLIER
+            hashes ^= hashes >> np.uint64(29)
+    return hashes
+
+
+def duplicated_rows(df):
+    """
+    Flag rows that repeat an earlier row, like DataFrame.duplicated().
+
+    Rows are first compared through their 64-bit hash, found by sorting the
+    hashes, which is much cheaper than comparing every column. Only the rows
+    whose hash occurs more than once are then compared column by column, so hash
+    collisions never create false duplicates.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Rows to check.
+
+    Returns
+    -------
+    pandas.Series
+        Boolean Series aligned with df, True for every repeated row after its
+        first occurrence.
+    """
+    hashes = row_hashes(df)
+    ordered = np.sort(hashes)
+    repeated = ordered[1:][ordered[1:] == ordered[:-1]]
+    duplicated = np.zeros(len(df), dtype=bool)
+    if len(repeated):
+        candidates = np.isin(hashes, repeated)
+        duplicated[candidates] = df[candidates].duplicated().to_numpy()
+    return pd.Series(duplicated, index=df.index)
+
+
+def _is_vectorizable(column, series):
+    """Whether every check of the column can be run as a NumPy expression on series."""
+    return (
+        pd.api.types.is_numeric_dtype(series.dtype)
+        and not pd.api.types.is_bool_dtype(series.dtype)
+        and all(
+            check.name in _VECTORIZED_CHECKS and not check.element_wise and check.ignore_na
+            for check in column.checks
+        )
+    )
+
+
+def _column_passes(column, series):
+    """
+    Whether a column passes its nullable, dtype and value checks, computed with NumPy.
+
+    Checks declared with raise_warning count too, so that their warning is
+    emitted by Pandera when the column is validated again.
+    """
+    isna = series.isna().to_numpy()
+    if not column.nullable and isna.any():
+        return False
+    if column.dtype is not None and str(column.dtype) != str(series.dtype):
+        return False
+    values = series.to_numpy()
+    for check in column.checks:
+        with np.errstate(invalid="ignore"):
+            if not (_VECTORIZED_CHECKS[check.name](values, check.statistics) | isna).all():
+                return False
+    return True
+
+
+def _pandera_errors(schema, df):
+    """Validate df with Pandera itself and return the collected SchemaErrors."""
+    try:
+        schema.validate(df, lazy=True)
+    except SchemaErrors as exc:
+        return exc.schema_errors
+    return []
+
+
+def validate(df, schema):
+    """
+    Validate a DataFrame against a Pandera DataFrameSchema with vectorized checks.
+
+    Nullability, dtype and the built-in range, comparison and membership checks
+    of every numeric column are compiled into NumPy expressions over the whole
+    column, and the DataFrame-wide checks are called directly. Columns with other
+    checks (custom or element-wise functions) or with non-numeric values are run
+    by Pandera itself, and so are the columns and DataFrame-wide checks found to
+    fail, so that only public Pandera API builds the report: checks declared with
+    raise_warning emit a SchemaWarning with Pandera's message and every other
+    failure is collected into a SchemaErrors with the same failure cases as
+    schema.validate(df, lazy=True).
+
+    Schemas that coerce dtypes, add missing columns, drop invalid rows or whose
+    required columns are missing from df are validated by Pandera directly.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Data to validate.
+    schema : pandera.DataFrameSchema
+        Schema to validate against.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The validated data.
+
+    Raises
+    ------
+    pandera.errors.SchemaErrors
+        If any check of the schema fails.
+
+    Examples
+    --------
+    >>> from heart_disease_predictor.utils.heart_schema import schema
+    >>> validated = validate(heart, schema)
+    """
+    if (schema.coerce or schema.add_missing_columns or schema.drop_invalid_rows or schema.strict or schema.unique
+            or any(column.required and name not in df.columns for name, column in schema.columns.items())):
+        return schema.validate(df, lazy=True)
+
+    # Running a Check on its own needs the pandas backends schema.validate would register
+    schema.register_default_backends(type(df))
+    errors = []
+    for name, column in schema.columns.items():
+        if name not in df.columns:
+            continue
+        vectorizable = not (column.coerce or column.unique or column.regex) and _is_vectorizable(column, df[name])
+        if not vectorizable or not _column_passes(column, df[name]):
+            # Pandera copies the frame it validates: hand it the one column
+            errors.extend(_pandera_errors(column, df[[name]]))
+
+    if not all(bool(check(df).check_passed) for check in schema.checks):
+        errors.extend(_pandera_errors(schema.remove_columns(list(schema.columns)), df))
+
+    if errors:
+        raise SchemaErrors(schema=schema, schema_errors=errors, data=df)
+    return df
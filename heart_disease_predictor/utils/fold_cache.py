@@ -0,0 +1,159 @@
+import os
+import time
+import joblib
+import numpy as np
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import check_cv
+
+
+def take_rows(data, indices):
+    """
+    Return the rows of a dataset at the given positions.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame, pandas.Series, numpy array, sparse matrix or list
+        Dataset to take the rows from
+    indices : numpy array
+        Row positions, such as the training or test indices of a fold
+
+    Returns
+    -------
+    Same type as data (a numpy array for a list)
+        The selected rows, in the order of indices
+    """
+    if hasattr(data, "iloc"):
+        return data.iloc[indices]
+    return (np.asarray(data) if isinstance(data, list) else data)[indices]
+
+
+class FoldCache:
+    """
+    Cache of preprocessed cross-validation folds shared by every model and candidate of a run.
+
+    Each entry holds the transformed training and test rows of one fold, produced by
+    fitting a clone of the preprocessor on the training rows only, exactly as
+    make_pipeline(preprocessor, model) does inside cross-validation. Entries are keyed
+    by a fingerprint of the preprocessor parameters, a fingerprint of the data and the
+    fold indices.
+
+    Parameters
+    ----------
+    location : str, optional
+        Directory of an on-disk store whose entries are memory-mapped when read back.
+        By default entries are kept in memory.
+    """
+
+    def __init__(self, location=None):
+        self.location = location
+        self.hits = 0
+        self.misses = 0
+        self._entries = dict()
+        self._data_keys = dict()
+        if location is not None:
+            os.makedirs(location, exist_ok=True)
+
+    def _data_key(self, X, y):
+        """Fingerprint of the data, computed once per (X, y) pair."""
+        ids = (id(X), id(y))
+        if ids not in self._data_keys:
+            self._data_keys[ids] = (joblib.hash(X), joblib.hash(y), X, y)
+        return self._data_keys[ids][:2]
+
+    def _key(self, preprocessor, X, y, train, test):
+        """Key of one fold: preprocessor fingerprint, data fingerprint and fold indices."""
+        return joblib.hash((joblib.hash(clone(preprocessor)), self._data_key(X, y),
+                            np.asarray(train), np.asarray(test)))
+
+    def transform_fold(self, preprocessor, X, y, train, test):
+        """
+        Return the preprocessed training and test rows of one fold.
+
+        Parameters
+        ----------
+        preprocessor :
+            scikit-learn transformer, refit on the training rows of the fold
+        X : pandas.DataFrame
+            Full feature matrix
+        y : pandas.Series
+            Full target vector
+        train, test : numpy array
+            Row indices of the fold
+
+        Returns
+        -------
+        tuple of (Xt_train, Xt_test)
+            Transformed training and test rows
+        """
+        key = self._key(preprocessor, X, y, train, test)
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+        path = None if self.location is None else os.path.join(self.location, f"{key}.joblib")
+        if path is not None and os.path.exists(path):
+            self.hits += 1
+            entry = joblib.load(path, mmap_mode="r")
+        else:
+            self.misses += 1
+            fold_preprocessor = clone(preprocessor)
+            entry = (fold_preprocessor.fit_transform(take_rows(X, train), take_rows(y, train)),
+                     fold_preprocessor.transform(take_rows(X, test)))
+            if path is not None:
+                joblib.dump(entry, path)
+        self._entries[key] = entry
+        return entry
+
+    def cross_validate(self, pipeline, X, y, cv=5, scoring=None, return_train_score=False):
+        """
+        Cross-validate a pipeline whose first step is the cached preprocessor.
+
+        Only the steps after the preprocessor are fit per fold, so the scores are the
+        same as sklearn.model_selection.cross_validate on the whole pipeline while the
+        preprocessor is fit once per fold for the entire run. fit_time excludes the
+        preprocessing.
+
+        Parameters
+        ----------
+        pipeline : sklearn.pipeline.Pipeline
+            Pipeline made of the preprocessor followed by the model
+        X : pandas.DataFrame
+            X in the training data
+        y : pandas.Series
+            y in the training data
+        cv : int or cross-validation generator, optional
+            Cross-validation strategy, by default 5
+        scoring : str, callable, list or dict, optional
+            Scorer, by default the score method of the model. Several scorers
+            are evaluated on the same fits and named like cross_validate does
+        return_train_score : bool, optional
+            Whether to also score the training folds, by default False
+
+        Returns
+        -------
+        dict
+            Arrays of fit_time, score_time, test_score and optionally train_score,
+            or test_<name> and train_<name> for each of several scorers
+        """
+        preprocessor, model = pipeline[0], pipeline[1:]
+        scorer = check_scoring(model, scoring=scoring)
+        multimetric = isinstance(scoring, (list, tuple, set, dict))
+        splits = check_cv(cv, y, classifier=is_classifier(pipeline)).split(X, y)
+        scores = {"fit_time": [], "score_time": []}
+        for train, test in splits:
+            Xt_train, Xt_test = self.transform_fold(preprocessor, X, y, train, test)
+            y_fold_train, y_fold_test = take_rows(y, train), take_rows(y, test)
+            estimator = clone(model)
+            start_time = time.time()
+            estimator.fit(Xt_train, y_fold_train)
+            scores["fit_time"].append(time.time() - start_time)
+            test_scores = scorer(estimator, Xt_test, y_fold_test)
+            scores["score_time"].append(time.time() - start_time - scores["fit_time"][-1])
+            train_scores = scorer(estimator, Xt_train, y_fold_train) if return_train_score else None
+            if not multimetric:
+                test_scores, train_scores = {"score": test_scores}, {"score": train_scores}
+            for name in test_scores:
+                scores.setdefault(f"test_{name}", []).append(test_scores[name])
+                if return_train_score:
+                    scores.setdefault(f"train_{name}", []).append(train_scores[name])
+        return {key: np.array(values) for key, values in scores.items()}
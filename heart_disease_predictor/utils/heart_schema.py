@@ -1,10 +1,24 @@
-#!/usr/bin/env python3
-
-import click
-import pandas as pd
 import pandera.pandas as pa
-from pandera import Check, Column, DataFrameSchema
-import os
+
+from heart_disease_predictor.utils.fast_validation import duplicated_rows
+
+# Column names of the raw Cardiovascular_Disease_Dataset CSV, in file order
+COLUMNS = [
+    'patient_id', 
+    'age', 
+    'gender', 
+    'chest_pain', 
+    'resting_bp',
+    'serum_cholesterol', 
+    'fasting_blood_sugar', 
+    'resting_electro',
+    'max_heart_rate', 
+    'exercise_angina', 
+    'old_peak', 
+    'slope', 
+    'num_major_vessels',
+    'target'
+]
 
 # validate data
 schema = pa.DataFrameSchema(
@@ -17,8 +31,7 @@ schema = pa.DataFrameSchema(
         'serum_cholesterol': pa.Column(
             int, 
             checks=[
-                pa.Check(lambda s: s >= 126 and s <= 564,
-                        element_wise=True,
+                pa.Check.between(126, 564,
                         # Attributed to pandera documentation:
                         # https://pandera.readthedocs.io/en/stable/checks.html#raise-warning-instead-of-error-on-check-failure
                         raise_warning=True,
@@ -33,8 +46,7 @@ schema = pa.DataFrameSchema(
         'slope': pa.Column(
             int, 
             checks=[
-                pa.Check(lambda s: s >= 1 and s <= 3,
-                        element_wise=True,
+                pa.Check.between(1, 3,
                         raise_warning=True,
                         error="Certain slope values are out of range"),
             ], 
@@ -43,53 +55,7 @@ schema = pa.DataFrameSchema(
         'target': pa.Column(int, pa.Check.isin([0, 1]))
     },
     checks=[
-        pa.Check(lambda df: ~df.duplicated().any(), error="Duplicate rows found."),
+        pa.Check(lambda df: ~duplicated_rows(df).any(), error="Duplicate rows found."),
         pa.Check(lambda df: ~(df.isna().all(axis=1)).any(), error="Empty rows found.")
     ]
 )
-
-@click.command()
-@click.option(
-    "--raw-data",
-    type=str,
-    required=True,
-    help="Path to the raw input CSV file."
-)
-
-@click.option(
-    "--data-to",
-    type=str,
-    help="Output path to save the validated dataset."
-)
-def main(raw_data, data_to):
-    """Validate heart disease dataset using Pandera schema."""
-
-    colnames = [
-        'patient_id', 
-        'age', 
-        'gender', 
-        'chest_pain', 
-        'resting_bp',
-        'serum_cholesterol', 
-        'fasting_blood_sugar', 
-        'resting_electro',
-        'max_heart_rate', 
-        'exercise_angina', 
-        'old_peak', 
-        'slope', 
-        'num_major_vessels',
-        'target'
-    ]
-
-    heart = pd.read_csv(raw_data, names=colnames, header=0)
-
-    validated_df = schema.validate(heart, lazy=True)
-
-    if not os.path.exists(data_to):
-        os.makedirs(data_to)
-    validated_df.to_csv(os.path.join(
-        data_to, "heart_validated.csv"), index=False)
-
-
-if __name__ == "__main__":
-    main()
@@ -0,0 +1,84 @@
+# Adapted from UBC MDS DSCI 571 utils/mean_std_cv_scores.py
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import cross_validate
+
+def mean_std_cross_val_scores(model, X_train, y_train, scoring=None, fold_cache=None, structured=False, **kwargs):
+    """
+    Returns mean and std of cross validation
+
+    Parameters
+    ----------
+    model :
+        scikit-learn model
+    X_train : numpy array or pandas DataFrame
+        X in the training data
+    y_train :
+        y in the training data
+    scoring : str, callable, list or dict, optional
+        Scorer or scorers passed to cross_validate; several scorers are
+        evaluated in the same pass and give test_<name> and train_<name> scores
+    fold_cache : utils.fold_cache.FoldCache, optional
+        When given, model must be a pipeline starting with the preprocessor and
+        the preprocessed folds are taken from the cache
+    structured : bool, optional
+        Return the numeric scores of cv_scores_frame instead of formatted
+        strings, by default False
+
+    Returns
+    ----------
+        pandas Series with mean scores from cross_validation, as strings like
+        "0.812 (+/- 0.031)" or, with structured=True, as numbers indexed by
+        (metric, statistic)
+    """
+    if fold_cache is not None:
+        scores = fold_cache.cross_validate(model, X_train, y_train, scoring=scoring, **kwargs)
+    else:
+        scores = cross_validate(model, X_train, y_train, scoring=scoring, **kwargs)
+    frame = cv_scores_frame(scores)
+    return frame if structured else render_mean_std(frame)
+
+def cv_scores_frame(scores):
+    """
+    Numeric summary of the output of cross_validate.
+
+    Parameters
+    ----------
+    scores : dict
+        Arrays of per-fold values keyed by metric, as returned by cross_validate
+
+    Returns
+    ----------
+        pandas Series indexed by (metric, statistic), where statistic is 'mean',
+        'std' (with one degree of freedom, like pandas) or 'split<k>' for the
+        value of fold k
+    """
+    metrics = [key for key in scores if key not in ("estimator", "indices")]
+    values = np.array([scores[metric] for metric in metrics], dtype=np.float64)
+    stats = np.column_stack([values.mean(axis=1), values.std(axis=1, ddof=1), values])
+    statistics = ["mean", "std"] + [f"split{k}" for k in range(values.shape[1])]
+    index = pd.MultiIndex.from_product([metrics, statistics], names=["metric", "statistic"])
+    return pd.Series(stats.ravel(), index=index)
+
+def render_mean_std(frame):
+    """
+    Format the numeric scores of cv_scores_frame as "mean (+/- std)" strings.
+
+    Parameters
+    ----------
+    frame : pandas Series or DataFrame
+        Output of cv_scores_frame, or a DataFrame with one such Series per row
+
+    Returns
+    ----------
+        pandas Series (or DataFrame with one column per metric) of strings
+        like "0.812 (+/- 0.031)"
+    """
+    if isinstance(frame, pd.Series):
+        return render_mean_std(frame.to_frame().T).iloc[0].rename(None)
+    means = frame.xs("mean", axis=1, level="statistic")
+    stds = frame.xs("std", axis=1, level="statistic")
+    text = np.char.add(np.char.add(np.char.mod("%0.3f (+/- ", means.to_numpy()),
+                                   np.char.mod("%0.3f", stds.to_numpy())), ")")
+    return pd.DataFrame(text, index=frame.index, columns=list(means.columns)).astype(object)
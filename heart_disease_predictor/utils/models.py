@@ -0,0 +1,72 @@
+from sklearn.dummy import DummyClassifier
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.svm import SVC, LinearSVC
+from sklearn.kernel_approximation import Nystroem, RBFSampler
+from sklearn.pipeline import make_pipeline
+import numpy as np
+
+def get_models(random_state=123, approximate=False):
+    """
+    Returns a dictionary of classification models with specified random_state where applicable.
+    
+    Parameters
+    ----------
+    random_state : int, optional
+        Random state for reproducibility, by default 123
+    approximate : bool, optional
+        Also return approximate RBF kernel models, by default False. They map the
+        features with Nystroem or random Fourier features (RBFSampler) and fit a
+        linear classifier, so their training time grows linearly with the number
+        of rows instead of quadratically or worse for the exact SVM RBF.
+    Returns
+    ----------
+    dict
+        Dictionary with model names as keys and model instances as values
+    """
+    models = {
+        "Dummy Classifier": DummyClassifier(strategy='most_frequent'),
+        "Decision Tree": DecisionTreeClassifier(random_state=random_state),
+        "Logistic Regression": LogisticRegression(random_state=random_state),
+        "SVM RBF": SVC(random_state=random_state)
+    }
+    if approximate:
+        models["Nystroem SVM"] = make_pipeline(
+            Nystroem(kernel="rbf", n_components=300, random_state=random_state),
+            LinearSVC(random_state=random_state))
+        models["RFF SGD"] = make_pipeline(
+            RBFSampler(n_components=1000, random_state=random_state),
+            SGDClassifier(loss="hinge", random_state=random_state))
+    return models
+def get_param_dist(approximate=False):
+    """
+    Returns the hyperparameter distributions searched for each model of get_models.
+
+    Parameters
+    ----------
+    approximate : bool, optional
+        Also return the distributions of the approximate RBF kernel models, by
+        default False. Their kernel gamma follows the SVM RBF grid.
+    Returns
+    ----------
+    dict
+        Dictionary with model names as keys and parameter distributions, keyed by
+        the parameter names of make_pipeline(preprocessor, model), as values
+    """
+    param_dist = {
+    "Decision Tree": {'decisiontreeclassifier__max_depth': np.arange(1, 11)},
+    "Logistic Regression": {"logisticregression__C" : 10.0 ** np.arange(-3, 2, 1), "logisticregression__max_iter" : [80, 100, 500, 1000, 1500, 2000]},
+    "SVM RBF": {"svc__C": 10.0 ** np.arange(-3, 2, 1), "svc__gamma": 10.0 ** np.arange(-3, 2, 1)}
+    }
+    if approximate:
+        param_dist["Nystroem SVM"] = {
+            "pipeline__nystroem__gamma": 10.0 ** np.arange(-3, 2, 1),
+            "pipeline__nystroem__n_components": [100, 300, 1000],
+            "pipeline__linearsvc__C": 10.0 ** np.arange(-3, 2, 1),
+        }
+        param_dist["RFF SGD"] = {
+            "pipeline__rbfsampler__gamma": 10.0 ** np.arange(-3, 2, 1),
+            "pipeline__rbfsampler__n_components": [300, 1000, 3000],
+            "pipeline__sgdclassifier__alpha": 10.0 ** np.arange(-6, -1, 1),
+        }
+    return param_dist
@@ -0,0 +1,635 @@
+import time
+import warnings
+from collections import Counter
+import numpy as np
+import pandas as pd
+from scipy.stats import rankdata
+from sklearn.base import clone
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import RandomizedSearchCV, HalvingRandomSearchCV, ParameterSampler, check_cv
+from sklearn.exceptions import FitFailedWarning
+from sklearn.metrics import fbeta_score, make_scorer
+from sklearn.pipeline import make_pipeline
+from sklearn.utils.parallel import Parallel, delayed
+
+from heart_disease_predictor.utils.fold_cache import take_rows
+
+def tune_hyperparameters(X_train, y_train, model, preprocessor, param_dist, pos_label, beta, seed,
+                         strategy="random", resource="n_samples", factor=3, fold_cache=None):
+    """
+    Tune the hyperparameters of the model and return the fitted search
+
+    Parameters
+    ----------
+    strategy : {"random", "halving"}, optional
+        "random" runs a full RandomizedSearchCV, "halving" runs successive halving
+        that drops the worst candidates early, by default "random"
+    resource : {"n_samples", "folds"}, optional
+        Resource grown between halving rounds, either the number of training
+        samples or the number of cross-validation folds, by default "n_samples".
+        Only used when strategy is "halving"
+    factor : int, optional
+        Proportion of candidates kept after each halving round is 1 / factor, by default 3
+    fold_cache : utils.fold_cache.FoldCache, optional
+        Cache of preprocessed folds shared with other searches. Not supported when
+        halving over n_samples, since the training subsets change every round
+
+    Returns
+    -------
+    RandomizedSearchCV object that is fit on (X_train, y_train) for strategy="random",
+    HalvingRandomSearchCV object for resource="n_samples" and SearchResult object for
+    resource="folds" or when a fold_cache is given
+    """
+    if param_dist == {} or beta < 0:
+        raise ValueError
+    if pos_label not in y_train.values:
+        raise ValueError
+    if strategy not in ("random", "halving") or resource not in ("n_samples", "folds"):
+        raise ValueError
+    if fold_cache is not None and strategy == "halving" and resource == "n_samples":
+        raise ValueError
+    if fold_cache is not None and strategy == "random":
+        return tune_all_hyperparameters(X_train, y_train, {"model": model}, preprocessor, {"model": param_dist},
+                                        pos_label, beta, seed, fold_cache=fold_cache)["model"]
+    model = make_pipeline(preprocessor, model)
+    scorer = make_scorer(fbeta_score, pos_label=pos_label, beta=beta)
+    if strategy == "halving" and resource == "folds":
+        return _fold_halving_search(X_train, y_train, model, param_dist, scorer, seed, factor, fold_cache)
+    if strategy == "halving":
+        search_model = HalvingRandomSearchCV(model, param_dist, n_candidates=10, resource="n_samples",
+                                            min_resources="exhaust", factor=factor, return_train_score=True, random_state=seed, n_jobs=-1, scoring=scorer)
+    else:
+        search_model = RandomizedSearchCV(model, param_dist, return_train_score=True, random_state=seed,
+                                        n_jobs=-1, scoring=scorer)
+    return search_model.fit(X_train, y_train)
+
+def _fold_halving_search(X_train, y_train, pipeline, param_dist, scorer, seed, factor, fold_cache=None,
+                         n_candidates=10, cv=5, n_jobs=-1):
+    """
+    Successive halving over cross-validation folds.
+
+    All sampled candidates are scored on the first fold, the best 1 / factor
+    of them go on to more folds, and so on until the survivors have been scored
+    on every fold. Candidates dropped early keep the mean of the folds they were
+    scored on and are ranked below every candidate of a later round.
+
+    Returns
+    -------
+    SearchResult object with the extra cv_results_ keys 'iter' and 'n_resources'
+    """
+    splits = list(check_cv(cv, y_train, classifier=True).split(X_train, y_train))
+    folds = _fold_inputs(pipeline, X_train, y_train, splits, fold_cache)
+    candidates = list(ParameterSampler(param_dist, n_candidates, random_state=seed))
+    fold_results = [[None] * len(splits) for _ in candidates]
+    last_iter = np.zeros(len(candidates), dtype=int)
+
+    parallel = Parallel(n_jobs=n_jobs)
+    alive = list(range(len(candidates)))
+    n_folds, done_folds, iteration = 1, 0, 0
+    while True:
+        tasks = [(i, k) for i in alive for k in range(done_folds, n_folds)]
+        outputs = parallel(delayed(_fit_and_score)(candidates[i], *folds[k], scorer) for i, k in tasks)
+        for (i, k), output in zip(tasks, outputs):
+            fold_results[i][k] = output
+        last_iter[alive] = iteration
+        if n_folds == len(splits):
+            break
+        means = [np.mean([fold_results[i][k]["test_score"] for k in range(n_folds)]) for i in alive]
+        # Candidates whose fit failed on a fold score NaN and are dropped first
+        means = np.nan_to_num(means, nan=-np.inf)
+        n_keep = max(1, int(np.ceil(len(alive) / factor)))
+        alive = [alive[j] for j in np.argsort(means, kind="stable")[::-1][:n_keep]]
+        done_folds, n_folds = n_folds, min(n_folds * factor, len(splits))
+        iteration += 1
+
+    _check_fit_failures(fold_results)
+    cv_results = _format_cv_results(candidates, fold_results)
+    cv_results["iter"] = last_iter
+    cv_results["n_resources"] = np.array([sum(fold is not None for fold in folds) for folds in fold_results])
+    order = np.lexsort((-cv_results["mean_test_score"], -last_iter))
+    rank = np.empty(len(candidates), dtype=np.int32)
+    rank[order] = np.arange(1, len(candidates) + 1)
+    cv_results["rank_test_score"] = rank
+
+    best_params = cv_results["params"][int(np.argmin(rank))]
+    best_estimator, refit_time = _refit(pipeline, best_params, X_train, y_train)
+    return SearchResult(cv_results, best_estimator, len(splits), scorer, refit_time)
+
+class SearchResult:
+    """
+    Fitted search produced by tune_all_hyperparameters.
+
+    Exposes the same attributes as a fitted RandomizedSearchCV
+    (cv_results_, best_index_, best_params_, best_score_, best_estimator_,
+    n_splits_, scorer_, refit_time_) so the results can be used interchangeably.
+    """
+
+    def __init__(self, cv_results, best_estimator, n_splits, scorer, refit_time):
+        self.cv_results_ = cv_results
+        self.best_index_ = int(np.argmin(cv_results["rank_test_score"]))
+        self.best_params_ = cv_results["params"][self.best_index_]
+        self.best_score_ = cv_results["mean_test_score"][self.best_index_]
+        self.best_estimator_ = best_estimator
+        self.n_splits_ = n_splits
+        self.scorer_ = scorer
+        self.refit_time_ = refit_time
+
+    def predict(self, X):
+        """Predict with the refitted best estimator."""
+        return self.best_estimator_.predict(X)
+
+    def score(self, X, y):
+        """Score the refitted best estimator with the search scorer."""
+        return self.scorer_(self.best_estimator_, X, y)
+
+def _fold_inputs(pipeline, X, y, splits, fold_cache=None):
+    """
+    Collect the estimator and data to fit on every fold.
+
+    Without a fold_cache the whole pipeline is fit on the raw rows of each fold.
+    With a fold_cache only the steps after the preprocessor are fit, on the cached
+    preprocessed rows, which gives the same scores.
+
+    Returns
+    -------
+    list of tuple
+        (estimator, X_fold_train, y_fold_train, X_fold_test, y_fold_test) per fold
+    """
+    folds = []
+    for train, test in splits:
+        y_fold_train, y_fold_test = take_rows(y, train), take_rows(y, test)
+        if fold_cache is None:
+            folds.append((pipeline, take_rows(X, train), y_fold_train, take_rows(X, test), y_fold_test))
+        else:
+            Xt_train, Xt_test = fold_cache.transform_fold(pipeline[0], X, y, train, test)
+            folds.append((pipeline[1:], Xt_train, y_fold_train, Xt_test, y_fold_test))
+    return folds
+
+def _failed_fit(error, fit_time):
+    """
+    Output of a fit that raised, scored NaN like error_score=np.nan in RandomizedSearchCV.
+    """
+    return {"fit_time": fit_time, "score_time": 0.0, "test_score": np.nan, "train_score": np.nan,
+            "fit_error": f"{type(error).__name__}: {error}"}
+
+def _check_fit_failures(fold_results):
+    """
+    Raise if every fit failed, otherwise warn about the failed fits as RandomizedSearchCV does.
+
+    Parameters
+    ----------
+    fold_results : list of list of dict
+        Outputs of the fits, None for folds that were not evaluated
+
+    Raises
+    ------
+    ValueError
+        If every fit failed
+    """
+    outputs = [fold for folds in fold_results for fold in folds if fold is not None]
+    errors = Counter(output["fit_error"] for output in outputs if "fit_error" in output)
+    if not errors:
+        return
+    n_failed = sum(errors.values())
+    summary = "\n".join(f"{count} fits failed with the following error:\n{error}" for error, count in errors.items())
+    if n_failed == len(outputs):
+        raise ValueError(f"All the {len(outputs)} fits failed.\n{summary}")
+    warnings.warn(f"{n_failed} fits failed out of a total of {len(outputs)}.\nThe score on these train-test "
+                  f"partitions for these parameters will be set to nan.\n{summary}", FitFailedWarning)
+
+def _fit_and_score(params, estimator, X_fold_train, y_fold_train, X_fold_test, y_fold_test, scorer):
+    """
+    Fit one candidate on one training fold and score it on both sides of the split.
+
+    Returns
+    -------
+    dict
+        fit_time, score_time, test_score and train_score of the fit, or NaN
+        scores and the fit_error if the fit raised
+    """
+    estimator = clone(estimator).set_params(**clone(params, safe=False))
+
+    start_time = time.time()
+    try:
+        estimator.fit(X_fold_train, y_fold_train)
+    except Exception as error:
+        return _failed_fit(error, time.time() - start_time)
+    fit_time = time.time() - start_time
+    test_score = scorer(estimator, X_fold_test, y_fold_test)
+    score_time = time.time() - start_time - fit_time
+    train_score = scorer(estimator, X_fold_train, y_fold_train)
+    return {"fit_time": fit_time, "score_time": score_time,
+            "test_score": test_score, "train_score": train_score}
+
+def _fit_path_and_score(path_params, warm_start_name, estimator, X_fold_train, y_fold_train,
+                        X_fold_test, y_fold_test, scorer):
+    """
+    Fit one estimator along a path of parameter settings on one training fold,
+    warm-starting every fit from the previous one, and score every step.
+
+    Returns
+    -------
+    list of dict
+        Output of _fit_and_score for every setting of the path
+    """
+    estimator = clone(estimator).set_params(**{warm_start_name: True})
+    outputs = []
+    for params in path_params:
+        estimator.set_params(**clone(params, safe=False))
+        start_time = time.time()
+        try:
+            estimator.fit(X_fold_train, y_fold_train)
+        except Exception as error:
+            outputs.append(_failed_fit(error, time.time() - start_time))
+            continue
+        fit_time = time.time() - start_time
+        test_score = scorer(estimator, X_fold_test, y_fold_test)
+        score_time = time.time() - start_time - fit_time
+        train_score = scorer(estimator, X_fold_train, y_fold_train)
+        outputs.append({"fit_time": fit_time, "score_time": score_time,
+                        "test_score": test_score, "train_score": train_score})
+    return outputs
+
+def _refit(pipeline, params, X, y):
+    """
+    Refit the best candidate on the whole training set.
+
+    Returns
+    -------
+    tuple of (estimator, float)
+        The fitted estimator and its refit time in seconds
+    """
+    estimator = clone(pipeline).set_params(**clone(params, safe=False))
+    start_time = time.time()
+    estimator.fit(X, y)
+    return estimator, time.time() - start_time
+
+def _format_cv_results(candidate_params, fold_results):
+    """
+    Build a RandomizedSearchCV-style cv_results_ dictionary.
+
+    Parameters
+    ----------
+    candidate_params : list of dict
+        Sampled parameter settings, one per candidate
+    fold_results : list of list of dict
+        fold_results[i][k] holds the output of _fit_and_score for candidate i on
+        fold k, or None when that fold was not evaluated
+
+    Returns
+    -------
+    dict
+        Dictionary with the same keys as RandomizedSearchCV.cv_results_
+    """
+    n_splits = len(fold_results[0])
+    results = dict()
+    not_evaluated = np.array([[fold is None for fold in folds] for folds in fold_results])
+
+    def _store(key_name, splits=False, rank=False):
+        array = np.array([[np.nan if fold is None else fold[key_name] for fold in folds]
+                          for folds in fold_results], dtype=np.float64)
+        if splits:
+            for split_idx in range(n_splits):
+                results[f"split{split_idx}_{key_name}"] = array[:, split_idx]
+        # Folds that were not evaluated are left out, failed fits make the mean NaN
+        n_evaluated = (~not_evaluated).sum(axis=1)
+        means = np.where(not_evaluated, 0.0, array).sum(axis=1) / n_evaluated
+        results[f"mean_{key_name}"] = means
+        results[f"std_{key_name}"] = np.sqrt(
+            np.where(not_evaluated, 0.0, (array - means[:, None]) ** 2).sum(axis=1) / n_evaluated)
+        if rank:
+            if np.isnan(means).all():
+                results[f"rank_{key_name}"] = np.ones_like(means, dtype=np.int32)
+            else:
+                means = np.nan_to_num(means, nan=np.nanmin(means) - 1)
+                results[f"rank_{key_name}"] = rankdata(-means, method="min").astype(np.int32)
+
+    _store("fit_time")
+    _store("score_time")
+    results.update(_param_columns(candidate_params))
+    results["params"] = candidate_params
+    _store("test_score", splits=True, rank=True)
+    _store("train_score", splits=True)
+    return results
+
+def _param_columns(candidate_params):
+    """
+    Masked param_<name> columns of cv_results_, masked for candidates without the parameter.
+
+    Returns
+    -------
+    dict
+        'param_<name>' -> numpy.ma.MaskedArray, with the dtype of the values
+        when they form a 1-d numeric array and object otherwise
+    """
+    columns = dict()
+    for name in dict.fromkeys(name for params in candidate_params for name in params):
+        present = [name in params for params in candidate_params]
+        try:
+            values = np.array([params[name] for params in candidate_params if name in params])
+            dtype = values.dtype if values.dtype.kind != "U" and values.ndim == 1 else object
+        except ValueError:
+            dtype = object
+        column = np.ma.MaskedArray(np.empty(len(candidate_params), dtype=dtype), mask=True)
+        for i, params in enumerate(candidate_params):
+            if present[i]:
+                column[i] = params[name]
+        columns[f"param_{name}"] = column
+    return columns
+
+def tune_all_hyperparameters(X_train, y_train, models, preprocessor, param_dists, pos_label, beta, seed,
+                             n_iter=10, cv=5, n_jobs=-1, fold_cache=None):
+    """
+    Tune several models at once on a single shared pool of worker processes.
+
+    Every (model, sampled parameters, fold) fit is flattened into one work queue,
+    interleaved across models so that long fits of one model overlap with short
+    fits of the others. Candidates and folds are drawn exactly as RandomizedSearchCV
+    draws them, so the scores match tune_hyperparameters.
+
+    Parameters
+    ----------
+    X_train : pandas.DataFrame
+        X in the training data
+    y_train : pandas.Series
+        y in the training data
+    models : dict
+        Dictionary with model names as keys and unfitted estimators as values
+    preprocessor :
+        scikit-learn transformer placed in front of every model
+    param_dists : dict
+        Dictionary with model names as keys and parameter distributions as values
+    pos_label : str or int
+        Positive class label for fbeta_score
+    beta : float
+        Beta parameter for fbeta_score
+    seed : int
+        Random state used to sample the parameter settings
+    n_iter : int, optional
+        Number of parameter settings sampled per model, by default 10
+    cv : int or cross-validation generator, optional
+        Cross-validation strategy, by default 5 stratified folds
+    n_jobs : int, optional
+        Number of worker processes shared by all models, by default -1 (all cores)
+    fold_cache : utils.fold_cache.FoldCache, optional
+        Cache of preprocessed folds; when given the preprocessor is fit once per
+        fold for all models and candidates instead of once per fit
+
+    Returns
+    -------
+    dict
+        Dictionary with model names as keys and fitted SearchResult objects as values
+    """
+    if beta < 0 or any(param_dists[model_name] == {} for model_name in models):
+        raise ValueError
+    if pos_label not in y_train.values:
+        raise ValueError
+
+    scorer = make_scorer(fbeta_score, pos_label=pos_label, beta=beta)
+    splits = list(check_cv(cv, y_train, classifier=True).split(X_train, y_train))
+    pipelines = {model_name: make_pipeline(preprocessor, model) for model_name, model in models.items()}
+    folds = {model_name: _fold_inputs(pipeline, X_train, y_train, splits, fold_cache)
+             for model_name, pipeline in pipelines.items()}
+    candidates = {model_name: list(ParameterSampler(param_dists[model_name], n_iter, random_state=seed))
+                  for model_name in models}
+
+    # Round-robin over models so that no model's fits are queued at the very end
+    tasks = []
+    for i in range(max(len(params) for params in candidates.values())):
+        for model_name, params in candidates.items():
+            if i < len(params):
+                tasks.extend((model_name, i, k) for k in range(len(splits)))
+
+    parallel = Parallel(n_jobs=n_jobs)
+    outputs = parallel(
+        delayed(_fit_and_score)(candidates[model_name][i], *folds[model_name][k], scorer)
+        for model_name, i, k in tasks)
+
+    fold_results = {model_name: [[None] * len(splits) for _ in params] for model_name, params in candidates.items()}
+    for (model_name, i, k), output in zip(tasks, outputs):
+        fold_results[model_name][i][k] = output
+    for model_name in models:
+        _check_fit_failures(fold_results[model_name])
+    cv_results = {model_name: _format_cv_results(candidates[model_name], fold_results[model_name])
+                  for model_name in models}
+
+    best_params = {model_name: results["params"][int(np.argmin(results["rank_test_score"]))]
+                   for model_name, results in cv_results.items()}
+    refits = parallel(
+        delayed(_refit)(pipelines[model_name], best_params[model_name], X_train, y_train)
+        for model_name in models)
+
+    return {model_name: SearchResult(cv_results[model_name], estimator, len(splits), scorer, refit_time)
+            for model_name, (estimator, refit_time) in zip(models, refits)}
+
+def tune_regularization_path(X_train, y_train, model, preprocessor, param_name, values, pos_label, beta,
+                             cv=5, n_jobs=-1, fold_cache=None):
+    """
+    Tune the regularization strength of a model along a warm-started path.
+
+    On every fold a single estimator is fit for each value of the path in turn,
+    starting from the coefficients of the previous value, so that every fit
+    after the first only has to move a little and stops as soon as the solver
+    converges. The max_iter of the model is only a convergence budget and is
+    not searched. The path runs from the smallest to the largest value, i.e.
+    from the strongest to the weakest regularization for the C of
+    LogisticRegression. The model must support warm_start (for
+    LogisticRegression every solver except liblinear).
+
+    Parameters
+    ----------
+    X_train : pandas.DataFrame
+        X in the training data
+    y_train : pandas.Series
+        y in the training data
+    model :
+        scikit-learn classifier with a warm_start parameter
+    preprocessor :
+        scikit-learn transformer placed in front of the model
+    param_name : str
+        Name of the regularization parameter in make_pipeline(preprocessor, model),
+        e.g. 'logisticregression__C'
+    values : array-like
+        Values of the parameter along the path
+    pos_label : str or int
+        Positive class label for fbeta_score
+    beta : float
+        Beta parameter for fbeta_score
+    cv : int or cross-validation generator, optional
+        Cross-validation strategy, by default 5 stratified folds
+    n_jobs : int, optional
+        Number of worker processes the folds are spread over, by default -1 (all cores)
+    fold_cache : utils.fold_cache.FoldCache, optional
+        Cache of preprocessed folds shared with other searches
+
+    Returns
+    -------
+    SearchResult object with one candidate per value of the path, in path order
+    """
+    if len(values) == 0 or beta < 0 or "__" not in param_name:
+        raise ValueError
+    if pos_label not in y_train.values:
+        raise ValueError
+
+    scorer = make_scorer(fbeta_score, pos_label=pos_label, beta=beta)
+    pipeline = make_pipeline(preprocessor, model)
+    warm_start_name = f"{param_name.rsplit('__', 1)[0]}__warm_start"
+    candidates = [{param_name: value} for value in np.sort(np.asarray(values))]
+    splits = list(check_cv(cv, y_train, classifier=True).split(X_train, y_train))
+    folds = _fold_inputs(pipeline, X_train, y_train, splits, fold_cache)
+
+    paths = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_path_and_score)(candidates, warm_start_name, *fold, scorer) for fold in folds)
+    fold_results = [[path[i] for path in paths] for i in range(len(candidates))]
+    _check_fit_failures(fold_results)
+    cv_results = _format_cv_results(candidates, fold_results)
+
+    best_params = cv_results["params"][int(np.argmin(cv_results["rank_test_score"]))]
+    best_estimator, refit_time = _refit(pipeline, best_params, X_train, y_train)
+    return SearchResult(cv_results, best_estimator, len(splits), scorer, refit_time)
+
+def tune_tree_depth(X_train, y_train, model, preprocessor, depths, pos_label, beta, cv=5, n_jobs=-1,
+                    fold_cache=None, param_name="decisiontreeclassifier__max_depth"):
+    """
+    Tune the max_depth of a decision tree from one fully grown tree per fold.
+
+    A tree limited to depth d is the prefix of the deepest tree made of its
+    nodes of depth at most d, so every depth is scored by following the
+    decision path of each sample in the deepest tree and predicting the class
+    of the last node it reaches at depth d or less. The fit time of each fold
+    is shared evenly between the depths in cv_results_.
+
+    The sweep matches separate fits except when two splits of a node are
+    exactly as good. The tree draws its random feature order at every node it
+    splits, and a depth-limited tree does not split its deepest nodes, so the
+    nodes built after them can break such ties differently than the truncated
+    deeper tree does.
+
+    Parameters
+    ----------
+    X_train : pandas.DataFrame
+        X in the training data
+    y_train : pandas.Series
+        y in the training data
+    model : sklearn.tree.DecisionTreeClassifier
+        Unfitted decision tree; its max_depth is replaced by the depths searched
+    preprocessor :
+        scikit-learn transformer placed in front of the model
+    depths : array-like of int
+        Values of max_depth to score
+    pos_label : str or int
+        Positive class label for fbeta_score
+    beta : float
+        Beta parameter for fbeta_score
+    cv : int or cross-validation generator, optional
+        Cross-validation strategy, by default 5 stratified folds
+    n_jobs : int, optional
+        Number of worker processes the folds are spread over, by default -1 (all cores)
+    fold_cache : utils.fold_cache.FoldCache, optional
+        Cache of preprocessed folds shared with other searches
+    param_name : str, optional
+        Name of max_depth in make_pipeline(preprocessor, model), by default
+        'decisiontreeclassifier__max_depth'
+
+    Returns
+    -------
+    SearchResult object with one candidate per depth, in increasing depth
+    """
+    depths = np.sort(np.asarray(depths))
+    if len(depths) == 0 or depths[0] < 1 or beta < 0:
+        raise ValueError
+    if pos_label not in y_train.values:
+        raise ValueError
+
+    scorer = make_scorer(fbeta_score, pos_label=pos_label, beta=beta)
+    pipeline = make_pipeline(preprocessor, model).set_params(**{param_name: int(depths[-1])})
+    candidates = [{param_name: depth} for depth in depths]
+    splits = list(check_cv(cv, y_train, classifier=True).split(X_train, y_train))
+    folds = _fold_inputs(pipeline, X_train, y_train, splits, fold_cache)
+
+    fold_outputs = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_depths_and_score)(depths, *fold, pos_label, beta) for fold in folds)
+    fold_results = [[outputs[i] for outputs in fold_outputs] for i in range(len(depths))]
+    _check_fit_failures(fold_results)
+    cv_results = _format_cv_results(candidates, fold_results)
+
+    best_params = cv_results["params"][int(np.argmin(cv_results["rank_test_score"]))]
+    best_estimator, refit_time = _refit(pipeline, best_params, X_train, y_train)
+    return SearchResult(cv_results, best_estimator, len(splits), scorer, refit_time)
+
+def _truncated_tree_predict(tree, X, depths):
+    """
+    Predictions of the depth truncations of a fitted decision tree.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (len(depths), n_samples) with the predicted classes
+    """
+    structure = tree.tree_
+    node_depth = np.zeros(structure.node_count, dtype=np.intp)
+    for node in range(structure.node_count):
+        for child in (structure.children_left[node], structure.children_right[node]):
+            if child != -1:
+                node_depth[child] = node_depth[node] + 1
+
+    # path[i, d] is the node of sample i at depth d, or its leaf below the leaf depth
+    indicator = tree.decision_path(X).tocoo()
+    path = np.full((X.shape[0], node_depth.max() + 1), -1, dtype=np.intp)
+    path[indicator.row, node_depth[indicator.col]] = indicator.col
+    for d in range(1, path.shape[1]):
+        path[:, d] = np.where(path[:, d] == -1, path[:, d - 1], path[:, d])
+
+    node_class = tree.classes_[np.argmax(structure.value[:, 0, :], axis=1)]
+    return node_class[path[:, np.minimum(depths, path.shape[1] - 1)].T]
+
+def _fit_depths_and_score(depths, estimator, X_fold_train, y_fold_train, X_fold_test, y_fold_test,
+                          pos_label, beta):
+    """
+    Fit the deepest tree on one training fold and score every depth truncation.
+
+    Returns
+    -------
+    list of dict
+        fit_time, score_time, test_score and train_score of every depth
+    """
+    estimator = clone(estimator)
+    start_time = time.time()
+    try:
+        estimator.fit(X_fold_train, y_fold_train)
+    except Exception as error:
+        return [_failed_fit(error, (time.time() - start_time) / len(depths))] * len(depths)
+    fit_time = (time.time() - start_time) / len(depths)
+
+    def _scores(X, y):
+        Xt = X if len(estimator) == 1 else estimator[:-1].transform(X)
+        predictions = _truncated_tree_predict(estimator[-1], Xt, depths)
+        return [fbeta_score(y, pred, pos_label=pos_label, beta=beta) for pred in predictions]
+
+    start_time = time.time()
+    test_scores = _scores(X_fold_test, y_fold_test)
+    score_time = (time.time() - start_time) / len(depths)
+    train_scores = _scores(X_fold_train, y_fold_train)
+    return [{"fit_time": fit_time, "score_time": score_time, "test_score": test, "train_score": train}
+            for test, train in zip(test_scores, train_scores)]
+
+def cv_results_table(searches):
+    """
+    Combine the cv_results_ of several fitted searches into a single table.
+
+    Parameters
+    ----------
+    searches : dict
+        Dictionary with model names as keys and fitted searches as values
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per sampled candidate, with a leading 'model' column
+    """
+    tables = []
+    for model_name, search in searches.items():
+        table = pd.DataFrame(search.cv_results_)
+        table.insert(0, "model", model_name)
+        tables.append(table)
+    return pd.concat(tables, ignore_index=True)
@@ -0,0 +1,248 @@
+import os
+import fnmatch
+import hashlib
+import json
+import zipfile
+import zlib
+import requests
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _file_digest(path, algorithm, chunk_size):
+    """Hex SHA-256 or CRC-32 of a file, read in chunks."""
+    if algorithm == "crc32":
+        crc = 0
+        with open(path, "rb") as f:
+            while block := f.read(chunk_size):
+                crc = zlib.crc32(block, crc)
+        return crc
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(chunk_size):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _fetch_segment(url, path, start, end, chunk_size, timeout):
+    """Download bytes start..end (inclusive) of url into the same bytes of path."""
+    with requests.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True, timeout=timeout) as response:
+        if response.status_code != 206:
+            raise ValueError(f"The server did not return bytes {start}-{end} of the URL provided.")
+        with open(path, "r+b") as f:
+            f.seek(start)
+            for block in response.iter_content(chunk_size):
+                f.write(block)
+
+
+def _fetch(response, url, part_path, offset, chunk_size, timeout, segments, min_segment_size):
+    """
+    Write an open response to part_path, appending to its first offset bytes
+    if the server honoured the Range request, or in parallel ranged segments
+    if the response is a whole file the server can split.
+    """
+    if response.status_code == 206 and response.headers.get("Content-Range", "").startswith(f"bytes {offset}-"):
+        mode = "ab"
+    else:
+        mode = "wb"
+        size = int(response.headers.get("Content-Length", 0))
+        n_segments = min(segments, size // min_segment_size)
+        if response.headers.get("Accept-Ranges") == "bytes" and n_segments > 1:
+            response.close()
+            with open(part_path, "wb") as f:
+                f.truncate(size)
+            bounds = [size * i // n_segments for i in range(n_segments + 1)]
+            with ThreadPoolExecutor(n_segments) as pool:
+                futures = [pool.submit(_fetch_segment, url, part_path, start, stop - 1, chunk_size, timeout)
+                           for start, stop in zip(bounds[:-1], bounds[1:])]
+                for future in futures:
+                    future.result()
+            return
+    with open(part_path, mode) as f:
+        for block in response.iter_content(chunk_size):
+            f.write(block)
+
+
+def _unchanged(info, target, recorded, chunk_size):
+    """
+    Whether the file at target holds the member described by info: the file
+    recorded in the manifest with the member's CRC-32 and not modified since,
+    or a file with the member's size and CRC-32.
+    """
+    if not os.path.isfile(target):
+        return False
+    stat = os.stat(target)
+    if stat.st_size != info.file_size:
+        return False
+    if recorded == {"crc": info.CRC, "size": info.file_size, "mtime_ns": stat.st_mtime_ns}:
+        return True
+    return _file_digest(target, "crc32", chunk_size) == info.CRC
+
+
+def _extract_one(path_to_zip_file, name, directory):
+    """Extract one member with a ZipFile of its own, so members decompress in parallel."""
+    with zipfile.ZipFile(path_to_zip_file, 'r') as zip_ref:
+        zip_ref.extract(name, directory)
+
+
+def _extract_members(path_to_zip_file, directory, members, manifest_path, parallel_min_size, chunk_size):
+    """
+    Extract the members matching the members globs that differ from the files
+    on disk, update the manifest and return the extracted names.
+    """
+    manifest = dict()
+    if os.path.isfile(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)["members"]
+
+    with zipfile.ZipFile(path_to_zip_file, 'r') as zip_ref:
+        archive_names = set(zip_ref.namelist())
+        infos = [info for info in zip_ref.infolist()
+                 if members is None or any(fnmatch.fnmatchcase(info.filename, pattern) for pattern in members)]
+        targets = {info.filename: os.path.join(directory, *info.filename.split("/")) for info in infos}
+        changed = []
+        for info in infos:
+            if info.is_dir():
+                os.makedirs(targets[info.filename], exist_ok=True)
+            elif _unchanged(info, targets[info.filename], manifest.get(info.filename), chunk_size):
+                # Mark the file as current for build tools; the manifest records the new time below
+                os.utime(targets[info.filename])
+            else:
+                changed.append(info)
+
+        # zlib releases the GIL, so large members are decompressed on threads
+        large = [info.filename for info in changed if info.file_size >= parallel_min_size]
+        for info in changed:
+            if info.file_size < parallel_min_size:
+                zip_ref.extract(info, directory)
+    if len(large) > 1:
+        with ThreadPoolExecutor(min(len(large), os.cpu_count() or 1)) as pool:
+            for future in [pool.submit(_extract_one, path_to_zip_file, name, directory) for name in large]:
+                future.result()
+    else:
+        for name in large:
+            _extract_one(path_to_zip_file, name, directory)
+
+    # Members no longer in the archive are dropped from the manifest
+    manifest = {name: entry for name, entry in manifest.items() if name in archive_names}
+    for info in infos:
+        if not info.is_dir():
+            manifest[info.filename] = {"crc": info.CRC, "size": info.file_size,
+                                       "mtime_ns": os.stat(targets[info.filename]).st_mtime_ns}
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump({"archive": os.path.basename(path_to_zip_file), "members": manifest}, f, indent=2, sort_keys=True)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return [info.filename for info in changed]
+
+
+def read_zip(url, directory, filename = None, sha256 = None, members = None, segments = 4,
+             min_segment_size = 4 * 2**20, parallel_min_size = 4 * 2**20, chunk_size = 2**20, timeout = 60):
+    """
+    Download a ZIP archive from a remote URL and unpack its files into a chosen directory.
+
+    The archive is streamed to disk in chunks, first to a '.part' file: an
+    interrupted download is resumed with an HTTP Range request, and a large
+    archive from a server accepting ranges is fetched in parallel segments.
+    If the archive already in the directory has the expected SHA-256, nothing
+    is downloaded.
+
+    Only the members matching the members globs that are missing from the
+    directory or differ from the file there are extracted, members of at
+    least parallel_min_size bytes on parallel threads. A JSON manifest next to
+    the archive ('<filename>.manifest.json') records the CRC-32, size and
+    modification time of every extracted file, so unchanged files are
+    recognised without reading them again.
+
+    A reused archive and the selected files left unchanged get their
+    modification time set to the current time, so that build tools such as
+    make see every file this call stands for as up to date.
+
+    Parameters
+    ----------
+    url : str
+        Web address pointing to the ZIP file that should be retrieved.
+    directory : str
+        Destination folder where all extracted files will be placed.
+    filename : str, optional
+        Name to assign to the downloaded ZIP file. If not provided, the url filename
+        will be used.
+    sha256 : str, optional
+        Expected hex SHA-256 of the archive. If given, a cached archive with this
+        hash is reused and a downloaded archive with another hash is rejected.
+    members : list of str, optional
+        Glob patterns of the member names to extract, e.g. ['*.csv'], by
+        default all members.
+    segments : int, optional
+        Largest number of parallel ranged requests, by default 4; 1 downloads
+        in a single request.
+    min_segment_size : int, optional
+        Smallest segment in bytes, by default 4 MiB, so small archives are
+        downloaded in a single request.
+    parallel_min_size : int, optional
+        Uncompressed size in bytes from which members are decompressed on
+        parallel threads, by default 4 MiB.
+    chunk_size : int, optional
+        Bytes written or hashed at a time, by default 1 MiB.
+    timeout : float, optional
+        Seconds to wait for the server, by default 60.
+
+    Returns
+    -------
+    list of str
+        Names of the archive members extracted by this call; other selected
+        members were already on disk.
+
+    Raises
+    ------
+    ValueError
+        If the URL does not exist or does not point to a ZIP file, the
+        directory does not exist, or the archive does not have the expected SHA-256.
+    """
+
+    if not filename:
+        filename = os.path.basename(url)
+    path_to_zip_file = os.path.join(directory, filename)
+    part_path = path_to_zip_file + ".part"
+
+    cached = (sha256 is not None and os.path.isfile(path_to_zip_file)
+              and _file_digest(path_to_zip_file, "sha256", chunk_size) == sha256.lower())
+    if cached:
+        os.utime(path_to_zip_file)
+    else:
+        offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        response = requests.get(url, headers=headers, stream=True, timeout=timeout)
+        if response.status_code == 416:
+            # The partial file is not a prefix the server can extend: start over
+            response.close()
+            offset = 0
+            response = requests.get(url, stream=True, timeout=timeout)
+
+        with response:
+            # check if URL exists, if not raise an error
+            if response.status_code not in (200, 206):
+                raise ValueError('The URL provided does not exist.')
+
+            # check if the URL points to a zip file, if not raise an error
+            if filename[-4:] != '.zip':
+                raise ValueError('The URL provided does not point to a zip file.')
+
+            # check if the directory exists, if not raise an error
+            if not os.path.isdir(directory):
+                raise ValueError('The directory provided does not exist.')
+
+            _fetch(response, url, part_path, offset, chunk_size, timeout, segments, min_segment_size)
+
+        if sha256 is not None and _file_digest(part_path, "sha256", chunk_size) != sha256.lower():
+            os.remove(part_path)
+            raise ValueError('The SHA-256 of the downloaded ZIP file does not match the expected hash.')
+        os.replace(part_path, path_to_zip_file)
+
+    # extract the selected members that are missing or changed
+    extracted = _extract_members(path_to_zip_file, directory, members, path_to_zip_file + ".manifest.json",
+                                 parallel_min_size, chunk_size)
+
+    # check if any files were extracted, if not raise a warning
+    if not extracted:
+        warnings.warn("The ZIP file is empty or nothing new was extracted. This could be due to a previous ZIP being downloaded again.", UserWarning)
+    return extracted
@@ -0,0 +1,341 @@
+import copy
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pandas as pd
+import pandera.pandas as pa
+from sklearn import config_context, get_config
+
+from heart_disease_predictor.utils.batch_predict import load_model, score_chunk
+from heart_disease_predictor.utils.heart_schema import schema
+
+
+def _request_columns():
+    """
+    Columns of the validation schema without the target and without the
+    checks that only raise warnings, since those never reject a record.
+    """
+    columns = dict()
+    for name, column in schema.columns.items():
+        if name != "target":
+            column = copy.deepcopy(column)
+            columns[name] = column.set_checks([check for check in column.checks if not check.raise_warning])
+    return columns
+
+
+# Records sent to the service follow the column contract of the validation schema.
+# Values are coerced since JSON does not distinguish 1 from 1.0.
+request_schema = pa.DataFrameSchema(_request_columns(), coerce=True)
+
+
+class MicroBatcher:
+    """
+    Group requests that arrive close together into one vectorized prediction.
+
+    A background thread takes the first waiting request, then keeps collecting
+    requests for at most max_delay seconds or until max_batch_size rows are
+    gathered, and scores all of them with a single call. If that call fails, the
+    requests are scored one by one so that a bad request only fails itself. The
+    thread scores under the scikit-learn config of the thread that created the
+    batcher.
+
+    Parameters
+    ----------
+    predict_fn : callable
+        Function taking a pandas.DataFrame and returning a DataFrame with one row
+        of results per input row.
+    max_batch_size : int, optional
+        Maximum number of rows scored at once, by default 64.
+    max_delay : float, optional
+        Maximum time in seconds a request waits for others to join its batch,
+        by default 0.002.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=64, max_delay=0.002):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.n_batches = 0
+        self._config = get_config()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, records):
+        """
+        Queue validated records for scoring.
+
+        Parameters
+        ----------
+        records : pandas.DataFrame
+            Rows to score.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the results of these rows.
+        """
+        future = Future()
+        self._queue.put((records, future))
+        return future
+
+    def close(self):
+        """Stop the background thread once the queued requests are scored."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        with config_context(**self._config):
+            self._collect_batches()
+
+    def _collect_batches(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            n_rows = len(item[0])
+            deadline = time.perf_counter() + self.max_delay
+            while n_rows < self.max_batch_size:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                n_rows += len(item[0])
+            # Requests whose caller gave up waiting were cancelled and are not scored
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if batch:
+                self._score(batch)
+
+    def _score(self, batch):
+        self.n_batches += 1
+        try:
+            results = self.predict_fn(pd.concat([records for records, _ in batch], ignore_index=True))
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+            else:
+                for item in batch:
+                    self._score([item])
+            return
+        offset = 0
+        for records, future in batch:
+            future.set_result(results.iloc[offset:offset + len(records)])
+            offset += len(records)
+
+
+class ScoringService:
+    """
+    Online scoring of patient records with a fitted pipeline.
+
+    The model is loaded once and warmed up at construction. Records are validated
+    against request_schema and scored through a MicroBatcher, so that both the
+    validation and the prediction run once per micro-batch.
+
+    Parameters
+    ----------
+    model : str, fitted scikit-learn pipeline or CompiledSVC
+        Path to the pickled model or its compiled .npz kernel, or the model itself.
+    max_batch_size : int, optional
+        Maximum number of rows scored at once, by default 64.
+    max_delay : float, optional
+        Maximum time in seconds a request waits for others to join its batch,
+        by default 0.002.
+    warmup_rounds : int, optional
+        Number of predictions run at startup, by default 3.
+    """
+
+    def __init__(self, model, max_batch_size=64, max_delay=0.002, warmup_rounds=3):
+        if isinstance(model, str):
+            model = load_model(model)
+        self.model = model
+        self.batcher = MicroBatcher(self._validate_and_predict, max_batch_size, max_delay)
+        example = pd.DataFrame([_example_record()])
+        for _ in range(warmup_rounds):
+            self._validate_and_predict(example)
+
+    def _validate_and_predict(self, df):
+        results = score_chunk(self.model, self.validate(df))
+        return results.rename(columns={"decision_score": "score"})
+
+    def validate(self, records):
+        """
+        Check records against the column contract of the validation schema.
+
+        Parameters
+        ----------
+        records : list of dict or pandas.DataFrame
+            One dictionary of column values per patient.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Validated records with the schema columns in schema order.
+
+        Raises
+        ------
+        pandera.errors.SchemaErrors
+            If a record is missing a column or has an invalid value.
+        """
+        df = pd.DataFrame.from_records(records) if isinstance(records, list) else records
+        return request_schema.validate(df, lazy=True)[list(request_schema.columns)]
+
+    def score(self, records, timeout=10.0):
+        """
+        Validate and score records.
+
+        Parameters
+        ----------
+        records : list of dict
+            One dictionary of column values per patient.
+        timeout : float, optional
+            Maximum time in seconds to wait for the prediction, by default 10.
+
+        Returns
+        -------
+        list of dict
+            The predicted class and decision score of every record.
+
+        Raises
+        ------
+        pandera.errors.SchemaErrors
+            If a record is missing a column or has an invalid value.
+        concurrent.futures.TimeoutError
+            If the prediction takes longer than timeout; the request is then
+            cancelled if it has not started.
+        """
+        future = self.batcher.submit(pd.DataFrame.from_records(records))
+        try:
+            results = future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+        return [{"prediction": prediction, "score": float(score)}
+                for prediction, score in zip(results["prediction"].tolist(), results["score"])]
+
+    def close(self):
+        """Stop the micro-batching thread."""
+        self.batcher.close()
+
+
+def _example_record():
+    """
+    Build a record that passes request_schema, used to warm up the model.
+
+    Returns
+    -------
+    dict
+        The smallest allowed value of every column.
+    """
+    record = dict()
+    for name, column in request_schema.columns.items():
+        value = 1
+        for check in column.checks:
+            if "min_value" in check.statistics:
+                value = check.statistics["min_value"] + (1 if check.name == "greater_than" else 0)
+        record[name] = column.dtype.type.type(value)
+    return record
+
+
+def make_server(service, host="127.0.0.1", port=8000, timeout=10.0):
+    """
+    Create an HTTP server exposing a ScoringService.
+
+    Endpoints
+    ---------
+    GET /health
+        Returns {"status": "ok"}.
+    POST /predict
+        Body is a single record, a list of records or {"records": [...]}. Returns
+        {"prediction", "score"} for a single record and {"predictions": [...]}
+        otherwise, or status 400 with the failure cases of invalid records,
+        503 if the prediction takes longer than timeout and 500 if it fails.
+
+    Parameters
+    ----------
+    service : ScoringService
+        Service used to score the requests.
+    host : str, optional
+        Interface to listen on, by default localhost only.
+    port : int, optional
+        Port to listen on; 0 picks a free port, by default 8000.
+    timeout : float, optional
+        Maximum time in seconds a request waits for its prediction, by default 10.
+
+    Returns
+    -------
+    http.server.ThreadingHTTPServer
+        Server ready for serve_forever().
+    """
+
+    class ScoringHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send(200, {"status": "ok"})
+            else:
+                self._send(404, {"error": "Not found"})
+
+        def do_POST(self):
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                if length < 0:
+                    raise ValueError(length)
+            except ValueError:
+                # The body cannot be told apart from the next request: drop the connection after answering
+                self.close_connection = True
+                self._send(400, {"error": "Content-Length is not a number of bytes"})
+                return
+            body = self.rfile.read(length)
+            if self.path != "/predict":
+                self._send(404, {"error": "Not found"})
+                return
+            try:
+                payload = json.loads(body)
+            except (ValueError, UnicodeDecodeError):
+                self._send(400, {"error": "Request body is not valid JSON"})
+                return
+            single = isinstance(payload, dict) and "records" not in payload
+            records = [payload] if single else payload["records"] if isinstance(payload, dict) else payload
+            if not isinstance(records, list) or not records or not all(isinstance(r, dict) for r in records):
+                self._send(400, {"error": "Expected a record or a non-empty list of records"})
+                return
+            try:
+                results = service.score(records, timeout)
+            except pa.errors.SchemaErrors as e:
+                failure_cases = json.loads(e.failure_cases.to_json(orient="records"))
+                self._send(400, {"error": "Invalid records", "failure_cases": failure_cases})
+                return
+            except FutureTimeoutError:
+                self._send(503, {"error": f"Prediction did not finish within {timeout} seconds"})
+                return
+            except Exception as e:
+                self._send(500, {"error": f"Prediction failed: {type(e).__name__}: {e}"})
+                return
+            self._send(200, results[0] if single else {"predictions": results})
+
+        def log_message(self, format, *args):
+            # One log line per request would dominate the latency of small requests
+            pass
+
+    return ThreadingHTTPServer((host, port), ScoringHandler)
@@ -0,0 +1,248 @@
+import glob
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+
+# Bumped when the layout of the store or of the stage keys changes
+CACHE_VERSION = 1
+
+
+def file_digest(path, block_size=1 << 20):
+    """
+    SHA-256 hex digest of the content of a file, read in blocks.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    block_size : int, optional
+        Number of bytes read at once, by default 1 MiB.
+
+    Returns
+    -------
+    str
+        Hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def code_files(code_paths):
+    """
+    Python files making up the code of a stage.
+
+    Parameters
+    ----------
+    code_paths : list of str
+        Files or folders; folders contribute every .py file they contain.
+
+    Returns
+    -------
+    list of str
+        Sorted paths of the code files.
+    """
+    files = set()
+    for path in code_paths:
+        if os.path.isdir(path):
+            files.update(glob.glob(os.path.join(path, "**", "*.py"), recursive=True))
+        else:
+            files.add(path)
+    return sorted(files)
+
+
+def stage_key(command, inputs, outputs, code_paths=()):
+    """
+    Content address of one run of a pipeline stage.
+
+    The key changes whenever the command line (and with it the seed, split,
+    beta, pos_label and every other parameter), the content of an input file, the
+    content of a code file (for instance the parameter grids of get_param_dist in
+    heart_disease_predictor/utils/models.py) or the list of outputs changes. Modification times are not
+    part of the key, so touching or re-downloading an identical file keeps it.
+
+    Parameters
+    ----------
+    command : list of str
+        Command line of the stage.
+    inputs : list of str
+        Paths of the input files of the stage, including its script.
+    outputs : list of str
+        Paths of the files or folders the stage writes.
+    code_paths : list of str, optional
+        Files or folders of code the stage imports, by default none.
+
+    Returns
+    -------
+    str
+        Hex SHA-256 key of the stage.
+    """
+    description = {
+        "version": CACHE_VERSION,
+        "command": list(command),
+        "inputs": [[path, file_digest(path)] for path in inputs],
+        "code": [[path, file_digest(path)] for path in code_files(code_paths)],
+        "outputs": list(outputs),
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+
+class StageCache:
+    """
+    Local content-addressed store of pipeline stage outputs.
+
+    Every output file is stored once under objects/ by the SHA-256 of its
+    content, and manifests/<stage key>.json maps the outputs of one stage run to
+    their objects. Folders (e.g. the _files folder of a rendered report) are
+    stored file by file.
+
+    Parameters
+    ----------
+    root : str, optional
+        Folder of the store, by default '.stage_cache'.
+    """
+
+    def __init__(self, root=".stage_cache"):
+        self.root = root
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest)
+
+    def _manifest_path(self, key):
+        return os.path.join(self.root, "manifests", f"{key}.json")
+
+    def _store_file(self, path):
+        digest = file_digest(path)
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            partial_path = f"{object_path}.{os.getpid()}.partial"
+            shutil.copyfile(path, partial_path)
+            os.replace(partial_path, object_path)
+        return digest
+
+    def _restore_file(self, path, digest):
+        """Make path hold the object digest, copying only if its content differs, then touch it."""
+        if not (os.path.isfile(path) and file_digest(path) == digest):
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            shutil.copyfile(self._object_path(digest), path)
+        os.utime(path)
+
+    def store(self, key, outputs):
+        """
+        Store the outputs of a stage run under its key.
+
+        Parameters
+        ----------
+        key : str
+            Key from stage_key.
+        outputs : list of str
+            Paths of the files or folders written by the stage.
+        """
+        manifest = dict()
+        for output in outputs:
+            if os.path.isdir(output):
+                manifest[output] = {
+                    os.path.relpath(path, output): self._store_file(path)
+                    for path in sorted(glob.glob(os.path.join(output, "**", "*"), recursive=True))
+                    if os.path.isfile(path)
+                }
+            else:
+                manifest[output] = self._store_file(output)
+        manifest_path = self._manifest_path(key)
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        partial_path = f"{manifest_path}.{os.getpid()}.partial"
+        with open(partial_path, "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(partial_path, manifest_path)
+
+    def restore(self, key):
+        """
+        Restore the outputs stored under a key.
+
+        Outputs whose content already matches are only touched, so that make
+        sees them as newer than their inputs. Folders are replaced by their
+        stored content.
+
+        Parameters
+        ----------
+        key : str
+            Key from stage_key.
+
+        Returns
+        -------
+        bool
+            True if the key was found and every output restored, False otherwise.
+        """
+        manifest_path = self._manifest_path(key)
+        if not os.path.exists(manifest_path):
+            return False
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        digests = [digest for entry in manifest.values()
+                   for digest in (entry.values() if isinstance(entry, dict) else [entry])]
+        if not all(os.path.exists(self._object_path(digest)) for digest in digests):
+            return False
+
+        for output, entry in manifest.items():
+            if isinstance(entry, dict):
+                stored = {os.path.join(output, name) for name in entry}
+                if os.path.isdir(output):
+                    for path in glob.glob(os.path.join(output, "**", "*"), recursive=True):
+                        if os.path.isfile(path) and path not in stored:
+                            os.remove(path)
+                for name, digest in entry.items():
+                    self._restore_file(os.path.join(output, name), digest)
+                os.makedirs(output, exist_ok=True)
+                os.utime(output)
+            else:
+                self._restore_file(output, entry)
+        return True
+
+
+def run_stage(command, inputs, outputs, code_paths=(), cache=None):
+    """
+    Run a pipeline stage unless its outputs for the same inputs are cached.
+
+    Parameters
+    ----------
+    command : list of str
+        Command line of the stage.
+    inputs : list of str
+        Paths of the input files of the stage, including its script.
+    outputs : list of str
+        Paths of the files or folders the stage writes.
+    code_paths : list of str, optional
+        Files or folders of code the stage imports, by default none.
+    cache : StageCache, optional
+        Artifact store, by default StageCache() in '.stage_cache'.
+
+    Returns
+    -------
+    bool
+        True if the outputs were restored from the cache, False if the stage ran.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If the stage command fails. Nothing is stored in that case.
+
+    Examples
+    --------
+    >>> run_stage(["python", "-m", "heart_disease_predictor.scripts.validate_data", "--raw-data", raw,
+    ...            "--data-to", "data/validated"],
+    ...           inputs=["heart_disease_predictor/scripts/validate_data.py", raw],
+    ...           outputs=["data/validated/heart_validated.csv"],
+    ...           code_paths=["heart_disease_predictor/utils"])
+    """
+    cache = cache or StageCache()
+    key = stage_key(command, inputs, outputs, code_paths)
+    if cache.restore(key):
+        return True
+    subprocess.run(command, check=True)
+    cache.store(key, outputs)
+    return False
@@ -0,0 +1,139 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class Stage:
+    """
+    One step of an in-process pipeline.
+
+    Parameters
+    ----------
+    func : callable
+        Called with the outputs of the required stages as positional
+        arguments, in the order of requires; its return value is the output
+        of the stage.
+    requires : tuple of str, optional
+        Names of the stages whose outputs func takes, by default none.
+    """
+
+    def __init__(self, func, requires=()):
+        self.func = func
+        self.requires = tuple(requires)
+
+
+def topological_order(stages):
+    """
+    Order the stages so every stage comes after the stages it requires.
+
+    Parameters
+    ----------
+    stages : dict
+        Stage name -> Stage.
+
+    Returns
+    -------
+    list of str
+        Stage names; ties keep the order of stages.
+
+    Raises
+    ------
+    ValueError
+        If a stage requires an unknown stage or the stages form a cycle.
+    """
+    for name, stage in stages.items():
+        unknown = [dep for dep in stage.requires if dep not in stages]
+        if unknown:
+            raise ValueError(f"Stage {name!r} requires unknown stages {unknown}")
+    order = []
+    remaining = dict(stages)
+    while remaining:
+        ready = [name for name, stage in remaining.items() if all(dep in order for dep in stage.requires)]
+        if not ready:
+            raise ValueError(f"Stages {list(remaining)} form a dependency cycle")
+        for name in ready:
+            order.append(name)
+            del remaining[name]
+    return order
+
+
+def drop_stages(stages, names):
+    """
+    Remove stages together with every stage that depends on them.
+
+    Parameters
+    ----------
+    stages : dict
+        Stage name -> Stage.
+    names : iterable of str
+        Stages to remove.
+
+    Returns
+    -------
+    tuple of (dict, list of str)
+        The remaining stages and the names of all removed stages.
+    """
+    dropped = set(names)
+    for name in topological_order(stages):
+        if dropped.intersection(stages[name].requires):
+            dropped.add(name)
+    kept = {name: stage for name, stage in stages.items() if name not in dropped}
+    return kept, [name for name in stages if name in dropped]
+
+
+def _timed(func, args, origin):
+    """Run func(*args) and return its output with its start and end time relative to origin."""
+    start = time.perf_counter()
+    output = func(*args)
+    end = time.perf_counter()
+    return output, {"start": start - origin, "end": end - origin, "seconds": end - start}
+
+
+def run_stages(stages, max_workers=None):
+    """
+    Run a graph of stages in one process, keeping their outputs in memory.
+
+    A stage is started on a thread pool as soon as all the stages it requires
+    have finished, so independent stages run concurrently. If a stage fails,
+    no further stage is started, the running stages are awaited and the error
+    is raised.
+
+    Parameters
+    ----------
+    stages : dict
+        Stage name -> Stage.
+    max_workers : int, optional
+        Largest number of stages running at once, by default the
+        ThreadPoolExecutor default.
+
+    Returns
+    -------
+    tuple of (dict, dict)
+        Output of every stage, and its start, end and duration in seconds
+        ('start', 'end', 'seconds'), measured from the start of the run.
+
+    Raises
+    ------
+    RuntimeError
+        If a stage raises; the original exception is chained.
+    """
+    topological_order(stages)
+    outputs, timings = dict(), dict()
+    pending = dict(stages)
+    running = dict()
+    origin = time.perf_counter()
+    with ThreadPoolExecutor(max_workers) as pool:
+        while pending or running:
+            for name in [name for name, stage in pending.items() if all(dep in outputs for dep in stage.requires)]:
+                stage = pending.pop(name)
+                args = [outputs[dep] for dep in stage.requires]
+                running[pool.submit(_timed, stage.func, args, origin)] = name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    outputs[name], timings[name] = future.result()
+                except Exception as exc:
+                    pending.clear()
+                    wait(running)
+                    raise RuntimeError(f"Stage {name!r} failed: {exc}") from exc
+    return outputs, timings
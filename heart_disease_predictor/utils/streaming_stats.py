@@ -0,0 +1,619 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from sklearn.utils.parallel import Parallel, delayed
+
+from heart_disease_predictor.utils.table_io import iter_chunks
+
+# Percentiles reported for numerical columns, as in DataFrame.describe
+PERCENTILES = (0.25, 0.5, 0.75)
+
+
+class Moments:
+    """
+    Count, mean, sum of squared deviations, min and max of a stream of numbers.
+
+    Every chunk is reduced with NumPy and folded in with Chan's parallel form
+    of Welford's update, so two partial results merge exactly like two chunks.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def _combine(self, count, mean, m2, low, high):
+        total = self.count + count
+        if count == 0:
+            return
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+
+    def update(self, values):
+        """Add an array of non-missing numbers."""
+        values = np.asarray(values, dtype=np.float64)
+        if len(values):
+            mean = values.mean()
+            self._combine(len(values), mean, ((values - mean) ** 2).sum(), values.min(), values.max())
+        return self
+
+    def merge(self, other):
+        """Add the numbers summarized by another Moments."""
+        self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+
+    @property
+    def std(self):
+        """Sample standard deviation (ddof=1), NaN for fewer than two numbers."""
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+
+class QuantileSketch:
+    """
+    Mergeable approximate quantile sketch built from KLL-style compactors.
+
+    Level h holds numbers standing for 2**h original numbers each. When a
+    level holds more than k numbers, it is sorted and every other number,
+    starting at a random offset, is promoted to the next level. Until the
+    first compaction the sketch holds every number and its quantiles are
+    exact; afterwards their rank error is of the order of n * log2(n / k) / k.
+
+    Parameters
+    ----------
+    k : int, optional
+        Capacity of every level, by default 2048.
+    seed : int, list of int or numpy.random.SeedSequence, optional
+        Seed of the compaction offsets, by default 123.
+    """
+
+    def __init__(self, k=2048, seed=123):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _compact(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self.k:
+                level = np.sort(level)
+                # An odd number out stays on its level
+                keep, level = level[len(level) - len(level) % 2:], level[:len(level) - len(level) % 2]
+                promoted = level[self._rng.integers(2)::2]
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h] = keep
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
+
+    def update(self, values):
+        """Add an array of non-missing numbers."""
+        self.levels[0] = np.concatenate([self.levels[0], np.asarray(values, dtype=np.float64)])
+        self._compact()
+        return self
+
+    def merge(self, other):
+        """Add the numbers summarized by another sketch."""
+        for h, level in enumerate(other.levels):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self._compact()
+        return self
+
+    def quantile(self, q):
+        """
+        Quantiles with the linear interpolation of numpy.quantile.
+
+        Every number of level h covers 2**h consecutive ranks and is placed at
+        the middle one.
+        """
+        values = np.concatenate(self.levels)
+        if len(values) == 0:
+            return np.full(len(q), np.nan)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values, weights = values[order], weights[order]
+        cumulative = np.cumsum(weights)
+        ranks = cumulative - (weights + 1) / 2
+        return np.interp(np.asarray(q) * (cumulative[-1] - 1), ranks, values)
+
+    def rank(self, values):
+        """
+        Average ranks (1-based, ties share their mean rank) of values among the sketched numbers.
+
+        While the sketch is exact these are the ranks of pandas.Series.rank.
+        """
+        points = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(points, kind="stable")
+        points = points[order]
+        cumulative = np.concatenate([[0.0], np.cumsum(weights[order])])
+        values = np.asarray(values, dtype=np.float64)
+        below = cumulative[np.searchsorted(points, values, side="left")]
+        through = cumulative[np.searchsorted(points, values, side="right")]
+        return below + (through - below + 1) / 2
+
+
+def _bit_length(x):
+    """Number of significant bits of every uint64 in x."""
+    x = x.copy()
+    length = np.zeros(len(x), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = x >= (np.uint64(1) << np.uint64(shift))
+        length[high] += shift
+        x[high] >>= np.uint64(shift)
+    return length + (x > 0)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog estimate of the number of distinct values.
+
+    Values are hashed with pandas.util.hash_array, which is stable across
+    processes, so sketches built in different workers merge by taking the
+    element-wise maximum of their registers.
+
+    Parameters
+    ----------
+    precision : int, optional
+        log2 of the number of registers, by default 14 (about 0.8% error).
+    """
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values):
+        """Add an array of non-missing values."""
+        if len(values) == 0:
+            return self
+        hashes = pd.util.hash_array(np.asarray(values, dtype=object))
+        tail_bits = 64 - self.precision
+        index = (hashes >> np.uint64(tail_bits)).astype(np.intp)
+        tail = hashes & np.uint64((1 << tail_bits) - 1)
+        rank = (tail_bits - _bit_length(tail) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other):
+        """Add the values seen by another sketch with the same precision."""
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        """Estimated number of distinct values, with linear counting for small counts."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype(np.float64))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+        return estimate
+
+
+class HeavyHitters:
+    """
+    Misra-Gries summary of the most frequent values.
+
+    At most k counters are kept; when more values are seen, the (k+1)-th
+    largest count is subtracted from every counter and the counters that drop
+    to zero are removed. The counts of the kept values are then lower bounds
+    that are off by at most n / (k + 1). While no counter was ever removed,
+    the counts are exact.
+
+    Parameters
+    ----------
+    k : int, optional
+        Number of counters, by default 64.
+    """
+
+    def __init__(self, k=64):
+        self.k = k
+        self.counts = pd.Series(dtype=np.int64)
+        self.exact = True
+
+    def _add(self, counts):
+        counts = self.counts.add(counts, fill_value=0).astype(np.int64)
+        if len(counts) > self.k:
+            counts = counts.sort_values(ascending=False, kind="stable")
+            counts = counts - counts.iloc[self.k]
+            counts = counts[counts > 0]
+            self.exact = False
+        self.counts = counts
+
+    def update(self, values):
+        """Add a Series of non-missing values."""
+        self._add(values.value_counts(sort=False))
+        return self
+
+    def merge(self, other):
+        """Add the values summarized by another summary."""
+        self.exact = self.exact and other.exact
+        self._add(other.counts)
+        return self
+
+    def top(self):
+        """Most frequent value and its count, or (NaN, NaN) if nothing was seen."""
+        if len(self.counts) == 0:
+            return np.nan, np.nan
+        counts = self.counts.sort_values(ascending=False, kind="stable")
+        return counts.index[0], int(counts.iloc[0])
+
+
+class SummaryAccumulator:
+    """
+    One-pass, mergeable summary statistics in the layout of DataFrame.describe(include="all").
+
+    Numerical columns get count, mean, std (Welford), min, max and quantiles
+    from a QuantileSketch. Other columns (object, category, bool) get count,
+    the number of unique values from a HyperLogLog and top/freq from a
+    HeavyHitters summary. The unique count and top/freq are exact while a
+    column has at most top_k distinct values, and the quantiles while a column
+    has at most quantile_k values, so small tables match describe().
+
+    Parameters
+    ----------
+    quantile_k : int, optional
+        Level capacity of the quantile sketches, by default 2048.
+    top_k : int, optional
+        Number of heavy hitter counters, by default 64.
+    hll_precision : int, optional
+        Precision of the HyperLogLog sketches, by default 14.
+    seed : int or list of int, optional
+        Seed of the quantile sketches, by default 123.
+    """
+
+    def __init__(self, quantile_k=2048, top_k=64, hll_precision=14, seed=123):
+        self.quantile_k = quantile_k
+        self.top_k = top_k
+        self.hll_precision = hll_precision
+        self.seed = seed
+        self.columns = dict()
+
+    def _new_column(self, numeric, seed):
+        if numeric:
+            return {"numeric": True, "moments": Moments(), "quantiles": QuantileSketch(self.quantile_k, seed)}
+        return {"numeric": False, "count": 0, "distinct": HyperLogLog(self.hll_precision),
+                "top": HeavyHitters(self.top_k)}
+
+    def update(self, chunk):
+        """
+        Add a chunk of rows; the first chunk fixes the columns and their kind.
+
+        Parameters
+        ----------
+        chunk : pandas.DataFrame
+            Rows to add.
+        """
+        if not self.columns:
+            seeds = np.random.SeedSequence(self.seed).spawn(chunk.shape[1])
+            self.columns = {col: self._new_column(is_numeric_dtype(chunk[col]) and not is_bool_dtype(chunk[col]),
+                                                  child)
+                            for col, child in zip(chunk.columns, seeds)}
+        for col, stats in self.columns.items():
+            values = chunk[col].dropna()
+            if stats["numeric"]:
+                values = pd.to_numeric(values).to_numpy(dtype=np.float64)
+                stats["moments"].update(values)
+                stats["quantiles"].update(values)
+            else:
+                stats["count"] += len(values)
+                stats["distinct"].update(values.to_numpy())
+                stats["top"].update(values)
+        return self
+
+    def merge(self, other):
+        """
+        Add the rows summarized by another accumulator with the same columns.
+        """
+        if not self.columns:
+            self.columns = other.columns
+            return self
+        for col, stats in self.columns.items():
+            theirs = other.columns[col]
+            if stats["numeric"]:
+                stats["moments"].merge(theirs["moments"])
+                stats["quantiles"].merge(theirs["quantiles"])
+            else:
+                stats["count"] += theirs["count"]
+                stats["distinct"].merge(theirs["distinct"])
+                stats["top"].merge(theirs["top"])
+        return self
+
+    def result(self):
+        """
+        Summary table with the rows and columns of DataFrame.describe(include="all").
+
+        Returns
+        -------
+        pandas.DataFrame
+            count, unique, top and freq rows for the non-numerical columns and
+            mean, std, min, quartiles and max rows for the numerical columns;
+            rows of a kind no column has are left out, as in describe.
+        """
+        has_numeric = any(stats["numeric"] for stats in self.columns.values())
+        has_other = any(not stats["numeric"] for stats in self.columns.values())
+        index = (["count"] + (["unique", "top", "freq"] if has_other else [])
+                 + (["mean", "std", "min"] + [f"{p:.0%}" for p in PERCENTILES] + ["max"] if has_numeric else []))
+
+        summary = dict()
+        for col, stats in self.columns.items():
+            if stats["numeric"]:
+                moments = stats["moments"]
+                values = {"count": float(moments.count)}
+                if moments.count:
+                    quantiles = stats["quantiles"].quantile(PERCENTILES)
+                    values.update({"mean": moments.mean, "std": moments.std, "min": moments.min, "max": moments.max,
+                                   **{f"{p:.0%}": value for p, value in zip(PERCENTILES, quantiles)}})
+                summary[col] = pd.Series(values, index=index, dtype=np.float64)
+            else:
+                heavy = stats["top"]
+                unique = len(heavy.counts) if heavy.exact else int(round(stats["distinct"].estimate()))
+                top, freq = heavy.top()
+                summary[col] = pd.Series({"count": stats["count"], "unique": unique, "top": top, "freq": freq},
+                                         index=index, dtype=object)
+        return pd.DataFrame(summary, index=index)
+
+
+class CorrelationAccumulator:
+    """
+    One-pass, mergeable correlation matrix from pairwise co-moments.
+
+    For every pair of columns the accumulator keeps the number of rows where
+    both are present, the mean of each column over those rows and the sums of
+    squared and cross deviations from them. A chunk is reduced with a few
+    matrix products and folded in with Chan's update, so new batches are added
+    without revisiting the old ones and missing values are handled pairwise,
+    as in DataFrame.corr.
+
+    Non-numerical columns are coded 0, 1, ... in the order their values are
+    first seen, as pandas.factorize does, and their missing values stay missing.
+    Accumulators built apart only merge if they coded these columns the same
+    way, which categories guarantees.
+
+    Parameters
+    ----------
+    columns : list of str
+        Columns to correlate, in the order of the matrix.
+    rank_sketches : dict, optional
+        Column -> QuantileSketch of all its values. When given, every value is
+        replaced by its rank in the sketch before it is accumulated, which
+        gives the Spearman correlation; by default the Pearson correlation.
+    categories : dict, optional
+        Non-numerical column -> its values in the order they are coded, by
+        default the order in which they are first seen.
+    """
+
+    def __init__(self, columns, rank_sketches=None, categories=None):
+        self.columns = list(columns)
+        self.rank_sketches = rank_sketches
+        self.codes = {col: {value: code for code, value in enumerate(values)}
+                      for col, values in (categories or dict()).items()}
+        p = len(self.columns)
+        self.count = np.zeros((p, p))
+        self.mean = np.zeros((p, p))
+        self.m2 = np.zeros((p, p))
+        self.cross = np.zeros((p, p))
+
+    def encode(self, chunk):
+        """
+        Chunk columns as a float matrix, with codes for non-numerical columns.
+
+        Values of a non-numerical column not coded yet get the next codes, and
+        with rank_sketches every value is replaced by its rank.
+
+        Parameters
+        ----------
+        chunk : pandas.DataFrame
+            Rows to encode; columns not in self.columns are ignored.
+
+        Returns
+        -------
+        numpy.ndarray
+            Matrix of shape (len(chunk), len(self.columns)), NaN where a value
+            is missing.
+        """
+        matrix = np.empty((len(chunk), len(self.columns)))
+        for i, col in enumerate(self.columns):
+            values = chunk[col]
+            if col in self.codes or not (is_numeric_dtype(values) or is_bool_dtype(values)):
+                codes = self.codes.setdefault(col, dict())
+                for value in values.dropna().unique():
+                    codes.setdefault(value, len(codes))
+                values = values.map(codes)
+            matrix[:, i] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            if self.rank_sketches is not None:
+                present = ~np.isnan(matrix[:, i])
+                matrix[present, i] = self.rank_sketches[col].rank(matrix[present, i])
+        return matrix
+
+    def _combine(self, count, mean, m2, cross):
+        total = self.count + count
+        share = np.divide(count, total, out=np.zeros_like(total), where=total > 0)
+        delta = mean - self.mean
+        self.cross += cross + delta * delta.T * self.count * share
+        self.m2 += m2 + delta ** 2 * self.count * share
+        self.mean += delta * share
+        self.count = total
+
+    def update(self, chunk):
+        """
+        Add a chunk of rows; columns not in self.columns are ignored.
+
+        Parameters
+        ----------
+        chunk : pandas.DataFrame
+            Rows to add.
+        """
+        matrix = self.encode(chunk)
+        present = ~np.isnan(matrix)
+        weights = present.astype(np.float64)
+        matrix = np.where(present, matrix, 0.0)
+        count = weights.T @ weights
+        # mean[i, j]: mean of column i over the rows where columns i and j are present
+        mean = np.divide(matrix.T @ weights, count, out=np.zeros_like(count), where=count > 0)
+        cross = np.empty_like(count)
+        m2 = np.empty_like(count)
+        for i in range(len(self.columns)):
+            both = weights * weights[:, [i]]
+            deviation = (matrix[:, [i]] - mean[i]) * both
+            m2[i] = (deviation ** 2).sum(axis=0)
+            cross[i] = (deviation * (matrix - mean[:, i])).sum(axis=0)
+        self._combine(count, mean, m2, cross)
+        return self
+
+    def merge(self, other):
+        """
+        Add the rows summarized by another accumulator over the same columns.
+
+        Raises
+        ------
+        ValueError
+            If the accumulators have different columns or code a
+            non-numerical column differently (see categories).
+        """
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge correlation accumulators over different columns")
+        for col, codes in other.codes.items():
+            if self.codes.setdefault(col, codes) != codes:
+                raise ValueError(f"Cannot merge correlation accumulators with different codes for column {col!r}")
+        self._combine(other.count, other.mean, other.m2, other.cross)
+        return self
+
+    def result(self):
+        """
+        Correlation matrix, NaN where a pair has no rows or a constant column.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Square matrix indexed by self.columns on both axes, like DataFrame.corr.
+        """
+        scale = np.sqrt(self.m2 * self.m2.T)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.clip(np.where(scale > 0, self.cross / scale, np.nan), -1, 1)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+def correlate_chunks(make_chunks, columns, method="pearson", quantile_k=2048):
+    """
+    Correlation matrix of a stream of DataFrame chunks.
+
+    The Pearson correlation takes one pass over the chunks. The Spearman
+    correlation takes two: the first builds a QuantileSketch of every column,
+    the second accumulates the Pearson correlation of the ranks in those
+    sketches. Ranks are taken over all the non-missing values of a column, and
+    are exact while a column has at most quantile_k values.
+
+    Parameters
+    ----------
+    make_chunks : callable
+        Callable taking no argument and returning an iterator of chunks;
+        it is called once per pass.
+    columns : list of str
+        Columns to correlate.
+    method : str, optional
+        'pearson' or 'spearman', by default 'pearson'.
+    quantile_k : int, optional
+        Level capacity of the rank sketches, by default 2048.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Correlation matrix of CorrelationAccumulator.result.
+
+    Raises
+    ------
+    ValueError
+        If method is not 'pearson' or 'spearman'.
+    """
+    if method not in ("pearson", "spearman"):
+        raise ValueError(f"method must be 'pearson' or 'spearman', got {method!r}")
+    sketches = None
+    if method == "spearman":
+        coder = CorrelationAccumulator(columns)
+        sketches = {col: QuantileSketch(quantile_k, [123, i]) for i, col in enumerate(columns)}
+        for chunk in make_chunks():
+            for i, values in enumerate(coder.encode(chunk).T):
+                sketches[columns[i]].update(values[~np.isnan(values)])
+    accumulator = CorrelationAccumulator(columns, sketches)
+    if sketches is not None:
+        # Code the second pass like the first, whose codes the sketches hold
+        accumulator.codes = coder.codes
+    for chunk in make_chunks():
+        accumulator.update(chunk)
+    return accumulator.result()
+
+
+def _summarize_chunk(chunk, seed, params):
+    """Accumulator of one chunk, run in a worker."""
+    return SummaryAccumulator(seed=seed, **params).update(chunk)
+
+
+def summarize_chunks(chunks, n_jobs=1, seed=123, **params):
+    """
+    Summary statistics of a stream of DataFrame chunks.
+
+    Every chunk is summarized on its own, seeded with [seed, chunk number], and
+    the partial accumulators are merged in chunk order, so the result does not
+    depend on n_jobs.
+
+    Parameters
+    ----------
+    chunks : iterable of pandas.DataFrame
+        Chunks with the same columns.
+    n_jobs : int, optional
+        Number of worker processes summarizing chunks, by default 1 (no pool).
+    seed : int, optional
+        Seed of the quantile sketches, by default 123.
+    **params :
+        quantile_k, top_k and hll_precision of SummaryAccumulator.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Table of SummaryAccumulator.result.
+    """
+    if n_jobs == 1:
+        partials = (_summarize_chunk(chunk, [seed, i], params) for i, chunk in enumerate(chunks))
+    else:
+        partials = Parallel(n_jobs=n_jobs, return_as="generator")(
+            delayed(_summarize_chunk)(chunk, [seed, i], params) for i, chunk in enumerate(chunks))
+    total = SummaryAccumulator(seed=seed, **params)
+    for partial in partials:
+        total.merge(partial)
+    return total.result()
+
+
+def summarize_table(path, chunksize=100_000, n_jobs=1, columns=None, seed=123, **params):
+    """
+    Summary statistics of a CSV or Parquet file read in chunks.
+
+    Parameters
+    ----------
+    path : str
+        Path to a .csv or .parquet file.
+    chunksize : int, optional
+        Rows per chunk, by default 100000.
+    n_jobs : int, optional
+        Number of worker processes, by default 1 (no pool).
+    columns : list of str, optional
+        Columns to summarize, by default all of them.
+    seed : int, optional
+        Seed of the quantile sketches, by default 123.
+    **params :
+        quantile_k, top_k and hll_precision of SummaryAccumulator.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Table of SummaryAccumulator.result, laid out like summary_statistics.csv.
+    """
+    return summarize_chunks(iter_chunks(path, chunksize, columns), n_jobs, seed, **params)
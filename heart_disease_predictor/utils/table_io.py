@@ -0,0 +1,166 @@
+import os
+import pandas as pd
+
+from heart_disease_predictor.utils.constants import TABLE_FORMATS
+
+
+def table_format(path):
+    """
+    Infer the table format of a file from its extension.
+
+    Parameters
+    ----------
+    path : str
+        Path ending in .csv or .parquet.
+
+    Returns
+    -------
+    str
+        'parquet' for .parquet files and 'csv' for anything else, so that
+        existing CSV paths keep working.
+    """
+    return "parquet" if path.endswith(".parquet") else "csv"
+
+
+def table_path(directory, name, fmt="csv"):
+    """
+    Build the path of a table written by a pipeline stage.
+
+    Parameters
+    ----------
+    directory : str
+        Folder of the table.
+    name : str
+        File name without extension, e.g. 'train_heart'.
+    fmt : {'csv', 'parquet'}, optional
+        Table format, by default 'csv'.
+
+    Returns
+    -------
+    str
+        Path of the table, e.g. 'data/processed/train_heart.parquet'.
+    """
+    if fmt not in TABLE_FORMATS:
+        raise ValueError(f"fmt must be one of {TABLE_FORMATS}, got '{fmt}'.")
+    return os.path.join(directory, f"{name}.{fmt}")
+
+
+def read_table(path, columns=None, memory_map=True):
+    """
+    Read a CSV or Parquet table into a DataFrame.
+
+    Parquet files keep the dtypes they were written with and are read through
+    Arrow, only decoding the requested columns. CSV files are parsed with
+    pandas as before.
+
+    Parameters
+    ----------
+    path : str
+        Path to a .csv or .parquet file.
+    columns : list of str, optional
+        Columns to read, by default all of them.
+    memory_map : bool, optional
+        Memory-map Parquet files instead of reading them into a buffer first,
+        by default True. Ignored for CSV files.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The table.
+
+    Examples
+    --------
+    >>> train_df = read_table("data/processed/train_heart.parquet", columns=["age", "target"])
+    """
+    if table_format(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, columns=columns, memory_map=memory_map).to_pandas()
+    return pd.read_csv(path, usecols=columns)
+
+
+def write_table(df, path, index=False):
+    """
+    Write a DataFrame to a CSV or Parquet file, chosen by the extension of path.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Table to write.
+    path : str
+        Path of a .csv or .parquet file.
+    index : bool, optional
+        Whether to write the index, by default False.
+    """
+    if table_format(path) == "parquet":
+        df.to_parquet(path, index=index)
+    else:
+        df.to_csv(path, index=index)
+
+
+def iter_chunks(path, chunksize, columns=None):
+    """
+    Read a CSV or Parquet file in chunks of rows.
+
+    Parameters
+    ----------
+    path : str
+        Path to a .csv or .parquet file.
+    chunksize : int
+        Maximum number of rows per chunk.
+    columns : list of str, optional
+        Columns to read, by default all of them.
+
+    Returns
+    -------
+    generator of pandas.DataFrame
+        Consecutive chunks of the file.
+    """
+    if table_format(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns)
+
+
+class TableWriter:
+    """
+    Append chunks of rows to a CSV or Parquet file.
+
+    The first chunk fixes the columns (and for Parquet the schema) of the file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to write.
+    fmt : {'csv', 'parquet'}, optional
+        Table format, by default inferred from the extension of path.
+    """
+
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.fmt = fmt or table_format(path)
+        self._parquet_writer = None
+        self._header = True
+
+    def write(self, chunk):
+        """Append a DataFrame to the file."""
+        if self.fmt == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            chunk.to_csv(self.path, mode="w" if self._header else "a", header=self._header, index=False)
+            self._header = False
+
+    def close(self):
+        """Finish the file."""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
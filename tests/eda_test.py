@@ -3,11 +3,19 @@
 import pytest
 import sys
 import os
+import json
+import numpy as np
 import pandas as pd
 import altair as alt
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.eda_helper import plot_numerical_distributions
+from heart_disease_predictor.utils.eda_helper import (
+    boxplot_summary,
+    histogram_table,
+    plot_boxplots,
+    plot_categorical_vs_target,
+    plot_numerical_distributions,
+)
 
 
 @pytest.fixture
@@ -99,3 +107,56 @@ def test_plot_numerical_distributions_with_nans(simple_dataframe):
 
     assert isinstance(chart_nans, alt.VConcatChart), "should return a chart even with NaNs"
     assert hist_nans.encoding.x.shorthand == "mean_radius:Q", "x-axis should remain correct with NaNs"
+
+
+def test_histogram_table_uses_vega_bins():
+    """
+    Test that the bins follow Vega's nice steps for maxbins=30 and count every
+    value, with the maximum in the last bin.
+    """
+    ages = pd.Series(np.arange(20, 81))
+    bins = histogram_table(ages)
+    assert bins["bin_start"].iloc[0] == 20 and bins["bin_end"].iloc[-1] == 80
+    assert np.allclose(bins["bin_end"] - bins["bin_start"], 2)
+    assert bins["count"].sum() == len(ages)
+    assert bins["count"].iloc[-1] == 3
+
+    peaks = histogram_table([0.0, 0.3, 6.2, np.nan])
+    assert peaks["bin_start"].iloc[0] == 0.0 and peaks["bin_end"].iloc[-1] == 6.5
+    assert np.allclose(peaks["bin_end"] - peaks["bin_start"], 0.5)
+    assert peaks["count"].sum() == 3
+
+    assert histogram_table([5.0])["count"].tolist() == [1]
+    assert histogram_table([]).empty
+
+
+def test_boxplot_summary():
+    """
+    Test the quartiles, the 1.5 IQR whiskers and the distinct outliers per class.
+    """
+    df = pd.DataFrame({"value": [1, 2, 3, 4, 5, 6, 7, 100, 100, 10, 11, 12],
+                       "target": ["a"] * 9 + ["b"] * 3})
+    summary, outliers = boxplot_summary(df, "value", "target")
+    a = summary.set_index("target").loc["a"]
+    q1, median, q3 = np.quantile([1, 2, 3, 4, 5, 6, 7, 100, 100], [0.25, 0.5, 0.75])
+    assert (a["q1"], a["median"], a["q3"]) == (q1, median, q3)
+    assert (a["lower"], a["upper"]) == (1, 7)
+    assert outliers.to_dict("list") == {"target": ["a"], "value": [100.0]}
+    assert summary.set_index("target").loc["b", "upper"] == 12
+
+
+def test_chart_specs_do_not_embed_rows():
+    """
+    Test that the histogram, boxplot and categorical specs embed the same
+    number of aggregated rows whatever the number of data rows.
+    """
+    def embedded_rows(n):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"age": rng.integers(20, 81, n), "gender": rng.integers(0, 2, n),
+                           "target": rng.choice(["Heart Disease", "No Heart Disease"], n)})
+        charts = [plot_numerical_distributions(df, ["age"]), plot_boxplots(df, ["age"], "target"),
+                  plot_categorical_vs_target(df, ["gender"], "target")]
+        return [sum(len(rows) for rows in chart.to_dict()["datasets"].values()) for chart in charts]
+
+    assert embedded_rows(1_000) == embedded_rows(100_000)
+
@@ -0,0 +1,146 @@
+import pytest
+import sys
+import os
+import pickle
+import numpy as np
+import pandas as pd
+from sklearn.datasets import make_classification
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.batch_predict import iter_chunks, score_chunk, predict_file
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a small binary classification dataset with a patient id column.
+
+    Returns
+    -------
+    tuple of (pd.DataFrame, pd.Series)
+        - X : Feature matrix with a 'patient_id' column and four features.
+        - y : String target labels.
+    """
+    X, y = make_classification(n_samples=250, n_features=4, random_state=42)
+    X = pd.DataFrame(X, columns=[f"feature_{i}" for i in range(4)])
+    X.insert(0, "patient_id", np.arange(1000, 1250))
+    y = pd.Series(np.where(y == 1, "Heart Disease", "No Heart Disease"))
+    return X, y
+
+
+@pytest.fixture
+def model_path(tmp_path, sample_data):
+    """
+    Fit and pickle an SVC pipeline on the sample data.
+
+    Returns
+    -------
+    str
+        Path to the pickled pipeline.
+    """
+    X, y = sample_data
+    model = make_pipeline(StandardScaler(), SVC()).fit(X, y)
+    path = tmp_path / "model.pickle"
+    with open(path, "wb") as f:
+        pickle.dump(model, f)
+    return str(path)
+
+
+def test_iter_chunks_csv(tmp_path, sample_data):
+    """
+    Check that a CSV is read back in chunks of at most chunksize rows.
+    """
+    X, _ = sample_data
+    path = str(tmp_path / "input.csv")
+    X.to_csv(path, index=False)
+    chunks = list(iter_chunks(path, chunksize=100))
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), X)
+
+
+def test_score_chunk_matches_model(sample_data, model_path):
+    """
+    Check that the predictions and scores match predict and decision_function.
+    """
+    X, _ = sample_data
+    with open(model_path, "rb") as f:
+        model = pickle.load(f)
+    out = score_chunk(model, X, id_col="patient_id")
+    assert list(out.columns) == ["patient_id", "prediction", "decision_score"]
+    np.testing.assert_array_equal(out["prediction"], model.predict(X))
+    np.testing.assert_allclose(out["decision_score"], model.decision_function(X))
+
+
+def test_score_chunk_predict_proba(sample_data):
+    """
+    Check that models without decision_function report the probability of
+    the second class as their score.
+    """
+    X, y = sample_data
+    model = DecisionTreeClassifier(random_state=0).fit(X, y)
+    out = score_chunk(model, X)
+    assert "patient_id" not in out.columns
+    np.testing.assert_array_equal(out["prediction"], model.predict(X))
+    np.testing.assert_allclose(out["decision_score"], model.predict_proba(X)[:, 1])
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_predict_file_csv(tmp_path, sample_data, model_path, n_jobs):
+    """
+    Check that scoring a CSV in chunks, in one or several processes, gives
+    the same rows in the same order as scoring it at once.
+    """
+    X, _ = sample_data
+    input_path = str(tmp_path / "input.csv")
+    output_path = str(tmp_path / "out" / "predictions.csv")
+    X.to_csv(input_path, index=False)
+    n_rows = predict_file(model_path, input_path, output_path, chunksize=40, n_jobs=n_jobs)
+    with open(model_path, "rb") as f:
+        model = pickle.load(f)
+    predictions = pd.read_csv(output_path)
+    assert n_rows == len(X)
+    np.testing.assert_array_equal(predictions["patient_id"], X["patient_id"])
+    np.testing.assert_array_equal(predictions["prediction"], model.predict(X))
+
+
+def test_predict_file_parquet(tmp_path, sample_data, model_path):
+    """
+    Check that Parquet input and output are supported when pyarrow is installed.
+    """
+    pytest.importorskip("pyarrow")
+    X, _ = sample_data
+    input_path = str(tmp_path / "input.parquet")
+    output_path = str(tmp_path / "predictions.parquet")
+    X.to_parquet(input_path, index=False)
+    predict_file(model_path, input_path, output_path, chunksize=64)
+    predictions = pd.read_parquet(output_path)
+    assert len(predictions) == len(X)
+    np.testing.assert_array_equal(predictions["patient_id"], X["patient_id"])
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_predict_file_header_only(tmp_path, sample_data, model_path, n_jobs):
+    """
+    Check that an input with only a header is not passed to the model and
+    gives a predictions file with only the header.
+    """
+    X, _ = sample_data
+    input_path = str(tmp_path / "input.csv")
+    output_path = str(tmp_path / "predictions.csv")
+    X.iloc[:0].to_csv(input_path, index=False)
+    assert predict_file(model_path, input_path, output_path, chunksize=40, n_jobs=n_jobs) == 0
+    predictions = pd.read_csv(output_path)
+    assert list(predictions.columns) == ["patient_id", "prediction", "decision_score"]
+    assert len(predictions) == 0
+
+
+def test_predict_file_invalid_chunksize(tmp_path, model_path):
+    """
+    Confirm that a non-positive chunksize raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        predict_file(model_path, "input.csv", str(tmp_path / "predictions.csv"), chunksize=0)
@@ -0,0 +1,89 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+from sklearn.metrics import fbeta_score
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.bootstrap import bootstrap_ci, bootstrap_counts, paired_permutation_test
+from heart_disease_predictor.utils.evaluation import confusion_codes
+
+
+@pytest.fixture
+def predictions():
+    """
+    Generate test labels and the predictions of a good and of a weaker model.
+
+    Returns
+    -------
+    tuple of (pd.Series, numpy.ndarray, numpy.ndarray)
+        - y : String test labels.
+        - good : Predictions with 5% of the labels flipped.
+        - weak : Predictions with 30% of the labels flipped.
+    """
+    rng = np.random.default_rng(0)
+    y = pd.Series(np.where(rng.random(300) < 0.6, "Heart Disease", "No Heart Disease"))
+    flip = {"Heart Disease": "No Heart Disease", "No Heart Disease": "Heart Disease"}
+    good = np.where(rng.random(300) < 0.05, y.map(flip), y)
+    weak = np.where(rng.random(300) < 0.3, y.map(flip), y)
+    return y, good, weak
+
+
+def test_bootstrap_counts_match_index_resampling(predictions):
+    """
+    Test that every batched resample has the counts of the rows it indexes,
+    whatever the batch size and number of worker processes.
+    """
+    y, good, _ = predictions
+    codes = confusion_codes(y, good, "Heart Disease")
+    counts = bootstrap_counts(codes, n_resamples=250, seed=1, batch_size=100)
+    assert counts.shape == (250, 4)
+    assert (counts.sum(axis=1) == len(codes)).all()
+
+    first = np.random.default_rng(np.random.SeedSequence(1).spawn(3)[0])
+    indices = first.integers(0, len(codes), size=(100, len(codes)))
+    np.testing.assert_array_equal(counts[7], np.bincount(codes[indices[7]], minlength=4))
+    np.testing.assert_array_equal(counts, bootstrap_counts(codes, n_resamples=250, seed=1, batch_size=100, n_jobs=2))
+
+
+def test_bootstrap_ci_contains_point_estimate(predictions):
+    """
+    Test that the F2 interval brackets the test F2 and narrows with a lower
+    confidence level.
+    """
+    y, good, _ = predictions
+    codes = confusion_codes(y, good, "Heart Disease")
+    f2 = fbeta_score(y, good, beta=2, pos_label="Heart Disease")
+    wide = bootstrap_ci(codes, n_resamples=2000, confidence_level=0.95)
+    narrow = bootstrap_ci(codes, n_resamples=2000, confidence_level=0.5)
+    assert wide["f2"][0] < f2 < wide["f2"][1]
+    assert wide["f2"][0] < narrow["f2"][0] < narrow["f2"][1] < wide["f2"][1]
+    assert set(wide) == {"accuracy", "precision", "recall", "specificity", "f0.5", "f1", "f2"}
+    with pytest.raises(ValueError):
+        bootstrap_ci(codes, confidence_level=1.5)
+
+
+def test_paired_permutation_test(predictions):
+    """
+    Test that a clearly better model gets a small p-value and a model
+    compared with itself a p-value of 1.
+    """
+    y, good, weak = predictions
+    codes_good = confusion_codes(y, good, "Heart Disease")
+    codes_weak = confusion_codes(y, weak, "Heart Disease")
+    difference, p_value = paired_permutation_test(codes_good, codes_weak, n_permutations=2000)
+    assert difference == pytest.approx(fbeta_score(y, good, beta=2, pos_label="Heart Disease")
+                                       - fbeta_score(y, weak, beta=2, pos_label="Heart Disease"))
+    assert p_value < 0.01
+    assert paired_permutation_test(codes_good, codes_good, n_permutations=200) == (0.0, 1.0)
+
+
+def test_paired_permutation_test_different_labels(predictions):
+    """
+    Test that codes computed from different test labels are rejected.
+    """
+    y, good, weak = predictions
+    with pytest.raises(ValueError, match="different y_true"):
+        paired_permutation_test(confusion_codes(y, good, "Heart Disease"),
+                                confusion_codes(y.iloc[::-1], weak, "Heart Disease"))
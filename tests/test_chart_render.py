@@ -0,0 +1,81 @@
+import pytest
+import sys
+import os
+import threading
+import altair as alt
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.chart_render import render_charts
+
+
+@pytest.fixture
+def builders():
+    """
+    Provide builders of two small independent charts.
+
+    Returns
+    -------
+    dict
+        File name -> callable returning an Altair chart.
+    """
+    df = pd.DataFrame({"x": [1, 2, 3, 4], "y": [3, 1, 4, 1], "target": ["a", "b", "a", "b"]})
+    return {
+        "points": lambda: alt.Chart(df).mark_point().encode(x="x:Q", y="y:Q"),
+        "bars": lambda: alt.Chart(df).mark_bar().encode(x="target:N", y="count()"),
+    }
+
+
+def test_render_charts_html(tmp_path, builders):
+    """
+    Test that every chart is saved under its name with the extension of the format.
+    """
+    paths = render_charts(builders, str(tmp_path / "charts"), chart_format="html")
+    assert list(paths) == ["points", "bars"]
+    for name, path in paths.items():
+        assert path == str(tmp_path / "charts" / f"{name}.html")
+        assert "vega" in open(path).read()
+
+
+@pytest.mark.parametrize("chart_format", ["png", "svg"])
+def test_render_charts_pool_matches_sequential(tmp_path, builders, chart_format):
+    """
+    Test that charts rendered concurrently are identical to charts rendered one by one.
+    """
+    pytest.importorskip("vl_convert")
+    sequential = render_charts(builders, str(tmp_path / "sequential"), chart_format, n_jobs=1)
+    pooled = render_charts(builders, str(tmp_path / "pooled"), chart_format, n_jobs=2)
+    for name in builders:
+        assert open(sequential[name], "rb").read() == open(pooled[name], "rb").read()
+
+
+def test_render_charts_builds_concurrently(tmp_path, builders):
+    """
+    Test that the charts are built at the same time: each builder waits on a
+    barrier that only opens once both have started.
+    """
+    barrier = threading.Barrier(2, timeout=10)
+
+    def waiting(build):
+        def wrapped():
+            barrier.wait()
+            return build()
+        return wrapped
+
+    paths = render_charts({name: waiting(build) for name, build in builders.items()}, str(tmp_path),
+                          chart_format="html")
+    assert all(os.path.exists(path) for path in paths.values())
+
+
+def test_render_charts_errors(tmp_path, builders):
+    """
+    Test that unknown formats are rejected and a failing chart is reported by name.
+    """
+    with pytest.raises(ValueError, match="chart_format must be one of"):
+        render_charts(builders, str(tmp_path), chart_format="pdf")
+
+    def broken():
+        raise KeyError("missing_column")
+
+    with pytest.raises(RuntimeError, match="Chart 'broken' failed"):
+        render_charts({**builders, "broken": broken}, str(tmp_path), chart_format="html")
@@ -0,0 +1,135 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.chunked_validation import RowHashSet, validate_csv_in_chunks
+from heart_disease_predictor.utils.heart_schema import COLUMNS, schema
+
+
+@pytest.fixture
+def heart_csv(tmp_path):
+    """
+    Write fifty valid heart rows to a CSV file with a header to be replaced.
+
+    Returns
+    -------
+    tuple of (str, pd.DataFrame)
+        - Path of the CSV file.
+        - The rows written to it.
+    """
+    rng = np.random.default_rng(0)
+    n = 50
+    heart = pd.DataFrame({
+        'patient_id': np.arange(1, n + 1),
+        'age': rng.integers(20, 80, n),
+        'gender': rng.integers(0, 2, n),
+        'chest_pain': rng.integers(0, 4, n),
+        'resting_bp': rng.integers(100, 180, n),
+        'serum_cholesterol': rng.integers(150, 400, n),
+        'fasting_blood_sugar': rng.integers(0, 2, n),
+        'resting_electro': rng.integers(0, 3, n),
+        'max_heart_rate': rng.integers(80, 200, n),
+        'exercise_angina': rng.integers(0, 2, n),
+        'old_peak': np.round(rng.uniform(0, 6, n), 1),
+        'slope': rng.integers(1, 4, n),
+        'num_major_vessels': rng.integers(0, 4, n),
+        'target': rng.integers(0, 2, n),
+    })
+    path = tmp_path / "raw.csv"
+    heart.to_csv(path, index=False, header=[f"col{i}" for i in range(len(COLUMNS))])
+    return str(path), heart
+
+
+def test_chunked_output_matches_in_memory(heart_csv, tmp_path):
+    """
+    Test that validating in chunks writes the same file as validating the whole data.
+    """
+    path, heart = heart_csv
+    output = tmp_path / "heart_validated.csv"
+    n_rows = validate_csv_in_chunks(path, str(output), schema, names=COLUMNS, chunksize=7)
+    expected = tmp_path / "expected.csv"
+    heart.to_csv(expected, index=False)
+    assert n_rows == 50
+    assert output.read_bytes() == expected.read_bytes()
+    assert not os.path.exists(str(output) + ".partial")
+
+
+def test_chunked_duplicates_across_chunks(heart_csv, tmp_path):
+    """
+    Test that a row repeating a row of an earlier chunk fails validation and
+    that no validated file is left behind.
+    """
+    path, heart = heart_csv
+    pd.concat([heart, heart.iloc[[2]]]).to_csv(path, index=False)
+    output = tmp_path / "heart_validated.csv"
+    report = tmp_path / "failures.csv"
+    with pytest.raises(ValueError, match="1 failure cases found in 51 rows"):
+        validate_csv_in_chunks(path, str(output), schema, names=COLUMNS, chunksize=10, report_path=str(report))
+    assert not output.exists()
+    failures = pd.read_csv(report)
+    assert failures["check"].tolist() == ["duplicate_rows_across_chunks"]
+    assert failures["index"].tolist() == [50]
+
+
+def test_chunked_failure_report_is_bounded(heart_csv, tmp_path):
+    """
+    Test that all failures are counted but only the first max_failure_cases are kept,
+    with row numbers counted from the start of the file.
+    """
+    path, heart = heart_csv
+    heart.loc[[5, 15, 25, 35], 'age'] = 150
+    heart.to_csv(path, index=False)
+    report = tmp_path / "failures.csv"
+    with pytest.raises(ValueError, match="4 failure cases"):
+        validate_csv_in_chunks(path, str(tmp_path / "out.csv"), schema, names=COLUMNS, chunksize=10,
+                               max_failure_cases=3, report_path=str(report))
+    failures = pd.read_csv(report)
+    assert failures["index"].tolist() == [5, 15, 25]
+    assert (failures["column"] == "age").all()
+
+
+def test_chunked_stale_report_is_removed(heart_csv, tmp_path):
+    """
+    Test that the failure report of an earlier invalid run does not outlive a valid run.
+    """
+    path, heart = heart_csv
+    report = tmp_path / "failures.csv"
+    heart.loc[5, 'age'] = 150
+    heart.to_csv(path, index=False)
+    with pytest.raises(ValueError, match="1 failure cases"):
+        validate_csv_in_chunks(path, str(tmp_path / "out.csv"), schema, names=COLUMNS, chunksize=10,
+                               report_path=str(report))
+    assert report.exists()
+
+    heart.loc[5, 'age'] = 50
+    heart.to_csv(path, index=False)
+    assert validate_csv_in_chunks(path, str(tmp_path / "out.csv"), schema, names=COLUMNS, chunksize=10,
+                                  report_path=str(report)) == 50
+    assert not report.exists()
+
+
+def test_chunked_invalid_chunksize(heart_csv, tmp_path):
+    """
+    Test that a chunksize below one is rejected.
+    """
+    path, _ = heart_csv
+    with pytest.raises(ValueError, match="chunksize"):
+        validate_csv_in_chunks(path, str(tmp_path / "out.csv"), schema, names=COLUMNS, chunksize=0)
+
+
+def test_row_hash_set():
+    """
+    Test that RowHashSet remembers every added hash across merged runs.
+    """
+    rng = np.random.default_rng(1)
+    hashes = rng.integers(0, 2**63, size=1000, dtype=np.int64).astype(np.uint64)
+    seen = RowHashSet()
+    for batch in np.array_split(hashes[:900], 9):
+        seen.add(batch)
+    assert len(seen) == 900
+    assert len(seen.runs) < 9
+    assert seen.contains(hashes[:900]).all()
+    assert not seen.contains(hashes[900:]).any()
@@ -0,0 +1,56 @@
+import pytest
+import sys
+import os
+import subprocess
+from click.testing import CliRunner
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.scripts.cli import STAGES, main
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+HEAVY_LIBRARIES = ["pandas", "numpy", "sklearn", "altair", "pandera", "matplotlib", "pyarrow", "requests"]
+
+
+def imported_libraries(code):
+    """Heavy libraries present in sys.modules after running code in a fresh interpreter."""
+    check = f"{code}\nimport sys\nprint(' '.join(m for m in {HEAVY_LIBRARIES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", check], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def test_cli_lists_every_stage():
+    """
+    Test that the help of the group lists every stage.
+    """
+    result = CliRunner().invoke(main, ["--help"])
+    assert result.exit_code == 0
+    for name in STAGES:
+        assert name in result.output
+
+
+@pytest.mark.parametrize("stage", list(STAGES))
+def test_stage_help(stage):
+    """
+    Test that every stage resolves to a click command with its own options.
+    """
+    result = CliRunner().invoke(main, [stage, "--help"])
+    assert result.exit_code == 0
+    assert f"{stage} [OPTIONS]" in result.output
+
+
+def test_stage_modules_import_no_heavy_library():
+    """
+    Test that importing the CLI and every stage module does not import the
+    libraries the stages use, which are only imported when a stage runs.
+    """
+    modules = "; ".join(f"import {module}" for module, _ in STAGES.values())
+    assert imported_libraries(f"import heart_disease_predictor.scripts.cli; {modules}") == []
+
+
+def test_unknown_stage():
+    """
+    Test that an unknown stage fails like an unknown click command.
+    """
+    result = CliRunner().invoke(main, ["train"])
+    assert result.exit_code != 0
+    assert "No such command 'train'" in result.output
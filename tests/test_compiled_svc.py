@@ -0,0 +1,168 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+from sklearn import config_context
+from sklearn.compose import make_column_transformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler, OneHotEncoder, OrdinalEncoder
+from sklearn.svm import SVC
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.batch_predict import load_model, score_chunk
+from heart_disease_predictor.utils.compiled_svc import CompiledSVC, _category_codes, compile_svc_pipeline
+
+
+@pytest.fixture
+def heart_like_data():
+    """
+    Generate a dataset with the column types of the heart data.
+
+    Returns
+    -------
+    tuple of (pd.DataFrame, pd.Series)
+        - X : Numerical, one-hot, ordinal, binary and id columns.
+        - y : String target labels.
+    """
+    rng = np.random.default_rng(0)
+    n = 200
+    X = pd.DataFrame({
+        'age': rng.integers(20, 80, n),
+        'old_peak': np.round(rng.uniform(0, 6, n), 1),
+        'chest_pain': rng.integers(0, 4, n),
+        'resting_electro': rng.integers(0, 3, n),
+        'slope': rng.integers(1, 4, n),
+        'gender': rng.integers(0, 2, n),
+        'patient_id': np.arange(n),
+    })
+    score = (X['age'] - 50) / 10 + X['chest_pain'] - X['slope'] + rng.normal(0, 1, n)
+    y = pd.Series(np.where(score > 0, 'Heart Disease', 'No Heart Disease'))
+    return X, y
+
+
+def make_svc_pipeline(handle_unknown='error'):
+    """
+    Build an unfitted pipeline shaped like the final model.
+    """
+    preprocessor = make_column_transformer(
+        (StandardScaler(), ['age', 'old_peak']),
+        (OneHotEncoder(sparse_output=False, handle_unknown=handle_unknown), ['chest_pain', 'resting_electro']),
+        (OrdinalEncoder(), ['slope']),
+        ('passthrough', ['gender']),
+        ('drop', ['patient_id']))
+    return make_pipeline(preprocessor, SVC(C=10.0, gamma=0.1))
+
+
+def test_compiled_matches_pipeline(heart_like_data):
+    """
+    Test that the kernel reproduces the decision values and predictions of the pipeline.
+    """
+    X, y = heart_like_data
+    with config_context(transform_output="pandas"):
+        pipeline = make_svc_pipeline().fit(X, y)
+        expected = pipeline.decision_function(X)
+        expected_pred = pipeline.predict(X)
+    compiled = compile_svc_pipeline(pipeline)
+    np.testing.assert_allclose(compiled.decision_function(X), expected, rtol=0, atol=1e-10)
+    np.testing.assert_allclose(compiled.decision_function(X, block_size=7), expected, rtol=0, atol=1e-10)
+    np.testing.assert_array_equal(compiled.predict(X), expected_pred)
+    np.testing.assert_array_equal(compiled.classes_, pipeline.classes_)
+
+
+def test_compiled_save_load(tmp_path, heart_like_data):
+    """
+    Test that a saved kernel loads without pickle and scores like the original,
+    including through load_model and score_chunk.
+    """
+    X, y = heart_like_data
+    pipeline = make_svc_pipeline().fit(X, y)
+    compiled = compile_svc_pipeline(pipeline)
+    path = str(tmp_path / "compiled_model.npz")
+    compiled.save(path)
+    loaded = load_model(path)
+    assert isinstance(loaded, CompiledSVC)
+    np.testing.assert_array_equal(loaded.decision_function(X), compiled.decision_function(X))
+    pd.testing.assert_frame_equal(score_chunk(loaded, X, id_col='patient_id'),
+                                  score_chunk(compiled, X, id_col='patient_id'))
+
+
+def test_compiled_unknown_categories(heart_like_data):
+    """
+    Test that unknown categories raise by default and are handled like
+    OneHotEncoder(handle_unknown='ignore') otherwise.
+    """
+    X, y = heart_like_data
+    X_new = X.head(5).assign(chest_pain=[0, 1, 9, 2, 9])
+    compiled = compile_svc_pipeline(make_svc_pipeline().fit(X, y))
+    with pytest.raises(ValueError, match="unknown categories in column 'chest_pain'"):
+        compiled.decision_function(X_new)
+
+    pipeline = make_svc_pipeline(handle_unknown='ignore').fit(X, y)
+    expected = pipeline.decision_function(X_new)
+    np.testing.assert_allclose(compile_svc_pipeline(pipeline).decision_function(X_new), expected, atol=1e-10)
+
+
+def test_compiled_rejects_nan(heart_like_data):
+    """
+    Test that missing values are rejected like the SVC does.
+    """
+    X, y = heart_like_data
+    compiled = compile_svc_pipeline(make_svc_pipeline().fit(X, y))
+    with pytest.raises(ValueError, match="NaN"):
+        compiled.decision_function(X.head(3).assign(age=[50, np.nan, 60]))
+
+
+def test_compile_unsupported_pipeline(heart_like_data):
+    """
+    Test that pipelines the kernel cannot represent are rejected.
+    """
+    X, y = heart_like_data
+    pipeline = make_svc_pipeline()
+    pipeline.steps[-1] = ('logisticregression', LogisticRegression())
+    with pytest.raises(ValueError, match="ColumnTransformer followed by an SVC"):
+        compile_svc_pipeline(pipeline.fit(X, y))
+
+    pipeline = make_svc_pipeline()
+    pipeline.set_params(svc__kernel='linear')
+    with pytest.raises(ValueError, match="RBF kernel"):
+        compile_svc_pipeline(pipeline.fit(X, y))
+
+
+@pytest.mark.parametrize("values, categories, expected", [
+    (np.array([1.5, 2.0, np.nan]), np.array([0, 1, 2, 3]), [-1, 2, -1]),
+    (np.array(["abc", "a", "b"]), np.array(["a", "b"]), [-1, 0, 1]),
+    (np.array(["abc", "b", np.nan], dtype=object), np.array(["a", "b"]), [-1, 1, -1]),
+    (np.array([np.nan, 1.0]), np.array([1.0, np.nan]), [1, 0]),
+])
+def test_category_codes_compare_in_own_dtype(values, categories, expected):
+    """
+    Test that values are not coerced to the dtype of the categories, so floats,
+    longer strings and NaN do not match integer or shorter string categories.
+    """
+    np.testing.assert_array_equal(_category_codes(values, categories), expected)
+
+
+def test_compiled_unknown_float_and_string_inputs(tmp_path, heart_like_data):
+    """
+    Test that float inputs against integer categories and longer strings against
+    string categories are unknown to the kernel exactly when they are to the pipeline.
+    """
+    X, y = heart_like_data
+    X = X.assign(resting_electro=np.array(["a", "b", "c"])[X["resting_electro"]])
+    pipeline = make_svc_pipeline(handle_unknown='ignore').fit(X, y)
+    compiled = compile_svc_pipeline(pipeline)
+    path = str(tmp_path / "compiled_model.npz")
+    compiled.save(path)
+
+    X_new = X.head(4).assign(chest_pain=[1.5, 2.0, np.nan, 3.0], resting_electro=["abc", "a", "bb", "c"])
+    expected = pipeline.decision_function(X_new)
+    for kernel in (compiled, CompiledSVC.load(path)):
+        np.testing.assert_allclose(kernel.decision_function(X_new), expected, atol=1e-10)
+
+    strict = compile_svc_pipeline(make_svc_pipeline().fit(X, y))
+    with pytest.raises(ValueError, match="unknown categories in column 'chest_pain'"):
+        strict.decision_function(X.head(2).assign(chest_pain=[1.5, 2.0]))
+    with pytest.raises(ValueError, match="unknown categories in column 'resting_electro'"):
+        strict.decision_function(X.head(2).assign(resting_electro=["abc", "a"]))
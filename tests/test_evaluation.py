@@ -0,0 +1,100 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import (accuracy_score, average_precision_score, confusion_matrix, fbeta_score,
+                             precision_score, recall_score, roc_auc_score)
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.evaluation import confusion_codes, confusion_counts, evaluate_model, metrics_from_counts, positive_scores
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a noisy binary dataset with the heart target labels.
+
+    Returns
+    -------
+    tuple of (pd.DataFrame, pd.Series)
+        - X : Feature matrix with named columns.
+        - y : String target labels.
+    """
+    X, y = make_classification(n_samples=300, n_features=4, flip_y=0.1, random_state=0)
+    X = pd.DataFrame(X, columns=[f"feature_{i}" for i in range(4)])
+    y = pd.Series(np.where(y == 1, "No Heart Disease", "Heart Disease"))
+    return X, y
+
+
+@pytest.mark.parametrize("model", [SVC(), LogisticRegression(), DecisionTreeClassifier(max_depth=3, random_state=0)])
+def test_positive_scores_single_pass(sample_data, model):
+    """
+    Test that the predictions derived from the scores equal model.predict and
+    that the scores grow with the positive class, whatever its position in classes_.
+    """
+    X, y = sample_data
+    model.fit(X, y)
+    scores, y_pred = positive_scores(model, X, "Heart Disease")
+    np.testing.assert_array_equal(y_pred, model.predict(X))
+    assert roc_auc_score(y == "Heart Disease", scores) > 0.5
+
+
+def test_evaluate_model_matches_sklearn(sample_data):
+    """
+    Test that every metric of the report matches the sklearn function computing it.
+    """
+    X, y = sample_data
+    model = SVC().fit(X, y)
+    report, y_pred = evaluate_model(model, X, y, "Heart Disease", betas=(0.5, 2.0))
+    metrics = report["metrics"]
+    kwargs = dict(pos_label="Heart Disease")
+
+    assert report["confusion_matrix"]["labels"] == ["No Heart Disease", "Heart Disease"]
+    assert report["confusion_matrix"]["matrix"] == confusion_matrix(
+        y, y_pred, labels=["No Heart Disease", "Heart Disease"]).tolist()
+    assert metrics["accuracy"] == pytest.approx(accuracy_score(y, y_pred))
+    assert metrics["precision"] == pytest.approx(precision_score(y, y_pred, **kwargs))
+    assert metrics["recall"] == pytest.approx(recall_score(y, y_pred, **kwargs))
+    assert metrics["f0.5"] == pytest.approx(fbeta_score(y, y_pred, beta=0.5, **kwargs))
+    assert metrics["f2"] == pytest.approx(fbeta_score(y, y_pred, beta=2, **kwargs))
+    assert report["roc"]["auc"] == pytest.approx(roc_auc_score(y == "Heart Disease", -model.decision_function(X)))
+    assert report["pr"]["average_precision"] == pytest.approx(
+        average_precision_score(y == "Heart Disease", -model.decision_function(X)))
+    assert report["roc"]["thresholds"][0] is None
+
+
+def test_metrics_from_counts_vectorized():
+    """
+    Test that batched counts give the metrics of each row, with 0 for empty denominators.
+    """
+    counts = np.array([[5, 1, 2, 7], [3, 0, 0, 0]])
+    metrics = metrics_from_counts(counts, betas=(1.0,))
+    single = metrics_from_counts(counts[0], betas=(1.0,))
+    assert isinstance(single["f1"], float)
+    assert metrics["f1"][0] == single["f1"] == pytest.approx(2 * 7 / (2 * 7 + 2 + 1))
+    assert metrics["precision"][1] == metrics["recall"][1] == metrics["f1"][1] == 0.0
+    assert metrics["specificity"][1] == 1.0
+
+
+def test_confusion_counts_batched():
+    """
+    Test that the counts of a batch of code rows match counting each row on its own.
+    """
+    codes = np.random.default_rng(0).integers(0, 4, size=(3, 50))
+    batched = confusion_counts(codes)
+    for row, code_row in zip(batched, codes):
+        np.testing.assert_array_equal(row, np.bincount(code_row, minlength=4))
+
+
+def test_positive_scores_invalid_pos_label(sample_data):
+    """
+    Test that a positive label that is not a class raises a ValueError.
+    """
+    X, y = sample_data
+    with pytest.raises(ValueError, match="not one of the two classes"):
+        positive_scores(LogisticRegression().fit(X, y), X, "Heart disease")
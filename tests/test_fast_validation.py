@@ -0,0 +1,132 @@
+import pytest
+import sys
+import os
+import warnings
+import numpy as np
+import pandas as pd
+import pandera.pandas as pa
+from pandera.errors import SchemaErrors, SchemaWarning
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.fast_validation import duplicated_rows, row_hashes, validate
+from heart_disease_predictor.utils.heart_schema import schema
+
+
+@pytest.fixture
+def heart_rows():
+    """
+    Generate valid rows for the heart schema.
+
+    Returns
+    -------
+    pd.DataFrame
+        Twenty rows with every column inside its allowed range.
+    """
+    rng = np.random.default_rng(0)
+    n = 20
+    return pd.DataFrame({
+        'patient_id': np.arange(1, n + 1),
+        'age': rng.integers(20, 80, n),
+        'gender': rng.integers(0, 2, n),
+        'chest_pain': rng.integers(0, 4, n),
+        'resting_bp': rng.integers(100, 180, n),
+        'serum_cholesterol': rng.integers(150, 400, n),
+        'fasting_blood_sugar': rng.integers(0, 2, n),
+        'resting_electro': rng.integers(0, 3, n),
+        'max_heart_rate': rng.integers(80, 200, n),
+        'exercise_angina': rng.integers(0, 2, n),
+        'old_peak': np.round(rng.uniform(0, 6, n), 1),
+        'slope': rng.integers(1, 4, n),
+        'num_major_vessels': rng.integers(0, 4, n),
+        'target': rng.integers(0, 2, n),
+    })
+
+
+def run_validation(validate_fn, df):
+    """
+    Validate df and return the sorted failure cases (None if valid) and the schema warning messages.
+    """
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            validate_fn(df)
+            failure_cases = None
+        except SchemaErrors as exc:
+            failure_cases = (exc.failure_cases.astype(str)
+                             .sort_values(["schema_context", "column", "check", "index"])
+                             .reset_index(drop=True))
+    return failure_cases, [str(w.message) for w in caught if issubclass(w.category, SchemaWarning)]
+
+
+def test_validate_valid_data(heart_rows):
+    """
+    Test that valid data passes unchanged and without warnings.
+    """
+    failure_cases, messages = run_validation(lambda df: validate(df, schema), heart_rows)
+    assert failure_cases is None
+    assert messages == []
+    pd.testing.assert_frame_equal(validate(heart_rows, schema), heart_rows)
+
+
+def test_validate_matches_pandera(heart_rows):
+    """
+    Test that range, isin, null, dtype and duplicate failures and the warnings
+    of warn-only checks are reported exactly as Pandera reports them.
+    """
+    df = pd.concat([heart_rows, heart_rows.iloc[[2]]], ignore_index=True)
+    df.loc[0, 'age'] = 120
+    df.loc[1, 'serum_cholesterol'] = 50
+    df.loc[3, 'slope'] = 0
+    df.loc[4, 'target'] = 3
+    df.loc[5, 'resting_bp'] = np.nan
+    df.loc[6, 'patient_id'] = np.nan
+
+    expected = run_validation(lambda d: schema.validate(d, lazy=True), df)
+    result = run_validation(lambda d: validate(d, schema), df)
+
+    assert result[1] == expected[1]
+    assert len(result[1]) == 2
+    pd.testing.assert_frame_equal(result[0], expected[0])
+    assert set(result[0]["check"]) >= {"in_range(0, 90)", "isin([0, 1])", "not_nullable", "Duplicate rows found."}
+
+
+def test_validate_missing_column(heart_rows):
+    """
+    Test that a missing column is reported like Pandera does.
+    """
+    df = heart_rows.drop(columns='gender')
+    expected = run_validation(lambda d: schema.validate(d, lazy=True), df)
+    result = run_validation(lambda d: validate(d, schema), df)
+    pd.testing.assert_frame_equal(result[0], expected[0])
+
+
+def test_validate_custom_check_falls_back_to_pandera():
+    """
+    Test that columns with checks that cannot be vectorized are validated by Pandera.
+    """
+    custom = pa.DataFrameSchema({'a': pa.Column(int, pa.Check(lambda s: s % 2 == 0, element_wise=True))})
+    df = pd.DataFrame({'a': [2, 3, 4, 5]})
+    expected = run_validation(lambda d: custom.validate(d, lazy=True), df)
+    result = run_validation(lambda d: validate(d, custom), df)
+    pd.testing.assert_frame_equal(result[0], expected[0])
+
+
+def test_duplicated_rows_matches_pandas(heart_rows):
+    """
+    Test that the hash-based duplicate detection flags the same rows as DataFrame.duplicated.
+    """
+    df = pd.concat([heart_rows, heart_rows.iloc[[3, 7, 3]]], ignore_index=True)
+    df['old_peak'] = df['old_peak'].astype(float)
+    df.loc[[7, 21], 'old_peak'] = np.nan
+    pd.testing.assert_series_equal(duplicated_rows(df), df.duplicated())
+    assert duplicated_rows(df).sum() == 3
+
+
+def test_row_hashes_ignore_integer_vs_float():
+    """
+    Test that an integer column hashes like the same values read as float.
+    """
+    ints = pd.DataFrame({'a': [1, 2, 3], 'b': [0.5, -0.0, 1.5]})
+    floats = pd.DataFrame({'a': [1.0, 2.0, 3.0], 'b': [0.5, 0.0, 1.5]})
+    np.testing.assert_array_equal(row_hashes(ints), row_hashes(floats))
+    assert len(np.unique(row_hashes(ints))) == 3
@@ -0,0 +1,159 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+from sklearn.compose import make_column_transformer
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import cross_validate
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler, OneHotEncoder
+from sklearn.svm import SVC
+from sklearn.metrics import fbeta_score, make_scorer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.fold_cache import FoldCache
+from heart_disease_predictor.utils.mean_std_cv_scores import mean_std_cross_val_scores
+from heart_disease_predictor.utils.optimal_hyperparameters import tune_all_hyperparameters
+
+
+@pytest.fixture
+def sample_data():
+    """
+    Generate a small dataset with numerical and categorical columns.
+
+    Returns
+    -------
+    tuple of (pd.DataFrame, pd.Series)
+        - X : Feature matrix with three numerical and one categorical column.
+        - y : String target labels.
+    """
+    X, y = make_classification(n_samples=120, n_features=3, n_informative=2, n_redundant=0, random_state=42)
+    X = pd.DataFrame(X, columns=["a", "b", "c"])
+    X["group"] = np.array(["x", "y", "z"])[np.arange(120) % 3]
+    y = pd.Series(np.where(y == 1, "Heart Disease", "No Heart Disease"))
+    return X, y
+
+
+@pytest.fixture
+def sample_preprocessor():
+    """
+    Provide a column transformer similar to the heart preprocessor.
+
+    Returns
+    -------
+    sklearn.compose.ColumnTransformer
+        Scales the numerical columns and one-hot encodes the categorical one.
+    """
+    return make_column_transformer(
+        (StandardScaler(), ["a", "b", "c"]),
+        (OneHotEncoder(sparse_output=False), ["group"]))
+
+
+@pytest.fixture
+def scorer():
+    """
+    Provide the F2 scorer used by the pipeline.
+    """
+    return make_scorer(fbeta_score, pos_label="Heart Disease", beta=2)
+
+
+def test_cross_validate_matches_pipeline(sample_data, sample_preprocessor, scorer):
+    """
+    Check that the cached cross-validation gives exactly the same fold scores
+    as cross_validate on the full pipeline.
+    """
+    X, y = sample_data
+    cache = FoldCache()
+    for model in [LogisticRegression(), SVC(C=10.0, gamma=0.1)]:
+        pipe = make_pipeline(sample_preprocessor, model)
+        expected = cross_validate(pipe, X, y, cv=5, scoring=scorer, return_train_score=True)
+        cached = cache.cross_validate(pipe, X, y, cv=5, scoring=scorer, return_train_score=True)
+        np.testing.assert_array_equal(cached["test_score"], expected["test_score"])
+        np.testing.assert_array_equal(cached["train_score"], expected["train_score"])
+
+
+def test_cross_validate_multiple_scorers(sample_data, sample_preprocessor, scorer):
+    """
+    Check that several scorers are evaluated on the same fits and named
+    like cross_validate names them.
+    """
+    X, y = sample_data
+    pipe = make_pipeline(sample_preprocessor, LogisticRegression())
+    scoring = {"f2": scorer, "accuracy": "accuracy"}
+    expected = cross_validate(pipe, X, y, cv=5, scoring=scoring, return_train_score=True)
+    cached = FoldCache().cross_validate(pipe, X, y, cv=5, scoring=scoring, return_train_score=True)
+    assert list(cached) == list(expected)
+    for key in ["test_f2", "train_f2", "test_accuracy", "train_accuracy"]:
+        np.testing.assert_array_equal(cached[key], expected[key])
+
+
+def test_folds_shared_across_models(sample_data, sample_preprocessor, scorer):
+    """
+    Check that the preprocessor is only fit once per fold for several models.
+    """
+    X, y = sample_data
+    cache = FoldCache()
+    cache.cross_validate(make_pipeline(sample_preprocessor, LogisticRegression()), X, y, cv=5, scoring=scorer)
+    cache.cross_validate(make_pipeline(sample_preprocessor, SVC()), X, y, cv=5, scoring=scorer)
+    assert cache.misses == 5
+    assert cache.hits == 5
+
+
+def test_fingerprint_changes_with_preprocessor(sample_data, sample_preprocessor):
+    """
+    Check that a preprocessor with different parameters gets its own entries.
+    """
+    X, y = sample_data
+    cache = FoldCache()
+    train, test = np.arange(0, 100), np.arange(100, 120)
+    cache.transform_fold(sample_preprocessor, X, y, train, test)
+    other = make_column_transformer((StandardScaler(with_mean=False), ["a", "b", "c"]), remainder="drop")
+    Xt_train, _ = cache.transform_fold(other, X, y, train, test)
+    assert cache.misses == 2
+    assert Xt_train.shape[1] == 3
+
+
+def test_on_disk_store(tmp_path, sample_data, sample_preprocessor, scorer):
+    """
+    Check that a second cache on the same directory reads the stored folds
+    back instead of refitting the preprocessor.
+    """
+    X, y = sample_data
+    pipe = make_pipeline(sample_preprocessor, LogisticRegression())
+    first = FoldCache(tmp_path).cross_validate(pipe, X, y, cv=3, scoring=scorer)
+    second_cache = FoldCache(tmp_path)
+    second = second_cache.cross_validate(pipe, X, y, cv=3, scoring=scorer)
+    assert second_cache.misses == 0
+    assert len(os.listdir(tmp_path)) == 3
+    np.testing.assert_array_equal(first["test_score"], second["test_score"])
+
+
+def test_mean_std_cross_val_scores_with_cache(sample_data, sample_preprocessor, scorer):
+    """
+    Check that mean_std_cross_val_scores gives the same summary with and
+    without a fold cache.
+    """
+    X, y = sample_data
+    pipe = make_pipeline(sample_preprocessor, LogisticRegression())
+    expected = mean_std_cross_val_scores(pipe, X, y, scoring=scorer, cv=5, return_train_score=True)
+    cached = mean_std_cross_val_scores(pipe, X, y, scoring=scorer, fold_cache=FoldCache(), cv=5, return_train_score=True)
+    assert list(cached.index) == list(expected.index)
+    assert cached["test_score"] == expected["test_score"]
+    assert cached["train_score"] == expected["train_score"]
+
+
+def test_tune_all_hyperparameters_with_cache(sample_data, sample_preprocessor):
+    """
+    Check that the tuning scheduler gives the same cv_results_ with a fold cache.
+    """
+    X, y = sample_data
+    models = {"Logistic Regression": LogisticRegression()}
+    param_dists = {"Logistic Regression": {"logisticregression__C": [0.01, 0.1, 1.0]}}
+    plain = tune_all_hyperparameters(X, y, models, sample_preprocessor, param_dists, "Heart Disease", 2, 42, n_jobs=1)
+    cached = tune_all_hyperparameters(X, y, models, sample_preprocessor, param_dists, "Heart Disease", 2, 42, n_jobs=1,
+                                      fold_cache=FoldCache())
+    np.testing.assert_array_equal(plain["Logistic Regression"].cv_results_["mean_test_score"],
+                                  cached["Logistic Regression"].cv_results_["mean_test_score"])
+    assert len(cached["Logistic Regression"].best_estimator_.predict(X)) == len(X)
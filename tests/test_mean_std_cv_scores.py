@@ -1,4 +1,5 @@
 # VSCode Copilot and ChatGPT was used to assit in writing this test file.
+import numpy as np
 import pandas as pd
 import pytest
 import sys
@@ -11,7 +12,7 @@ from sklearn.pipeline import make_pipeline
 from sklearn.metrics import make_scorer, fbeta_score
 from sklearn.utils._param_validation import InvalidParameterError
 
-from utils.mean_std_cv_scores import mean_std_cross_val_scores
+from heart_disease_predictor.utils.mean_std_cv_scores import mean_std_cross_val_scores, cv_scores_frame, render_mean_std
 
 def test_mean_std_cv_scores():
     """
@@ -109,4 +110,46 @@ def test_mean_std_cv_scores_mismatched_lengths():
     model = LogisticRegression()
 
     with pytest.raises(ValueError):
-        mean_std_cross_val_scores(model, X, y, scoring)
\ No newline at end of file
+        mean_std_cross_val_scores(model, X, y, scoring)
+
+def test_mean_std_cv_scores_structured():
+    """
+    Test the numeric (metric, statistic) result of mean_std_cross_val_scores
+    with several scorers, and that rendering it gives the string result.
+    """
+    X = pd.DataFrame({
+        "age": [20, 30, 40, 50, 60, 70],
+        "chol": [180, 200, 190, 210, 220, 230]
+    })
+    y = pd.Series(["No Heart Disease", "Heart Disease"] * 3)
+    scoring = {"f2": make_scorer(fbeta_score, beta=2, pos_label="Heart Disease"), "accuracy": "accuracy"}
+    model = make_pipeline(StandardScaler(), LogisticRegression())
+
+    scores = mean_std_cross_val_scores(model, X, y, scoring=scoring, cv=3, return_train_score=True, structured=True)
+
+    assert scores.dtype == np.float64
+    assert list(scores.index.names) == ["metric", "statistic"]
+    assert list(scores.index.get_level_values("metric").unique()) == [
+        "fit_time", "score_time", "test_f2", "train_f2", "test_accuracy", "train_accuracy"]
+    assert list(scores["test_f2"].index) == ["mean", "std", "split0", "split1", "split2"]
+    folds = scores["test_accuracy"][["split0", "split1", "split2"]]
+    assert scores["test_accuracy", "mean"] == pytest.approx(folds.mean())
+    assert scores["test_accuracy", "std"] == pytest.approx(folds.std())
+
+    rendered = render_mean_std(scores)
+    assert rendered["test_accuracy"] == "%0.3f (+/- %0.3f)" % (folds.mean(), folds.std())
+    frame = render_mean_std(pd.DataFrame({"A": scores, "B": scores}).T)
+    assert list(frame.index) == ["A", "B"]
+    assert (frame.loc["B"] == rendered).all()
+
+
+def test_cv_scores_frame_matches_pandas():
+    """
+    Test that cv_scores_frame gives the pandas mean and std of every metric.
+    """
+    scores = {"fit_time": np.array([0.1, 0.4, 0.2]), "test_score": np.array([0.8, 0.9, 0.85])}
+    frame = cv_scores_frame(scores)
+    expected = pd.DataFrame(scores)
+    np.testing.assert_allclose(frame.xs("mean", level="statistic"), expected.mean())
+    np.testing.assert_allclose(frame.xs("std", level="statistic"), expected.std())
+    assert render_mean_std(frame)["fit_time"] == "0.233 (+/- 0.153)"
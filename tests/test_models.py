@@ -6,10 +6,13 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from sklearn.dummy import DummyClassifier
 from sklearn.tree import DecisionTreeClassifier
-from sklearn.linear_model import LogisticRegression
-from sklearn.svm import SVC
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.svm import SVC, LinearSVC
+from sklearn.kernel_approximation import Nystroem, RBFSampler
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
 
-from utils.models import get_models
+from heart_disease_predictor.utils.models import get_models, get_param_dist
 
 def test_get_models():
     """
@@ -67,3 +70,33 @@ def test_get_models_return_type():
     """
     models = get_models(random_state=0)
     assert isinstance(models, dict)
+
+
+def test_get_models_approximate():
+    """
+    Test that approximate=True adds the approximate RBF kernel models with the random_state.
+    """
+    models = get_models(random_state=7, approximate=True)
+
+    assert set(models) == {"Dummy Classifier", "Decision Tree", "Logistic Regression", "SVM RBF",
+                           "Nystroem SVM", "RFF SGD"}
+    assert isinstance(models["Nystroem SVM"].named_steps["nystroem"], Nystroem)
+    assert isinstance(models["Nystroem SVM"].named_steps["linearsvc"], LinearSVC)
+    assert isinstance(models["RFF SGD"].named_steps["rbfsampler"], RBFSampler)
+    assert isinstance(models["RFF SGD"].named_steps["sgdclassifier"], SGDClassifier)
+    assert models["Nystroem SVM"].named_steps["nystroem"].random_state == 7
+    assert models["RFF SGD"].named_steps["sgdclassifier"].random_state == 7
+
+
+def test_get_param_dist_approximate():
+    """
+    Test that the approximate parameter distributions are valid for make_pipeline(preprocessor, model).
+    """
+    assert set(get_param_dist()) == {"Decision Tree", "Logistic Regression", "SVM RBF"}
+
+    param_dist = get_param_dist(approximate=True)
+    models = get_models(approximate=True)
+    for model_name in ["Nystroem SVM", "RFF SGD"]:
+        pipe = make_pipeline(StandardScaler(), models[model_name])
+        for name, values in param_dist[model_name].items():
+            pipe.set_params(**{name: values[0]})
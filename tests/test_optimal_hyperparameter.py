@@ -5,13 +5,16 @@ import pandas as pd
 import numpy as np
 from sklearn.datasets import make_classification
 from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
 from sklearn.preprocessing import StandardScaler
 from sklearn.pipeline import make_pipeline
-from sklearn.model_selection import RandomizedSearchCV
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import RandomizedSearchCV, HalvingRandomSearchCV
+from sklearn.exceptions import FitFailedWarning
 from sklearn.metrics import fbeta_score, make_scorer
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.optimal_hyperparameters import tune_hyperparameters
+from heart_disease_predictor.utils.optimal_hyperparameters import tune_hyperparameters, tune_all_hyperparameters, tune_regularization_path, tune_tree_depth, cv_results_table, SearchResult
 
 # Test cases and the corresponding docstrings are created using Copilot/ChatGPT
 
@@ -140,6 +143,48 @@ def test_tune_hyperparameters_small_dataset():
     result = tune_hyperparameters(X_train, y_train, model, preprocessor, param_dist, pos_label=1, beta=2, seed=42)
     assert isinstance(result, RandomizedSearchCV)
 
+# Successive halving strategies
+def test_tune_hyperparameters_halving_samples(sample_data, sample_preprocessor, sample_model):
+    """
+    Test that strategy="halving" grows the number of training samples
+    and returns a fitted HalvingRandomSearchCV.
+    """
+    X_train, y_train = sample_data
+    param_dist = {'logisticregression__C': np.logspace(-3, 2, 10)}
+    result = tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, param_dist, pos_label=1, beta=2, seed=42, strategy="halving")
+    assert isinstance(result, HalvingRandomSearchCV)
+    assert result.n_resources_[-1] > result.n_resources_[0]
+    assert 'logisticregression__C' in result.best_params_
+
+def test_tune_hyperparameters_halving_folds(sample_data, sample_preprocessor, sample_model):
+    """
+    Test that halving over folds only scores the survivors on every fold
+    and picks its best candidate among them.
+    """
+    X_train, y_train = sample_data
+    param_dist = {'logisticregression__C': np.logspace(-3, 2, 10)}
+    result = tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, param_dist, pos_label=1, beta=2, seed=42,
+                                  strategy="halving", resource="folds")
+    assert isinstance(result, SearchResult)
+    n_resources = result.cv_results_["n_resources"]
+    assert n_resources.min() == 1
+    assert n_resources[result.best_index_] == 5
+    assert (n_resources == 5).sum() < len(n_resources)
+    full = result.cv_results_["mean_test_score"][n_resources == 5]
+    assert result.best_score_ == full.max()
+
+def test_tune_hyperparameters_halving_folds_matches_full_scores(sample_data, sample_preprocessor, sample_model, sample_param_dist):
+    """
+    Check that the survivors of fold halving have the same fold scores
+    as in the full randomized search.
+    """
+    X_train, y_train = sample_data
+    random = tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist, pos_label=1, beta=2, seed=42)
+    halving = tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist, pos_label=1, beta=2, seed=42,
+                                   strategy="halving", resource="folds")
+    i = random.cv_results_["params"].index(halving.best_params_)
+    assert halving.best_score_ == random.cv_results_["mean_test_score"][i]
+
 # Abnormal, error or adversarial use cases
 def test_tune_hyperparameters_invalid_pos_label(sample_data, sample_preprocessor, sample_model, sample_param_dist):
     """
@@ -167,4 +212,231 @@ def test_tune_hyperparameters_invalid_beta(sample_data, sample_preprocessor, sam
     """
     X_train, y_train = sample_data
     with pytest.raises(ValueError):
-        tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist, pos_label=1, beta=-1, seed=42)
\ No newline at end of file
+        tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist, pos_label=1, beta=-1, seed=42)
+
+# Tests for cv_results_table function
+def test_cv_results_table(sample_data, sample_preprocessor, sample_model, sample_param_dist):
+    """
+    Check that the combined table has one row per candidate of every search
+    and a leading model column.
+    """
+    X_train, y_train = sample_data
+    search = tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist, pos_label=1, beta=2, seed=42)
+    table = cv_results_table({"First": search, "Second": search})
+    assert table.columns[0] == "model"
+    assert len(table) == 2 * len(search.cv_results_["params"])
+    assert set(table["model"]) == {"First", "Second"}
+    assert "mean_test_score" in table.columns
+
+
+# Tests for tune_all_hyperparameters function
+@pytest.fixture
+def sample_models():
+    """
+    Provide two models with their parameter distributions.
+
+    Returns
+    -------
+    tuple of (dict, dict)
+        - models : Model names mapped to unfitted estimators.
+        - param_dists : Model names mapped to parameter distributions.
+    """
+    models = {"Logistic Regression": LogisticRegression(random_state=42),
+              "Decision Tree": DecisionTreeClassifier(random_state=42)}
+    param_dists = {"Logistic Regression": {'logisticregression__C': [0.01, 0.1, 1.0, 10.0]},
+                   "Decision Tree": {'decisiontreeclassifier__max_depth': np.arange(1, 6)}}
+    return models, param_dists
+
+def test_tune_all_hyperparameters_matches_random_search(sample_data, sample_preprocessor, sample_models):
+    """
+    Check that the shared-pool scheduler reproduces the candidates, fold
+    scores and best parameters of a RandomizedSearchCV per model.
+    """
+    X_train, y_train = sample_data
+    models, param_dists = sample_models
+    results = tune_all_hyperparameters(X_train, y_train, models, sample_preprocessor, param_dists, pos_label=1, beta=2, seed=42, n_jobs=1)
+    for model_name, model in models.items():
+        expected = tune_hyperparameters(X_train, y_train, model, sample_preprocessor, param_dists[model_name], pos_label=1, beta=2, seed=42)
+        assert results[model_name].cv_results_["params"] == expected.cv_results_["params"]
+        np.testing.assert_array_equal(results[model_name].cv_results_["mean_test_score"], expected.cv_results_["mean_test_score"])
+        np.testing.assert_array_equal(results[model_name].cv_results_["rank_test_score"], expected.cv_results_["rank_test_score"])
+        assert results[model_name].best_params_ == expected.best_params_
+        assert results[model_name].best_score_ == expected.best_score_
+
+def test_tune_all_hyperparameters_parallel(sample_data, sample_preprocessor, sample_models):
+    """
+    Check that running on several worker processes gives the same scores
+    as a single worker and refits a usable best estimator.
+    """
+    X_train, y_train = sample_data
+    models, param_dists = sample_models
+    serial = tune_all_hyperparameters(X_train, y_train, models, sample_preprocessor, param_dists, pos_label=1, beta=2, seed=42, n_jobs=1)
+    parallel = tune_all_hyperparameters(X_train, y_train, models, sample_preprocessor, param_dists, pos_label=1, beta=2, seed=42, n_jobs=2)
+    for model_name in models:
+        np.testing.assert_array_equal(serial[model_name].cv_results_["split0_test_score"], parallel[model_name].cv_results_["split0_test_score"])
+        assert len(parallel[model_name].predict(X_train)) == len(X_train)
+    assert isinstance(cv_results_table(parallel), pd.DataFrame)
+
+def test_tune_all_hyperparameters_invalid_inputs(sample_data, sample_preprocessor, sample_models):
+    """
+    Confirm that the scheduler applies the same input validation as
+    tune_hyperparameters.
+    """
+    X_train, y_train = sample_data
+    models, param_dists = sample_models
+    with pytest.raises(ValueError):
+        tune_all_hyperparameters(X_train, y_train, models, sample_preprocessor, param_dists, pos_label=-1, beta=2, seed=42)
+    with pytest.raises(ValueError):
+        tune_all_hyperparameters(X_train, y_train, models, sample_preprocessor, param_dists, pos_label=1, beta=-1, seed=42)
+    with pytest.raises(ValueError):
+        tune_all_hyperparameters(X_train, y_train, models, sample_preprocessor, {**param_dists, "Decision Tree": {}}, pos_label=1, beta=2, seed=42)
+
+def test_tune_hyperparameters_invalid_strategy(sample_data, sample_preprocessor, sample_model, sample_param_dist):
+    """
+    Confirm that an unknown strategy or halving resource raises a ValueError.
+    """
+    X_train, y_train = sample_data
+    with pytest.raises(ValueError):
+        tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist, pos_label=1, beta=2, seed=42, strategy="grid")
+    with pytest.raises(ValueError):
+        tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, sample_param_dist, pos_label=1, beta=2, seed=42,
+                             strategy="halving", resource="max_iter")
+
+
+# Tests for tune_regularization_path function
+def test_tune_regularization_path_matches_random_search(sample_data, sample_preprocessor, sample_model):
+    """
+    Check that the warm-started path scores every C like cold-started fits,
+    with the same cv_results_ keys as tune_hyperparameters.
+    """
+    X_train, y_train = sample_data
+    Cs = [10.0, 0.01, 1.0, 0.1]
+    path = tune_regularization_path(X_train, y_train, sample_model, sample_preprocessor, 'logisticregression__C', Cs,
+                                    pos_label=1, beta=2, n_jobs=1)
+    expected = tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor,
+                                    {'logisticregression__C': sorted(Cs)}, pos_label=1, beta=2, seed=42)
+    order = np.argsort(expected.cv_results_["param_logisticregression__C"].data.astype(float))
+    assert set(path.cv_results_) == set(expected.cv_results_)
+    assert path.cv_results_["params"] == [{'logisticregression__C': C} for C in sorted(Cs)]
+    np.testing.assert_allclose(path.cv_results_["mean_test_score"], expected.cv_results_["mean_test_score"][order])
+    assert path.best_params_ == expected.best_params_
+    assert path.best_estimator_[-1].warm_start is False
+
+
+def test_tune_regularization_path_fold_cache(sample_data, sample_preprocessor, sample_model):
+    """
+    Check that the path gives the same scores on cached preprocessed folds.
+    """
+    from heart_disease_predictor.utils.fold_cache import FoldCache
+    X_train, y_train = sample_data
+    args = (X_train, y_train, sample_model, sample_preprocessor, 'logisticregression__C', [0.1, 1.0])
+    direct = tune_regularization_path(*args, pos_label=1, beta=2, n_jobs=1)
+    cached = tune_regularization_path(*args, pos_label=1, beta=2, n_jobs=1, fold_cache=FoldCache())
+    np.testing.assert_allclose(direct.cv_results_["mean_test_score"], cached.cv_results_["mean_test_score"])
+
+
+def test_tune_regularization_path_invalid_inputs(sample_data, sample_preprocessor, sample_model):
+    """
+    Confirm that an empty path, a bad pos_label or beta and an unqualified parameter name raise a ValueError.
+    """
+    X_train, y_train = sample_data
+    for param_name, values, pos_label, beta in [('logisticregression__C', [], 1, 2),
+                                                ('logisticregression__C', [1.0], -1, 2),
+                                                ('logisticregression__C', [1.0], 1, -1),
+                                                ('C', [1.0], 1, 2)]:
+        with pytest.raises(ValueError):
+            tune_regularization_path(X_train, y_train, sample_model, sample_preprocessor, param_name, values,
+                                     pos_label=pos_label, beta=beta)
+
+
+# Tests for tune_tree_depth function
+def test_tune_tree_depth_matches_random_search(sample_preprocessor):
+    """
+    Check that scoring the truncations of one deep tree per fold gives the
+    fold scores of separate fits for every max_depth. A single feature keeps
+    equally good splits of different features, which may be broken
+    differently, out of the comparison.
+    """
+    rng = np.random.default_rng(0)
+    X_train = pd.DataFrame({'feature_0': rng.normal(size=200)})
+    y_train = pd.Series((np.sin(3 * X_train['feature_0']) + rng.normal(0, 0.5, 200) > 0).astype(int))
+    model = DecisionTreeClassifier(random_state=42)
+    depths = np.arange(1, 8)
+    sweep = tune_tree_depth(X_train, y_train, model, sample_preprocessor, depths, pos_label=1, beta=2, n_jobs=1)
+    expected = tune_hyperparameters(X_train, y_train, model, sample_preprocessor,
+                                    {'decisiontreeclassifier__max_depth': depths}, pos_label=1, beta=2, seed=42)
+    order = np.argsort(expected.cv_results_["param_decisiontreeclassifier__max_depth"].data.astype(int))
+    assert set(sweep.cv_results_) == set(expected.cv_results_)
+    for k in range(5):
+        np.testing.assert_allclose(sweep.cv_results_[f"split{k}_test_score"],
+                                   expected.cv_results_[f"split{k}_test_score"][order])
+        np.testing.assert_allclose(sweep.cv_results_[f"split{k}_train_score"],
+                                   expected.cv_results_[f"split{k}_train_score"][order])
+    assert sweep.best_params_ == expected.best_params_
+    assert sweep.best_estimator_[-1].get_depth() <= sweep.best_params_['decisiontreeclassifier__max_depth']
+
+
+def test_tune_tree_depth_fold_cache_and_deep_grid(sample_data, sample_preprocessor):
+    """
+    Check that cached folds give the same scores and that depths past the
+    full tree score like the full tree.
+    """
+    from heart_disease_predictor.utils.fold_cache import FoldCache
+    X_train, y_train = sample_data
+    args = (X_train, y_train, DecisionTreeClassifier(random_state=0), sample_preprocessor, [2, 50, 60])
+    direct = tune_tree_depth(*args, pos_label=1, beta=2, n_jobs=1)
+    cached = tune_tree_depth(*args, pos_label=1, beta=2, n_jobs=1, fold_cache=FoldCache())
+    np.testing.assert_allclose(direct.cv_results_["mean_test_score"], cached.cv_results_["mean_test_score"])
+    assert direct.cv_results_["mean_test_score"][1] == direct.cv_results_["mean_test_score"][2]
+
+
+def test_tune_tree_depth_invalid_inputs(sample_data, sample_preprocessor):
+    """
+    Confirm that empty or non-positive depths and a bad pos_label or beta raise a ValueError.
+    """
+    X_train, y_train = sample_data
+    for depths, pos_label, beta in [([], 1, 2), ([0, 1], 1, 2), ([1], -1, 2), ([1], 1, -1)]:
+        with pytest.raises(ValueError):
+            tune_tree_depth(X_train, y_train, DecisionTreeClassifier(), sample_preprocessor, depths,
+                            pos_label=pos_label, beta=beta)
+
+def test_tune_all_hyperparameters_failed_fits_score_nan(sample_data, sample_preprocessor, sample_model):
+    """
+    Check that a candidate whose fits fail scores NaN and ranks last with a
+    warning, as in RandomizedSearchCV, instead of aborting the search, and
+    that the param columns match RandomizedSearchCV.
+    """
+    X_train, y_train = sample_data
+    param_dist = {'logisticregression__C': [0.1, -1.0, 10.0]}
+    with pytest.warns(FitFailedWarning, match="5 fits failed out of a total of 15"):
+        result = tune_all_hyperparameters(X_train, y_train, {"model": sample_model}, sample_preprocessor,
+                                          {"model": param_dist}, pos_label=1, beta=2, seed=42, n_iter=3, n_jobs=1)["model"]
+    with pytest.warns(FitFailedWarning):
+        expected = RandomizedSearchCV(make_pipeline(sample_preprocessor, sample_model), param_dist, n_iter=3,
+                                      random_state=42, scoring=make_scorer(fbeta_score, pos_label=1, beta=2),
+                                      return_train_score=True).fit(X_train, y_train)
+    for key in ["mean_test_score", "std_test_score", "rank_test_score", "split0_test_score", "mean_train_score"]:
+        np.testing.assert_array_equal(result.cv_results_[key], expected.cv_results_[key])
+    column = result.cv_results_["param_logisticregression__C"]
+    assert column.dtype == expected.cv_results_["param_logisticregression__C"].dtype
+    np.testing.assert_array_equal(column, expected.cv_results_["param_logisticregression__C"])
+    assert result.best_params_ == expected.best_params_
+
+    with pytest.raises(ValueError, match="All the 5 fits failed"):
+        tune_all_hyperparameters(X_train, y_train, {"model": sample_model}, sample_preprocessor,
+                                 {"model": {'logisticregression__C': [-1.0]}}, pos_label=1, beta=2, seed=42, n_iter=1, n_jobs=1)
+
+def test_tune_hyperparameters_halving_folds_drops_failed_candidates(sample_data, sample_preprocessor, sample_model):
+    """
+    Check that fold halving drops a candidate whose first fit failed instead
+    of keeping it for the next rounds.
+    """
+    X_train, y_train = sample_data
+    param_dist = {'logisticregression__C': [-1.0, 0.1, 1.0, 10.0]}
+    with pytest.warns(FitFailedWarning, match="1 fits failed"):
+        search = tune_hyperparameters(X_train, y_train, sample_model, sample_preprocessor, param_dist, pos_label=1, beta=2, seed=42,
+                                      strategy="halving", resource="folds")
+    failed = [i for i, params in enumerate(search.cv_results_["params"]) if params['logisticregression__C'] < 0]
+    assert search.cv_results_["n_resources"][failed].tolist() == [1]
+    assert np.isnan(search.cv_results_["mean_test_score"][failed]).all()
+    assert search.best_params_['logisticregression__C'] > 0
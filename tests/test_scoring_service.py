@@ -0,0 +1,265 @@
+import pytest
+import sys
+import os
+import json
+import threading
+import time
+import http.client
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import numpy as np
+import pandas as pd
+import pandera.pandas as pa
+from sklearn.compose import make_column_transformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.heart_schema import schema
+from heart_disease_predictor.utils.scoring_service import MicroBatcher, ScoringService, make_server
+
+
+@pytest.fixture
+def heart_records():
+    """
+    Generate random records that satisfy the heart validation schema.
+
+    Returns
+    -------
+    tuple of (pd.DataFrame, pd.Series)
+        - X : 60 records with every schema column except the target.
+        - y : String target labels.
+    """
+    rng = np.random.default_rng(0)
+    n = 60
+    X = pd.DataFrame({
+        "patient_id": np.arange(1, n + 1),
+        "age": rng.integers(20, 80, n),
+        "gender": rng.integers(0, 2, n),
+        "chest_pain": rng.integers(0, 4, n),
+        "resting_bp": rng.integers(94, 200, n),
+        "serum_cholesterol": rng.integers(126, 564, n),
+        "fasting_blood_sugar": rng.integers(0, 2, n),
+        "resting_electro": rng.integers(0, 3, n),
+        "max_heart_rate": rng.integers(71, 202, n),
+        "exercise_angina": rng.integers(0, 2, n),
+        "old_peak": rng.uniform(0, 6, n).round(1),
+        "slope": rng.integers(1, 4, n),
+        "num_major_vessels": rng.integers(0, 4, n),
+    })
+    y = pd.Series(np.where(X["chest_pain"] > 1, "Heart Disease", "No Heart Disease"))
+    return X, y
+
+
+@pytest.fixture
+def service(heart_records):
+    """
+    Provide a ScoringService around a small fitted pipeline.
+    """
+    X, y = heart_records
+    preprocessor = make_column_transformer(("drop", ["patient_id"]), remainder=StandardScaler())
+    model = make_pipeline(preprocessor, LogisticRegression()).fit(X, y)
+    scoring_service = ScoringService(model, max_batch_size=16, max_delay=0.01)
+    yield scoring_service
+    scoring_service.close()
+
+
+def test_score_matches_model(service, heart_records):
+    """
+    Check that scored records get the model's class and decision score.
+    """
+    X, _ = heart_records
+    results = service.score(json.loads(X.head(5).to_json(orient="records")))
+    assert [r["prediction"] for r in results] == list(service.model.predict(X.head(5)))
+    np.testing.assert_allclose([r["score"] for r in results], service.model.decision_function(X.head(5)))
+
+
+def test_score_rejects_invalid_records(service, heart_records):
+    """
+    Check that records violating the schema contract raise SchemaErrors.
+    """
+    X, _ = heart_records
+    record = json.loads(X.head(1).to_json(orient="records"))[0]
+    with pytest.raises(pa.errors.SchemaErrors):
+        service.score([{**record, "age": 150}])
+    record.pop("slope")
+    with pytest.raises(pa.errors.SchemaErrors):
+        service.score([record])
+
+
+def test_request_schema_keeps_column_contract():
+    """
+    Check that the request contract does not alter the validation schema.
+    """
+    assert len(schema.columns["slope"].checks) == 1
+    assert len(schema.columns["serum_cholesterol"].checks) == 1
+
+
+def test_micro_batcher_groups_requests():
+    """
+    Check that requests queued together are scored in fewer calls and that
+    each request gets back its own rows.
+    """
+    calls = []
+
+    def predict(df):
+        calls.append(len(df))
+        return df * 2
+
+    batcher = MicroBatcher(predict, max_batch_size=100, max_delay=0.05)
+    futures = [batcher.submit(pd.DataFrame({"x": [i, i + 100]})) for i in range(10)]
+    results = [future.result(5) for future in futures]
+    batcher.close()
+    assert sum(calls) == 20
+    assert len(calls) < 10
+    for i, result in enumerate(results):
+        assert list(result["x"]) == [2 * i, 2 * (i + 100)]
+
+
+def test_micro_batcher_isolates_failures():
+    """
+    Check that a failing request does not fail the other requests of its batch.
+    """
+    def predict(df):
+        if (df["x"] < 0).any():
+            raise ValueError("negative")
+        return df
+
+    batcher = MicroBatcher(predict, max_batch_size=100, max_delay=0.05)
+    good = batcher.submit(pd.DataFrame({"x": [1]}))
+    bad = batcher.submit(pd.DataFrame({"x": [-1]}))
+    assert list(good.result(5)["x"]) == [1]
+    with pytest.raises(ValueError):
+        bad.result(5)
+    batcher.close()
+
+
+def test_http_server(service, heart_records):
+    """
+    Check the /health and /predict endpoints for a single record, a batch
+    and an invalid record.
+    """
+    X, _ = heart_records
+    records = json.loads(X.head(3).to_json(orient="records"))
+    server = make_server(service, "127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+
+    def request(method, path, payload=None):
+        connection.request(method, path, None if payload is None else json.dumps(payload))
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+
+    try:
+        assert request("GET", "/health") == (200, {"status": "ok"})
+        status, single = request("POST", "/predict", records[0])
+        assert status == 200 and set(single) == {"prediction", "score"}
+        status, batch = request("POST", "/predict", {"records": records})
+        assert status == 200 and len(batch["predictions"]) == 3
+        status, error = request("POST", "/predict", [{**records[0], "gender": 5}])
+        assert status == 400
+        assert error["failure_cases"][0]["column"] == "gender"
+    finally:
+        connection.close()
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize("headers, body, expected_error", [
+    ({"Content-Length": "ten"}, b"", "Content-Length is not a number of bytes"),
+    ({"Content-Length": "12"}, b'{"age": "\xff"}', "Request body is not valid JSON"),
+])
+def test_http_server_malformed_requests(service, headers, body, expected_error):
+    """
+    Check that a Content-Length that is not a number and a body that is not
+    UTF-8 are answered with a 400 JSON error instead of a dropped connection.
+    """
+    server = make_server(service, "127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+    try:
+        connection.putrequest("POST", "/predict", skip_accept_encoding=True)
+        for name, value in headers.items():
+            connection.putheader(name, value)
+        connection.endheaders(body)
+        response = connection.getresponse()
+        assert response.status == 400
+        assert json.loads(response.read()) == {"error": expected_error}
+    finally:
+        connection.close()
+        server.shutdown()
+        server.server_close()
+
+
+release = threading.Event()
+
+
+def stuck_predict(df):
+    """Prediction that only returns once release is set."""
+    release.wait(5)
+    return df
+
+
+def failing_predict(df):
+    """Prediction that always fails."""
+    raise RuntimeError("model exploded")
+
+
+@pytest.mark.parametrize("predict_fn, expected_status, expected_error", [
+    (stuck_predict, 503, "Prediction did not finish within 0.2 seconds"),
+    (failing_predict, 500, "Prediction failed: RuntimeError: model exploded"),
+])
+def test_http_server_prediction_errors(service, heart_records, predict_fn, expected_status, expected_error):
+    """
+    Check that a prediction timing out or failing is answered with a JSON
+    error instead of a dropped connection, and that the server keeps serving.
+    """
+    X, _ = heart_records
+    records = json.loads(X.head(2).to_json(orient="records"))
+    healthy_fn = service.batcher.predict_fn
+    service.batcher.predict_fn = predict_fn
+    release.clear()
+    server = make_server(service, "127.0.0.1", 0, timeout=0.2)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+    try:
+        connection.request("POST", "/predict", json.dumps({"records": records}))
+        response = connection.getresponse()
+        assert response.status == expected_status
+        assert json.loads(response.read())["error"].startswith(expected_error)
+
+        service.batcher.predict_fn = healthy_fn
+        release.set()
+        connection.request("POST", "/predict", json.dumps(records[0]))
+        response = connection.getresponse()
+        assert response.status == 200 and "prediction" in json.loads(response.read())
+    finally:
+        connection.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_score_timeout_cancels_queued_request(heart_records):
+    """
+    Check that a request that timed out before being scored is cancelled and
+    skipped by the micro-batcher.
+    """
+    calls = []
+    started = threading.Event()
+
+    def predict(df):
+        calls.append(len(df))
+        started.set()
+        time.sleep(0.3)
+        return df
+
+    batcher = MicroBatcher(predict, max_batch_size=1, max_delay=0)
+    first = batcher.submit(pd.DataFrame({"x": [1]}))
+    started.wait(5)
+    second = batcher.submit(pd.DataFrame({"x": [2, 3]}))
+    with pytest.raises(FutureTimeoutError):
+        second.result(0.01)
+    assert second.cancel()
+    assert list(first.result(5)["x"]) == [1]
+    batcher.close()
+    assert calls == [1]
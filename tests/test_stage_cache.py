@@ -0,0 +1,124 @@
+import pytest
+import sys
+import os
+import subprocess
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.stage_cache import StageCache, file_digest, run_stage, stage_key
+
+
+@pytest.fixture
+def stage(tmp_path):
+    """
+    Provide a small stage that doubles the numbers of an input file and counts its runs.
+
+    Returns
+    -------
+    dict
+        Paths of the input, output, run counter and cache folder, and the stage
+        command as a function of a multiplier parameter.
+    """
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("1\n2\n3\n")
+    output_path = tmp_path / "output.txt"
+    counter_path = tmp_path / "runs.txt"
+    code = (
+        "import sys\n"
+        "numbers = [int(line) * int(sys.argv[1]) for line in open(sys.argv[2])]\n"
+        "open(sys.argv[3], 'w').write('\\n'.join(map(str, numbers)))\n"
+        "open(sys.argv[4], 'a').write('run\\n')\n"
+    )
+
+    def command(multiplier=2):
+        return [sys.executable, "-c", code, str(multiplier), str(input_path), str(output_path), str(counter_path)]
+
+    return dict(input=str(input_path), output=str(output_path), counter=counter_path,
+                cache=StageCache(str(tmp_path / "cache")), command=command)
+
+
+def n_runs(stage):
+    """Number of times the stage command actually ran."""
+    return len(stage["counter"].read_text().splitlines()) if stage["counter"].exists() else 0
+
+
+def test_run_stage_restores_unchanged_stage(stage):
+    """
+    Test that a stage with identical inputs and command is restored instead of rerun,
+    even after its input was touched and its output deleted.
+    """
+    args = (stage["command"](), [stage["input"]], [stage["output"]])
+    assert run_stage(*args, cache=stage["cache"]) is False
+    expected = open(stage["output"]).read()
+
+    os.utime(stage["input"])
+    assert run_stage(*args, cache=stage["cache"]) is True
+    os.remove(stage["output"])
+    assert run_stage(*args, cache=stage["cache"]) is True
+    assert open(stage["output"]).read() == expected == "2\n4\n6"
+    assert n_runs(stage) == 1
+
+
+def test_run_stage_reruns_on_changes(stage):
+    """
+    Test that changing the content of an input or a parameter reruns the stage.
+    """
+    run_stage(stage["command"](), [stage["input"]], [stage["output"]], cache=stage["cache"])
+    with open(stage["input"], "a") as f:
+        f.write("4\n")
+    assert run_stage(stage["command"](), [stage["input"]], [stage["output"]], cache=stage["cache"]) is False
+    assert run_stage(stage["command"](3), [stage["input"]], [stage["output"]], cache=stage["cache"]) is False
+    assert open(stage["output"]).read() == "3\n6\n9\n12"
+    assert n_runs(stage) == 3
+
+
+def test_stage_key_depends_on_code(tmp_path, stage):
+    """
+    Test that the key changes with the content of the code files of the stage.
+    """
+    code_dir = tmp_path / "code"
+    code_dir.mkdir()
+    (code_dir / "models.py").write_text("C = [0.1, 1.0]\n")
+    key = stage_key(stage["command"](), [stage["input"]], [stage["output"]], [str(code_dir)])
+    assert key == stage_key(stage["command"](), [stage["input"]], [stage["output"]], [str(code_dir)])
+    (code_dir / "models.py").write_text("C = [0.1, 1.0, 10.0]\n")
+    assert key != stage_key(stage["command"](), [stage["input"]], [stage["output"]], [str(code_dir)])
+
+
+def test_stage_cache_folders(tmp_path):
+    """
+    Test that a folder output is stored file by file and restored without extra files.
+    """
+    folder = tmp_path / "report_files"
+    (folder / "figures").mkdir(parents=True)
+    (folder / "figures" / "plot.png").write_bytes(b"png")
+    (folder / "style.css").write_text("body {}")
+    cache = StageCache(str(tmp_path / "cache"))
+    cache.store("key", [str(folder)])
+
+    (folder / "style.css").write_text("changed")
+    (folder / "extra.txt").write_text("extra")
+    assert cache.restore("key") is True
+    assert sorted(os.listdir(folder)) == ["figures", "style.css"]
+    assert (folder / "style.css").read_text() == "body {}"
+    assert cache.restore("missing") is False
+
+
+def test_run_stage_failure_is_not_cached(stage):
+    """
+    Test that a failing stage raises and stores nothing.
+    """
+    command = [sys.executable, "-c", "raise SystemExit(1)"]
+    with pytest.raises(subprocess.CalledProcessError):
+        run_stage(command, [stage["input"]], [stage["output"]], cache=stage["cache"])
+    assert not os.path.exists(stage["cache"].root)
+
+
+def test_file_digest(tmp_path):
+    """
+    Test that the digest only depends on the file content.
+    """
+    a, b = tmp_path / "a.csv", tmp_path / "b.csv"
+    a.write_text("x,y\n1,2\n")
+    b.write_text("x,y\n1,2\n")
+    assert file_digest(str(a)) == file_digest(str(b))
+    assert file_digest(str(a), block_size=3) == file_digest(str(a))
@@ -0,0 +1,126 @@
+import pytest
+import sys
+import os
+import pickle
+import threading
+import numpy as np
+from sklearn import config_context
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.stage_graph import Stage, drop_stages, run_stages, topological_order
+
+RAW_DATA = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'Cardiovascular_Disease_Dataset',
+                        'Cardiovascular_Disease_Dataset.csv')
+
+
+def test_run_stages_passes_outputs():
+    """
+    Test that every stage gets the outputs of the stages it requires, in order,
+    and that every stage is timed.
+    """
+    stages = {
+        "a": Stage(lambda: 2),
+        "b": Stage(lambda a: a * 10, requires=["a"]),
+        "c": Stage(lambda b, a: (b, a), requires=["b", "a"]),
+    }
+    outputs, timings = run_stages(stages)
+    assert outputs == {"a": 2, "b": 20, "c": (20, 2)}
+    assert set(timings) == set(stages)
+    assert timings["b"]["start"] >= timings["a"]["end"]
+    assert timings["c"]["start"] >= timings["b"]["end"]
+    assert all(t["seconds"] >= 0 for t in timings.values())
+
+
+def test_run_stages_runs_independent_stages_concurrently():
+    """
+    Test that stages with the same requirements run at the same time: each
+    waits on a barrier that only opens once both have started.
+    """
+    barrier = threading.Barrier(2, timeout=10)
+
+    def branch(value):
+        barrier.wait()
+        return value
+
+    stages = {
+        "root": Stage(lambda: 1),
+        "left": Stage(branch, requires=["root"]),
+        "right": Stage(branch, requires=["root"]),
+    }
+    outputs, _ = run_stages(stages, max_workers=2)
+    assert outputs == {"root": 1, "left": 1, "right": 1}
+
+
+def test_run_stages_stops_after_failure():
+    """
+    Test that a failing stage is reported and the stages depending on it never start.
+    """
+    started = []
+
+    def fail():
+        raise ValueError("broken")
+
+    stages = {
+        "a": Stage(fail),
+        "b": Stage(lambda a: started.append("b"), requires=["a"]),
+    }
+    with pytest.raises(RuntimeError, match="Stage 'a' failed: broken"):
+        run_stages(stages)
+    assert started == []
+
+
+def test_invalid_graphs():
+    """
+    Test that unknown requirements and cycles are rejected before anything runs.
+    """
+    with pytest.raises(ValueError, match="unknown stages"):
+        run_stages({"a": Stage(lambda x: x, requires=["x"])})
+    cycle = {"a": Stage(lambda b: b, requires=["b"]), "b": Stage(lambda a: a, requires=["a"])}
+    with pytest.raises(ValueError, match="cycle"):
+        topological_order(cycle)
+
+
+def test_drop_stages_removes_dependents():
+    """
+    Test that dropping a stage also drops everything downstream of it.
+    """
+    stages = {
+        "a": Stage(lambda: 1),
+        "b": Stage(lambda a: a, requires=["a"]),
+        "c": Stage(lambda b: b, requires=["b"]),
+        "d": Stage(lambda a: a, requires=["a"]),
+    }
+    kept, dropped = drop_stages(stages, ["b"])
+    assert list(kept) == ["a", "d"]
+    assert dropped == ["b", "c"]
+
+
+@pytest.mark.skipif(not os.path.exists(RAW_DATA), reason="raw data not downloaded")
+def test_analysis_stages_write_artifacts(tmp_path):
+    """
+    Test that the in-process analysis writes the artifacts of the Makefile
+    stages, and that the model handed between stages in memory is the one saved.
+    """
+    from heart_disease_predictor.scripts.run_pipeline import build_stages
+
+    stages = build_stages(RAW_DATA, str(tmp_path / "data"), str(tmp_path / "results"), n_jobs=1, n_bootstrap=100)
+    stages, _ = drop_stages(stages, ["eda"])
+    outputs, timings = run_stages(stages, max_workers=3)
+    assert set(timings) == set(stages)
+
+    for path in ["data/validated/heart_validated.csv",
+                 "data/processed/train_heart.csv",
+                 "data/processed/heart_test_preprocessed.csv",
+                 "results/preprocessor/heart_preprocessor.pickle",
+                 "results/cv_default_models/cv_scores_default_parameters.csv",
+                 "results/final_model_results/hyperparameter_cv_results.csv",
+                 "results/final_model_results/evaluation_metrics.json",
+                 "results/final_model_results/confusion_matrix.png",
+                 "results/final_model_results/compiled_model.npz"]:
+        assert (tmp_path / path).exists(), path
+
+    with open(tmp_path / "results/final_model_results/final_model.pickle", "rb") as f:
+        saved_model = pickle.load(f)
+    X_test = outputs["preprocessing"][1].drop(columns=["target"])
+    with config_context(transform_output="pandas"):
+        np.testing.assert_array_equal(saved_model.predict(X_test), outputs["hyperparameter-tuning"].predict(X_test))
@@ -0,0 +1,209 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.eda_helper import compute_summary_statistics
+from heart_disease_predictor.utils.streaming_stats import (
+    CorrelationAccumulator,
+    HeavyHitters,
+    HyperLogLog,
+    QuantileSketch,
+    SummaryAccumulator,
+    correlate_chunks,
+    summarize_chunks,
+    summarize_table,
+)
+
+
+@pytest.fixture
+def mixed_df():
+    """
+    Provide a small dataset with numerical, categorical, boolean and missing values.
+
+    Returns
+    -------
+    pandas.DataFrame
+        300 rows of mixed columns.
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "age": rng.integers(20, 80, 300),
+        "chol": rng.normal(240, 50, 300),
+        "sex": rng.choice(["Male", "Female"], 300, p=[0.6, 0.4]),
+        "fbs": rng.random(300) < 0.2,
+        "target": pd.Categorical(rng.choice(["Heart Disease", "No Heart Disease"], 300)),
+    })
+    df.loc[::7, "chol"] = np.nan
+    df.loc[::11, "sex"] = None
+    return df
+
+
+def assert_same_summary(expected, actual):
+    """Compare two describe tables cell by cell, numbers up to rounding."""
+    assert list(actual.index) == list(expected.index)
+    assert list(actual.columns) == list(expected.columns)
+    for col in expected.columns:
+        for row in expected.index:
+            left, right = expected.at[row, col], actual.at[row, col]
+            if pd.isna(left):
+                assert pd.isna(right), (row, col)
+            elif isinstance(left, str):
+                assert left == right, (row, col)
+            else:
+                assert right == pytest.approx(left, rel=1e-9), (row, col)
+
+
+@pytest.mark.parametrize("chunksize", [1, 17, 1000])
+def test_summary_matches_describe(mixed_df, chunksize):
+    """
+    Test that the streaming summary of a small table equals describe(include="all")
+    for any chunk size, with the same rows, columns and dtypes.
+    """
+    summary = compute_summary_statistics(mixed_df, chunksize=chunksize)
+    expected = mixed_df.describe(include="all")
+    assert_same_summary(expected, summary)
+    assert summary["age"].dtype == np.float64
+    assert summary["sex"].dtype == object
+
+
+def test_summary_numeric_only_and_categorical_only(mixed_df):
+    """
+    Test that rows of a kind no column has are left out, as in describe.
+    """
+    assert_same_summary(mixed_df[["age", "chol"]].describe(include="all"),
+                        compute_summary_statistics(mixed_df[["age", "chol"]], chunksize=50))
+    assert_same_summary(mixed_df[["sex"]].describe(include="all"),
+                        compute_summary_statistics(mixed_df[["sex"]], chunksize=50))
+
+
+def test_merge_equals_single_pass(mixed_df):
+    """
+    Test that merging the accumulators of two halves gives the summary of the whole table.
+    """
+    whole = SummaryAccumulator().update(mixed_df).result()
+    merged = SummaryAccumulator().update(mixed_df.iloc[:120]).merge(
+        SummaryAccumulator().update(mixed_df.iloc[120:])).result()
+    assert_same_summary(whole, merged)
+
+
+def test_summarize_table_pool_matches_sequential(tmp_path):
+    """
+    Test that chunks summarized by a process pool give the same table as one
+    process, and that sketched quantiles stay close to the exact ones.
+    """
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"x": rng.normal(size=30_000), "group": rng.choice(list("abc"), 30_000)})
+    path = str(tmp_path / "table.csv")
+    df.to_csv(path, index=False)
+
+    sequential = summarize_table(path, chunksize=4000, quantile_k=256)
+    pooled = summarize_table(path, chunksize=4000, n_jobs=2, quantile_k=256)
+    assert_same_summary(sequential, pooled)
+
+    exact = df.describe(include="all")
+    assert sequential.at["count", "x"] == 30_000
+    assert sequential.at["mean", "x"] == pytest.approx(exact.at["mean", "x"], rel=1e-9)
+    assert sequential.at["std", "x"] == pytest.approx(exact.at["std", "x"], rel=1e-9)
+    for row in ["25%", "50%", "75%"]:
+        # Rank error of at most 1% of the rows
+        rank = (df["x"] < sequential.at[row, "x"]).mean()
+        assert rank == pytest.approx(float(row[:-1]) / 100, abs=0.01)
+    assert sequential.at["unique", "group"] == 3
+
+
+def test_sketches_on_large_streams():
+    """
+    Test the error of the HyperLogLog count, the heavy hitters and the
+    quantile sketch once they no longer hold every value.
+    """
+    values = np.arange(200_000)
+    hll = HyperLogLog().update(values[:120_000]).merge(HyperLogLog().update(values[80_000:]))
+    assert hll.estimate() == pytest.approx(200_000, rel=0.03)
+
+    stream = pd.Series(np.concatenate([np.full(5000, -1), values[:20_000]]))
+    heavy = HeavyHitters(k=16).update(stream[:12_000]).merge(HeavyHitters(k=16).update(stream[12_000:]))
+    top, freq = heavy.top()
+    assert not heavy.exact
+    assert top == -1
+    assert 5000 - len(stream) / 17 <= freq <= 5000
+
+    x = np.random.default_rng(2).exponential(size=100_000)
+    sketch = QuantileSketch(k=512).update(x[:50_000]).merge(QuantileSketch(k=512, seed=1).update(x[50_000:]))
+    assert sum(len(level) for level in sketch.levels) < 10 * 512
+    for q, value in zip([0.1, 0.5, 0.9], sketch.quantile([0.1, 0.5, 0.9])):
+        assert (x < value).mean() == pytest.approx(q, abs=0.01)
+
+
+def chunks_of(df, chunksize):
+    """Callable returning a fresh iterator over row chunks of df."""
+    return lambda: (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+
+
+@pytest.mark.parametrize("chunksize", [1, 23, 1000])
+def test_pearson_matches_corr(mixed_df, chunksize):
+    """
+    Test that the streamed Pearson matrix equals DataFrame.corr with pairwise
+    missing values and factorized non-numerical columns, and leaves df untouched.
+    """
+    columns = ["age", "chol", "fbs", "target"]
+    before = mixed_df.copy()
+    corr = correlate_chunks(chunks_of(mixed_df, chunksize), columns)
+    expected = mixed_df.assign(target=pd.factorize(mixed_df["target"])[0])[columns].astype(float).corr()
+    pd.testing.assert_frame_equal(corr, expected, atol=1e-12)
+    pd.testing.assert_frame_equal(mixed_df, before)
+
+
+def test_incremental_batches_and_merge(mixed_df):
+    """
+    Test that batches added later, or accumulated apart and merged, give the
+    matrix of the whole table.
+    """
+    columns = ["age", "chol", "target"]
+    whole = CorrelationAccumulator(columns).update(mixed_df).result()
+    incremental = CorrelationAccumulator(columns).update(mixed_df.iloc[:100])
+    incremental.update(mixed_df.iloc[100:])
+    categories = {"target": list(pd.unique(mixed_df["target"]))}
+    merged = CorrelationAccumulator(columns).update(mixed_df.iloc[:200]).merge(
+        CorrelationAccumulator(columns, categories=categories).update(mixed_df.iloc[200:]))
+    pd.testing.assert_frame_equal(incremental.result(), whole, atol=1e-12)
+    pd.testing.assert_frame_equal(merged.result(), whole, atol=1e-12)
+
+    with pytest.raises(ValueError, match="different columns"):
+        CorrelationAccumulator(columns).merge(CorrelationAccumulator(columns[:2]))
+    flipped = mixed_df.iloc[::-1]
+    with pytest.raises(ValueError, match="different codes for column 'target'"):
+        CorrelationAccumulator(columns).update(mixed_df).merge(CorrelationAccumulator(columns).update(flipped))
+
+
+def test_encode_codes_non_numerical_columns(mixed_df):
+    """
+    Test that encode gives numerical columns as floats and codes the other
+    columns in the order their values are first seen.
+    """
+    columns = ["age", "target"]
+    matrix = CorrelationAccumulator(columns).encode(mixed_df)
+    np.testing.assert_array_equal(matrix[:, 0], mixed_df["age"].to_numpy(dtype=float))
+    np.testing.assert_array_equal(matrix[:, 1], pd.factorize(mixed_df["target"])[0])
+
+
+def test_spearman(mixed_df):
+    """
+    Test that the Spearman matrix from rank sketches equals pandas on complete
+    rows, and stays close on a stream too long for exact ranks.
+    """
+    complete = mixed_df.dropna()
+    columns = ["age", "chol", "fbs"]
+    corr = correlate_chunks(chunks_of(complete, 50), columns, method="spearman")
+    pd.testing.assert_frame_equal(corr, complete[columns].astype(float).corr("spearman"), atol=1e-12)
+
+    rng = np.random.default_rng(3)
+    x = rng.exponential(size=50_000)
+    large = pd.DataFrame({"x": x, "y": np.log(x) + rng.normal(scale=0.5, size=50_000)})
+    corr = correlate_chunks(chunks_of(large, 5000), ["x", "y"], method="spearman", quantile_k=256)
+    assert corr.at["x", "y"] == pytest.approx(large.corr("spearman").at["x", "y"], abs=0.01)
+
+    with pytest.raises(ValueError, match="method must be"):
+        correlate_chunks(chunks_of(large, 5000), ["x", "y"], method="kendall")
@@ -0,0 +1,82 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from heart_disease_predictor.utils.table_io import TableWriter, iter_chunks, read_table, table_format, table_path, write_table
+
+
+@pytest.fixture
+def sample_table():
+    """
+    Generate a small table with integer, float and string columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        Thirty rows with the dtypes of the heart datasets.
+    """
+    return pd.DataFrame({
+        'age': np.arange(30, 60),
+        'old_peak': np.linspace(0, 6, 30),
+        'target': np.where(np.arange(30) % 2, 'Heart Disease', 'No Heart Disease'),
+    })
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_write_read_round_trip(tmp_path, sample_table, fmt):
+    """
+    Test that a table written and read back is unchanged in both formats.
+    """
+    path = table_path(str(tmp_path), "train_heart", fmt)
+    assert path.endswith(f"train_heart.{fmt}")
+    write_table(sample_table, path)
+    pd.testing.assert_frame_equal(read_table(path), sample_table)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_read_table_column_projection(tmp_path, sample_table, fmt):
+    """
+    Test that only the requested columns are read.
+    """
+    path = table_path(str(tmp_path), "train_heart", fmt)
+    write_table(sample_table, path)
+    pd.testing.assert_frame_equal(read_table(path, columns=['age', 'target']), sample_table[['age', 'target']])
+
+
+def test_parquet_keeps_dtypes(tmp_path, sample_table):
+    """
+    Test that Parquet keeps dtypes that CSV loses, e.g. categories.
+    """
+    sample_table['target'] = sample_table['target'].astype('category')
+    path = table_path(str(tmp_path), "train_heart", "parquet")
+    write_table(sample_table, path)
+    assert isinstance(read_table(path)['target'].dtype, pd.CategoricalDtype)
+    assert isinstance(read_table(path, memory_map=False)['target'].dtype, pd.CategoricalDtype)
+
+
+def test_table_format_and_invalid_format(tmp_path):
+    """
+    Test that the format is taken from the extension and unknown formats are rejected.
+    """
+    assert table_format("data/train_heart.parquet") == "parquet"
+    assert table_format("data/train_heart.csv") == "csv"
+    with pytest.raises(ValueError, match="fmt must be one of"):
+        table_path(str(tmp_path), "train_heart", "xlsx")
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_table_writer_appends_chunks(tmp_path, sample_table, fmt):
+    """
+    Test that chunks appended with TableWriter read back as the whole table.
+    """
+    path = table_path(str(tmp_path), "chunks", fmt)
+    writer = TableWriter(path)
+    for start in range(0, 30, 7):
+        writer.write(sample_table.iloc[start:start + 7])
+    writer.close()
+    chunks = list(iter_chunks(path, chunksize=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 10]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), sample_table)
@@ -1,217 +1,373 @@
 # Tests for reading zip file
-# Test case functions and documentation generated using GPT 4.0, 
+# Test case functions and documentation generated using GPT 4.0,
 # prompted to create test cases for a passed list of possibilities
 
 import os
 import sys
+import hashlib
+import json
+import re
+import threading
 import zipfile
+import zlib
 import pytest
 from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO
 import warnings
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from utils.read_zip import read_zip
+import heart_disease_predictor.utils.read_zip as read_zip_module
+from heart_disease_predictor.utils.read_zip import read_zip
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serve the bytes of server.files by path, honouring single Range requests."""
+
+    def do_GET(self):
+        self.server.log.append((self.path, self.headers.get("Range")))
+        body = self.server.files.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        start, end = 0, len(body) - 1
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2) or end), end)
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        self.wfile.write(body[start:end + 1])
+
+    def log_message(self, *args):
+        pass
 
 
-def test_url_not_found():
+@pytest.fixture
+def server():
     """
-    Verify that a ValueError is raised when the URL returns a 404 status code.
+    Run a local HTTP server standing in for the dataset host.
+
+    Yields
+    ------
+    ThreadingHTTPServer
+        Server with a `files` dict (URL path -> bytes) to fill, a `log` of
+        (path, Range header) requests and a `url(path)` helper.
     """
-    mock_response = mock.Mock()
-    mock_response.status_code = 404
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    httpd.files, httpd.log = {}, []
+    httpd.url = lambda path: f"http://127.0.0.1:{httpd.server_port}{path}"
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_zip(members):
+    """Bytes of a ZIP archive with the given name -> content members."""
+    zip_bytes = BytesIO()
+    with zipfile.ZipFile(zip_bytes, 'w') as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    return zip_bytes.getvalue()
 
-    with mock.patch("requests.get", return_value=mock_response):
-        with pytest.raises(ValueError, match="does not exist"):
-            read_zip("http://fakeurl.com/file.zip", "/some/dir")
 
+def test_url_not_found(server):
+    """
+    Verify that a ValueError is raised when the URL returns a 404 status code.
+    """
+    with pytest.raises(ValueError, match="does not exist"):
+        read_zip(server.url("/file.zip"), "/some/dir")
 
-def test_file_not_zip():
+
+def test_file_not_zip(server):
     """
     Verify that a ValueError is raised when the provided URL
     does not point to a ZIP file.
     """
-    mock_response = mock.Mock()
-    mock_response.status_code = 200
-    mock_response.content = b"not a zip"
+    server.files["/file.txt"] = b"not a zip"
 
-    with mock.patch("requests.get", return_value=mock_response):
-        with pytest.raises(ValueError, match="does not point to a zip"):
-            read_zip("http://fakeurl.com/file.txt", "/some/dir")
+    with pytest.raises(ValueError, match="does not point to a zip"):
+        read_zip(server.url("/file.txt"), "/some/dir")
 
 
-def test_directory_not_exist():
+def test_directory_not_exist(server):
     """
     Verify that a ValueError is raised when the target
     extraction directory does not exist.
     """
-    mock_response = mock.Mock()
-    mock_response.status_code = 200
-    mock_response.content = b"fake zip content"
+    server.files["/file.zip"] = b"fake zip content"
 
-    with mock.patch("requests.get", return_value=mock_response):
-        with mock.patch("os.path.isdir", return_value=False):
-            with pytest.raises(ValueError, match="directory provided does not exist"):
-                read_zip("http://fakeurl.com/file.zip", "/nonexistent/dir")
+    with pytest.raises(ValueError, match="directory provided does not exist"):
+        read_zip(server.url("/file.zip"), "/nonexistent/dir")
 
 
-def test_normal_extraction(tmp_path):
+def test_normal_extraction(tmp_path, server):
     """
     Verify that a valid ZIP file is downloaded and extracted correctly.
     """
-    zip_bytes = BytesIO()
-    with zipfile.ZipFile(zip_bytes, 'w') as zf:
-        zf.writestr("test.txt", "hello")
-    zip_bytes.seek(0)
-
-    mock_response = mock.Mock()
-    mock_response.status_code = 200
-    mock_response.content = zip_bytes.read()
+    server.files["/file.zip"] = make_zip({"test.txt": "hello"})
 
-    with mock.patch("requests.get", return_value=mock_response):
-        read_zip("http://fakeurl.com/file.zip", tmp_path)
+    assert read_zip(server.url("/file.zip"), tmp_path) == ["test.txt"]
 
     extracted_files = os.listdir(tmp_path)
     assert "file.zip" in extracted_files
     assert "test.txt" in extracted_files
+    assert "file.zip.part" not in extracted_files
 
 
-def test_empty_zip_warns(tmp_path):
+def test_empty_zip_warns(tmp_path, server):
     """
     Verify that a warning is raised when the ZIP archive is empty.
     """
-    zip_bytes = BytesIO()
-    with zipfile.ZipFile(zip_bytes, 'w'):
-        pass
-    zip_bytes.seek(0)
-
-    mock_response = mock.Mock()
-    mock_response.status_code = 200
-    mock_response.content = zip_bytes.read()
+    server.files["/empty.zip"] = make_zip({})
 
-    with mock.patch("requests.get", return_value=mock_response):
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            read_zip("http://fakeurl.com/empty.zip", tmp_path)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        read_zip(server.url("/empty.zip"), tmp_path)
 
-            assert any("ZIP file is empty" in str(warn.message) for warn in w)
+        assert any("ZIP file is empty" in str(warn.message) for warn in w)
 
 
-def test_custom_filename(tmp_path):
+def test_custom_filename(tmp_path, server):
     """
     Verify that the `filename` argument overrides the ZIP filename
     derived from the URL.
     """
-    zip_bytes = BytesIO()
-    with zipfile.ZipFile(zip_bytes, 'w') as zf:
-        zf.writestr("data.txt", "123")
-    zip_bytes.seek(0)
-
-    mock_response = mock.Mock()
-    mock_response.status_code = 200
-    mock_response.content = zip_bytes.read()
+    server.files["/original.zip"] = make_zip({"data.txt": "123"})
 
-    with mock.patch("requests.get", return_value=mock_response):
-        read_zip(
-            "http://fakeurl.com/original.zip",
-            tmp_path,
-            filename="custom.zip"
-        )
+    read_zip(
+        server.url("/original.zip"),
+        tmp_path,
+        filename="custom.zip"
+    )
 
     extracted_files = os.listdir(tmp_path)
     assert "custom.zip" in extracted_files
     assert "data.txt" in extracted_files
 
 
-def test_multiple_files_in_zip(tmp_path):
+def test_multiple_files_in_zip(tmp_path, server):
     """
     Verify that all files contained in a ZIP archive
     are extracted correctly.
     """
-    zip_bytes = BytesIO()
-    with zipfile.ZipFile(zip_bytes, 'w') as zf:
-        zf.writestr("a.txt", "A")
-        zf.writestr("b.txt", "B")
-        zf.writestr("c.txt", "C")
-    zip_bytes.seek(0)
+    server.files["/multi.zip"] = make_zip({"a.txt": "A", "b.txt": "B", "c.txt": "C"})
 
-    mock_response = mock.Mock()
-    mock_response.status_code = 200
-    mock_response.content = zip_bytes.read()
-
-    with mock.patch("requests.get", return_value=mock_response):
-        read_zip("http://fakeurl.com/multi.zip", tmp_path)
+    read_zip(server.url("/multi.zip"), tmp_path)
 
     extracted_files = os.listdir(tmp_path)
     assert all(f in extracted_files for f in ["a.txt", "b.txt", "c.txt"])
 
 
-def test_overwrite_existing_zip(tmp_path):
+def test_overwrite_existing_zip(tmp_path, server):
     """
     Verify that an existing ZIP file in the destination directory
     is safely overwritten without raising errors.
     """
     existing_zip = tmp_path / "file.zip"
     existing_zip.write_bytes(b"old content")
+    server.files["/file.zip"] = make_zip({"new.txt": "new"})
 
-    zip_bytes = BytesIO()
-    with zipfile.ZipFile(zip_bytes, 'w') as zf:
-        zf.writestr("new.txt", "new")
-    zip_bytes.seek(0)
-
-    mock_response = mock.Mock()
-    mock_response.status_code = 200
-    mock_response.content = zip_bytes.read()
-
-    with mock.patch("requests.get", return_value=mock_response):
-        read_zip("http://fakeurl.com/file.zip", tmp_path)
+    read_zip(server.url("/file.zip"), tmp_path)
 
     extracted_files = os.listdir(tmp_path)
     assert "new.txt" in extracted_files
+    assert existing_zip.read_bytes() == server.files["/file.zip"]
 
 
-def test_directory_with_existing_files(tmp_path):
+def test_directory_with_existing_files(tmp_path, server):
     """
     Verify that existing files in the destination directory
     are preserved during ZIP extraction.
     """
     (tmp_path / "existing.txt").write_text("hello")
+    server.files["/zip.zip"] = make_zip({"inside.txt": "world"})
 
-    zip_bytes = BytesIO()
-    with zipfile.ZipFile(zip_bytes, 'w') as zf:
-        zf.writestr("inside.txt", "world")
-    zip_bytes.seek(0)
-
-    mock_response = mock.Mock()
-    mock_response.status_code = 200
-    mock_response.content = zip_bytes.read()
-
-    with mock.patch("requests.get", return_value=mock_response):
-        read_zip("http://fakeurl.com/zip.zip", tmp_path)
+    read_zip(server.url("/zip.zip"), tmp_path)
 
     extracted_files = os.listdir(tmp_path)
     assert "existing.txt" in extracted_files
     assert "inside.txt" in extracted_files
 
 
-def test_zip_with_folders(tmp_path):
+def test_zip_with_folders(tmp_path, server):
     """
     Verify that ZIP archives containing nested directories
     are extracted with their folder structure preserved.
     """
-    zip_bytes = BytesIO()
-    with zipfile.ZipFile(zip_bytes, 'w') as zf:
-        zf.writestr("folder/file1.txt", "data1")
-        zf.writestr("folder/file2.txt", "data2")
-    zip_bytes.seek(0)
-
-    mock_response = mock.Mock()
-    mock_response.status_code = 200
-    mock_response.content = zip_bytes.read()
+    server.files["/folder.zip"] = make_zip({"folder/file1.txt": "data1", "folder/file2.txt": "data2"})
 
-    with mock.patch("requests.get", return_value=mock_response):
-        read_zip("http://fakeurl.com/folder.zip", tmp_path)
+    read_zip(server.url("/folder.zip"), tmp_path)
 
     extracted_files = os.listdir(tmp_path / "folder")
     assert all(f in extracted_files for f in ["file1.txt", "file2.txt"])
+
+
+def test_cached_archive_skips_download(tmp_path, server):
+    """
+    Verify that an archive whose SHA-256 matches is not downloaded again, and
+    that re-reading it extracts nothing and warns.
+    """
+    archive = make_zip({"a.txt": "A"})
+    server.files["/file.zip"] = archive
+    digest = hashlib.sha256(archive).hexdigest()
+
+    read_zip(server.url("/file.zip"), tmp_path, sha256=digest)
+    assert len(server.log) == 1
+
+    with pytest.warns(UserWarning, match="nothing new was extracted"):
+        assert read_zip(server.url("/file.zip"), tmp_path, sha256=digest.upper()) == []
+    assert len(server.log) == 1
+
+
+def test_sha256_mismatch(tmp_path, server):
+    """
+    Verify that a downloaded archive with another SHA-256 is rejected and removed.
+    """
+    server.files["/file.zip"] = make_zip({"a.txt": "A"})
+
+    with pytest.raises(ValueError, match="SHA-256"):
+        read_zip(server.url("/file.zip"), tmp_path, sha256="0" * 64)
+    assert os.listdir(tmp_path) == []
+
+
+def test_resume_partial_download(tmp_path, server):
+    """
+    Verify that a partial download is completed with a Range request, and
+    that a partial file the server cannot extend is downloaded again.
+    """
+    archive = make_zip({"a.txt": "A" * 1000})
+    server.files["/file.zip"] = archive
+    (tmp_path / "file.zip.part").write_bytes(archive[:100])
+
+    read_zip(server.url("/file.zip"), tmp_path, sha256=hashlib.sha256(archive).hexdigest())
+    assert server.log == [("/file.zip", "bytes=100-")]
+    assert (tmp_path / "file.zip").read_bytes() == archive
+
+    (tmp_path / "file.zip.part").write_bytes(archive + b"junk")
+    with pytest.warns(UserWarning, match="nothing new"):
+        read_zip(server.url("/file.zip"), tmp_path)
+    assert server.log[1:] == [("/file.zip", f"bytes={len(archive) + 4}-"), ("/file.zip", None)]
+    assert (tmp_path / "file.zip").read_bytes() == archive
+
+
+def test_parallel_segments(tmp_path, server):
+    """
+    Verify that a large archive is fetched in ranged segments that add up to
+    the archive.
+    """
+    archive = make_zip({"data.bin": os.urandom(40_000)})
+    server.files["/big.zip"] = archive
+
+    read_zip(server.url("/big.zip"), tmp_path, segments=4, min_segment_size=10_000,
+             sha256=hashlib.sha256(archive).hexdigest())
+
+    ranges = sorted(header for _, header in server.log[1:])
+    assert len(ranges) == 4
+    assert all(header.startswith("bytes=") for header in ranges)
+    assert (tmp_path / "big.zip").read_bytes() == archive
+    assert (tmp_path / "data.bin").read_bytes() == zipfile.ZipFile(BytesIO(archive)).read("data.bin")
+
+
+def test_only_changed_members_extracted(tmp_path, server):
+    """
+    Verify that members already on disk with the same content are not
+    extracted again, while changed or deleted ones are.
+    """
+    server.files["/file.zip"] = make_zip({"a.txt": "A", "b.txt": "B", "c.txt": "C"})
+    read_zip(server.url("/file.zip"), tmp_path)
+
+    (tmp_path / "a.txt").write_text("changed")
+    os.remove(tmp_path / "c.txt")
+    assert read_zip(server.url("/file.zip"), tmp_path) == ["a.txt", "c.txt"]
+    assert (tmp_path / "a.txt").read_text() == "A"
+
+
+def test_member_globs_and_manifest(tmp_path, server):
+    """
+    Verify that only members matching the globs are extracted and that the
+    manifest records them.
+    """
+    server.files["/file.zip"] = make_zip({"data/a.csv": "A", "data/b.csv": "B", "data/notes.pdf": "%PDF"})
+
+    assert read_zip(server.url("/file.zip"), tmp_path, members=["*.csv"]) == ["data/a.csv", "data/b.csv"]
+    assert sorted(os.listdir(tmp_path / "data")) == ["a.csv", "b.csv"]
+
+    with open(tmp_path / "file.zip.manifest.json") as f:
+        manifest = json.load(f)
+    assert manifest["archive"] == "file.zip"
+    assert sorted(manifest["members"]) == ["data/a.csv", "data/b.csv"]
+    assert manifest["members"]["data/a.csv"]["crc"] == zlib.crc32(b"A")
+    assert manifest["members"]["data/a.csv"]["size"] == 1
+
+
+def test_manifest_skips_unchanged_members(tmp_path, server):
+    """
+    Verify that files recorded in the manifest are recognised without being
+    read again, while a file changed since is extracted again.
+    """
+    server.files["/file.zip"] = make_zip({"a.txt": "A", "b.txt": "B"})
+    read_zip(server.url("/file.zip"), tmp_path)
+
+    (tmp_path / "b.txt").write_text("X")
+    with mock.patch("heart_disease_predictor.utils.read_zip._file_digest", wraps=read_zip_module._file_digest) as digest:
+        assert read_zip(server.url("/file.zip"), tmp_path) == ["b.txt"]
+    # Only the modified file is read to compare its CRC-32
+    assert [call.args[0] for call in digest.call_args_list] == [os.path.join(tmp_path, "b.txt")]
+
+    with pytest.warns(UserWarning, match="nothing new was extracted"):
+        assert read_zip(server.url("/file.zip"), tmp_path) == []
+
+
+def test_unchanged_files_marked_current(tmp_path, server):
+    """
+    Verify that a reused archive and unchanged files get a new modification
+    time, recorded in the manifest so they are still recognised without
+    being read.
+    """
+    archive = make_zip({"a.txt": "A"})
+    server.files["/file.zip"] = archive
+    digest = hashlib.sha256(archive).hexdigest()
+    read_zip(server.url("/file.zip"), tmp_path, sha256=digest)
+    for name in ["file.zip", "a.txt"]:
+        os.utime(tmp_path / name, ns=(0, 0))
+
+    with pytest.warns(UserWarning, match="nothing new was extracted"):
+        read_zip(server.url("/file.zip"), tmp_path, sha256=digest)
+    assert (tmp_path / "file.zip").stat().st_mtime_ns > 0
+    assert (tmp_path / "a.txt").stat().st_mtime_ns > 0
+    with open(tmp_path / "file.zip.manifest.json") as f:
+        assert json.load(f)["members"]["a.txt"]["mtime_ns"] == (tmp_path / "a.txt").stat().st_mtime_ns
+
+    with mock.patch("heart_disease_predictor.utils.read_zip._file_digest", wraps=read_zip_module._file_digest) as digest_calls:
+        with pytest.warns(UserWarning, match="nothing new was extracted"):
+            read_zip(server.url("/file.zip"), tmp_path, sha256=digest)
+    # Only the archive is hashed; a.txt is recognised from the manifest
+    assert [call.args[1] for call in digest_calls.call_args_list] == ["sha256"]
+
+
+def test_large_members_extracted_in_parallel(tmp_path, server):
+    """
+    Verify that members above parallel_min_size are decompressed by the
+    thread pool and match the archive.
+    """
+    content = {name: os.urandom(20_000) for name in ["x.bin", "y.bin", "z.bin"]}
+    server.files["/file.zip"] = make_zip({**content, "small.txt": "s"})
+
+    extracted = read_zip(server.url("/file.zip"), tmp_path, parallel_min_size=10_000)
+    assert sorted(extracted) == ["small.txt", "x.bin", "y.bin", "z.bin"]
+    for name, data in content.items():
+        assert (tmp_path / name).read_bytes() == data
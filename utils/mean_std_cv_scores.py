@@ -1,30 +0,0 @@
-# Adapted from UBC MDS DSCI 571 utils/mean_std_cv_scores.py
-
-import pandas as pd
-from sklearn.model_selection import cross_validate
-
-def mean_std_cross_val_scores(model, X_train, y_train, scoring=None, **kwargs):
-    """
-    Returns mean and std of cross validation
-
-    Parameters
-    ----------
-    model :
-        scikit-learn model
-    X_train : numpy array or pandas DataFrame
-        X in the training data
-    y_train :
-        y in the training data
-
-    Returns
-    ----------
-        pandas Series with mean scores from cross_validation
-    """
-    scores = cross_validate(model, X_train, y_train, scoring=scoring, **kwargs)
-    mean_scores = pd.DataFrame(scores).mean()
-    std_scores = pd.DataFrame(scores).std()
-    out_col = []
-    for i in range(len(mean_scores)):
-        out_col.append((f"%0.3f (+/- %0.3f)" % (mean_scores.iloc[i], std_scores.iloc[i])))
-        
-    return pd.Series(data=out_col, index=mean_scores.index)
\ No newline at end of file